@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark fuzzy search query cost as the dictionary grows.
+
+Builds a SearchIndex over synthetic Ghanaian-style names at increasing sizes
+and times a fixed set of misspelled queries against each. Query time should
+grow far more slowly than the entry count; a linear edit-distance scan over
+the same names is shown for comparison at the smaller sizes.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_search.py
+    PYTHONPATH=src python benchmarks/bench_search.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import itertools
+import random
+import time
+
+from ninolex_gh.search import SearchIndex, _bounded_levenshtein
+
+# Syllables are built as onset + vowel + optional coda, using spelling
+# patterns common in Akan, Ewe and Ga names
+ONSETS = [
+    "", "b", "d", "f", "g", "h", "k", "l", "m", "n", "p", "r", "s", "t", "w",
+    "y", "dz", "ts", "kp", "gb", "ny", "kw", "tw", "hw", "ky", "gy", "nk", "mp",
+]
+VOWELS = ["a", "e", "i", "o", "u", "aa", "ee", "oo", "ua", "ie"]
+CODAS = ["", "", "", "n", "m", "r"]
+SYLLABLES = [o + v + c for o in ONSETS for v in VOWELS for c in CODAS]
+
+QUERIES = ["Nkruma", "Kumase", "Achimotta", "Dzigbodi", "Kotokko", "Sekondi Takorad"]
+
+# Linear scans get slow quickly; only run them up to this size
+LINEAR_SCAN_LIMIT = 20000
+
+
+def synthetic_entries(count, seed=42):
+    """
+    Generate ``count`` unique entries with one- to three-word names.
+
+    Words are drawn with Zipf-like frequencies from a vocabulary that grows
+    with the square root of the entry count (Heaps' law), the way given
+    names, surnames and place words recur across a real lexicon.
+    """
+    rng = random.Random(seed)
+
+    vocab_size = max(100, int(30 * count ** 0.5))
+    vocab = set()
+    while len(vocab) < vocab_size:
+        vocab.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 3))))
+    vocab = sorted(vocab)
+    rng.shuffle(vocab)
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(vocab_size)))
+
+    seen = set()
+    entries = []
+    while len(entries) < count:
+        words = rng.choices(vocab, cum_weights=cum_weights, k=rng.randint(1, 3))
+        grapheme = " ".join(w.capitalize() for w in words)
+        if grapheme.lower() in seen:
+            continue
+        seen.add(grapheme.lower())
+        entries.append({"grapheme": grapheme, "alias": ""})
+    return entries
+
+
+def time_queries(func, repeat):
+    """Return the mean time per query in microseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in QUERIES:
+            func(query)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(QUERIES)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'entries':>10} {'indexed names':>14} {'build (s)':>10} "
+          f"{'indexed (us/query)':>19} {'linear (us/query)':>18}")
+
+    for size in args.sizes:
+        entries = synthetic_entries(size)
+
+        start = time.perf_counter()
+        index = SearchIndex(entries)
+        build = time.perf_counter() - start
+
+        indexed = time_queries(index.search, args.repeat)
+
+        linear = "-"
+        if size <= LINEAR_SCAN_LIMIT:
+            names = index._names
+
+            def scan(query):
+                q = query.lower()
+                return [n for n in names if _bounded_levenshtein(q, n, 2) <= 2]
+
+            linear = f"{time_queries(scan, 1):.0f}"
+
+        print(f"{size:>10,} {len(index):>14,} {build:>10.2f} {indexed:>19.0f} {linear:>18}")
+
+
+if __name__ == "__main__":
+    main()
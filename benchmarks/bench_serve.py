@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Load generator for the Ninolex-GH HTTP service (python -m ninolex_gh.serve).
+
+Opens a number of keep-alive connections and sends requests on each as fast
+as responses come back, then reports throughput and latency percentiles.
+Lookup words are drawn from the bundled dictionary, with a configurable
+share of misses.
+
+Without --url a server is started in a subprocess on a free port and
+stopped afterwards.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_serve.py
+    PYTHONPATH=src python benchmarks/bench_serve.py --connections 64 --requests 50000
+    PYTHONPATH=src python benchmarks/bench_serve.py --endpoint ssml --url http://127.0.0.1:8080
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from urllib.parse import quote, urlsplit
+
+import ninolex_gh
+
+SAMPLE_TEXT = (
+    "Kwame Nkrumah addressed the crowd in Accra before Asante Kotoko "
+    "played Hearts of Oak in Kumasi."
+)
+
+
+def make_requests(endpoint, count, miss_ratio, seed=42):
+    """Build ``count`` raw HTTP requests for the chosen endpoint."""
+    rng = random.Random(seed)
+    words = ninolex_gh.list_graphemes()
+    requests = []
+
+    for i in range(count):
+        if endpoint == "lookup":
+            word = f"missing{i}" if rng.random() < miss_ratio else rng.choice(words)
+            requests.append(f"GET /lookup?word={quote(word)} HTTP/1.1\r\nHost: bench\r\n\r\n".encode())
+        elif endpoint == "batch":
+            batch = [f"missing{i}" if rng.random() < miss_ratio else rng.choice(words)
+                     for _ in range(32)]
+            body = json.dumps({"words": batch}).encode()
+            requests.append(
+                b"POST /lookup HTTP/1.1\r\nHost: bench\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+            )
+        else:
+            body = SAMPLE_TEXT.encode()
+            requests.append(
+                b"POST /ssml HTTP/1.1\r\nHost: bench\r\nContent-Type: text/plain\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+            )
+
+    return requests
+
+
+async def read_response(reader):
+    """Read one HTTP response; return its status code."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("server closed the connection")
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def connection_worker(host, port, queue, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            try:
+                request = queue.pop()
+            except IndexError:
+                break
+            start = time.perf_counter()
+            writer.write(request)
+            status = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, requests, connections):
+    queue = list(reversed(requests))
+    latencies = []
+    statuses = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        connection_worker(host, port, queue, latencies, statuses)
+        for _ in range(connections)
+    ))
+    return time.perf_counter() - start, latencies, statuses
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def start_server():
+    """Start a server subprocess on a free port; return (process, host, port)."""
+    env = dict(os.environ)
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "ninolex_gh.serve", "--port", "0"],
+        stdout=subprocess.PIPE,
+        env=env,
+        text=True,
+    )
+    # "Serving N entries on http://HOST:PORT"
+    url = urlsplit(process.stdout.readline().split()[-1])
+    return process, url.hostname, url.port
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="server to test (default: start one)")
+    parser.add_argument("--endpoint", choices=["lookup", "batch", "ssml"], default="lookup")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--miss-ratio", type=float, default=0.1)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    process = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        process, host, port = start_server()
+
+    try:
+        requests = make_requests(args.endpoint, args.requests, args.miss_ratio)
+        elapsed, latencies, statuses = asyncio.run(
+            run_load(host, port, requests, args.connections)
+        )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    latencies.sort()
+    result = {
+        "endpoint": args.endpoint,
+        "connections": args.connections,
+        "requests": len(latencies),
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            name: round(percentile(latencies, fraction) * 1000, 3)
+            for name, fraction in [("p50", 0.50), ("p90", 0.90), ("p99", 0.99), ("max", 1.0)]
+        },
+        "statuses": {str(status): n for status, n in sorted(statuses.items())},
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"{result['requests']} {args.endpoint} requests over {args.connections} connections "
+          f"in {result['seconds']:.2f}s: {result['requests_per_second']:,.0f} req/s")
+    print("latency ms: " + "  ".join(f"{k} {v:.3f}" for k, v in result["latency_ms"].items()))
+    print("statuses:   " + "  ".join(f"{k}: {v}" for k, v in result["statuses"].items()))
+
+
+if __name__ == "__main__":
+    main()
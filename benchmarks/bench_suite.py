@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for dictionary loading, lookups and the build pipeline.
+
+For each dictionary size (the bundled data, plus synthetic dictionaries of
+10k, 100k and 1M entries by default) the suite prepares a scratch copy of
+the package and the build scripts, then measures in fresh subprocesses:
+
+    import_ms            import ninolex_gh
+    cold_load_ms         first _load_data() (json and mmap backends)
+    cached_load_ms       first _load_data() in a later process, from the
+                         on-disk index cache (json backend)
+    warm_load_ns         _load_data() once cached
+    peak_load_mb         peak Python memory allocated while loading (tracemalloc)
+    max_rss_mb           peak resident set size of the measuring process
+    lookup_hit_ns        lookup() of an existing grapheme
+    lookup_miss_ns       lookup(word, default=None) of a missing word
+    list_graphemes_ms    list_graphemes()
+    build_trie_ms        first annotate(), which builds the token trie
+    annotate_us          annotate() of a sentence built from dictionary words
+    build_s              build/build_dictionary.py --force
+    export_s             build/export.py --force
+
+Results are printed as a table and can be saved as JSON. --compare checks
+a run against a saved baseline and exits with status 1 if any metric got
+slower (or bigger) by more than --threshold.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_suite.py --output baseline.json
+    PYTHONPATH=src python benchmarks/bench_suite.py --sizes bundled 10000 --compare baseline.json
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_DIR = ROOT / "src" / "ninolex_gh"
+
+# The package is imported lazily: --measure subprocesses must import the
+# scratch copy on their PYTHONPATH, not the one in this checkout.
+
+DEFAULT_SIZES = ["bundled", "10000", "100000", "1000000"]
+BACKENDS = ("json", "mmap")
+
+# Distinct words timed per lookup measurement
+LOOKUP_SAMPLE = 1000
+
+DOMAINS = ["core", "places", "people", "sports", "education"]
+CATEGORIES = {
+    "core": ["food", "exam", "slang"],
+    "places": ["city", "town", "constituency"],
+    "people": ["public_figure", "name"],
+    "sports": ["football_club"],
+    "education": ["shs", "university"],
+}
+REGIONS = ["Greater Accra", "Ashanti", "Volta", "Northern", "Central", "Western", ""]
+
+# Rough grapheme-to-IPA spellings, enough to give phonemes realistic shapes
+SPELLINGS = [("dz", "dʒ"), ("ny", "ɲ"), ("ky", "tʃ"), ("kp", "k͡p"), ("gb", "ɡ͡b"),
+             ("y", "j"), ("c", "k"), ("g", "ɡ")]
+
+
+# ---------------------------------------------------------------------------
+# Scratch environments
+# ---------------------------------------------------------------------------
+
+def synthetic_dictionary(count, seed=42):
+    """Generate ``count`` entries with the full unified schema."""
+    from bench_search import synthetic_entries
+
+    rng = random.Random(seed)
+    entries = []
+    for i, item in enumerate(synthetic_entries(count, seed=seed)):
+        grapheme = item["grapheme"]
+        phoneme = grapheme.lower()
+        for spelling, ipa in SPELLINGS:
+            phoneme = phoneme.replace(spelling, ipa)
+        domain = DOMAINS[i % len(DOMAINS)]
+        entries.append({
+            "grapheme": grapheme,
+            "phoneme": "ˈ" + phoneme,
+            "domain": domain,
+            "category": rng.choice(CATEGORIES[domain]),
+            "region": rng.choice(REGIONS),
+            "city": "",
+            "alias": grapheme.split()[0] if i % 10 == 0 and " " in grapheme else "",
+            "notes": "",
+            "source_file": f"data/{domain}/synthetic.csv",
+        })
+    return entries
+
+
+def prepare(size, workdir):
+    """
+    Create a scratch copy of the package, build scripts and data for one
+    size under ``workdir``. Returns the number of dictionary entries.
+    """
+    from ninolex_gh.binary import write_lexicon
+
+    ignore = shutil.ignore_patterns("__pycache__")
+    shutil.copytree(PACKAGE_DIR, workdir / "src" / "ninolex_gh", ignore=ignore)
+    shutil.copytree(ROOT / "build", workdir / "build", ignore=ignore)
+    data_dir = workdir / "src" / "ninolex_gh" / "data"
+
+    if size == "bundled":
+        shutil.copytree(ROOT / "data", workdir / "data")
+        with (data_dir / "ninolex_gh_dictionary.json").open(encoding="utf-8") as f:
+            return len(json.load(f))
+
+    entries = synthetic_dictionary(int(size))
+    with (data_dir / "ninolex_gh_dictionary.json").open("w", encoding="utf-8") as f:
+        json.dump(entries, f, ensure_ascii=False)
+    write_lexicon(entries, data_dir / "ninolex_gh_dictionary.bin")
+
+    # Source CSVs for the build-time measurement, one per domain
+    fields = ["grapheme", "phoneme", "category", "region", "city", "alias", "notes"]
+    for domain in DOMAINS:
+        path = workdir / "data" / domain / "synthetic.csv"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(e for e in entries if e["domain"] == domain)
+
+    return len(entries)
+
+
+# ---------------------------------------------------------------------------
+# Measurements (run in a subprocess against the scratch package)
+# ---------------------------------------------------------------------------
+
+def per_call_ns(func, args_list, min_time=0.2):
+    """Mean nanoseconds per call of func(*args) over repeated passes."""
+    passes = 0
+    start = time.perf_counter()
+    while True:
+        for args in args_list:
+            func(*args)
+        passes += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / (passes * len(args_list)) * 1e9
+
+
+def measure(backend):
+    """Measure load and lookup costs in this process; return a dict."""
+    import tracemalloc
+
+    start = time.perf_counter()
+    import ninolex_gh
+    from ninolex_gh import core
+    import_ms = (time.perf_counter() - start) * 1000
+
+    core.set_backend(backend)
+    start = time.perf_counter()
+    core._load_data()
+    cold_load_ms = (time.perf_counter() - start) * 1000
+
+    warm_load_ns = per_call_ns(core._load_data, [()])
+
+    start = time.perf_counter()
+    graphemes = ninolex_gh.list_graphemes()
+    list_graphemes_ms = (time.perf_counter() - start) * 1000
+
+    rng = random.Random(0)
+    hits = [(w,) for w in rng.sample(graphemes, min(LOOKUP_SAMPLE, len(graphemes)))]
+    misses = [(f"zz missing {i}", None) for i in range(LOOKUP_SAMPLE)]
+    lookup_hit_ns = per_call_ns(ninolex_gh.lookup, hits)
+    lookup_miss_ns = per_call_ns(ninolex_gh.lookup, misses)
+
+    sentence = "Yesterday " + ", then ".join(w for (w,) in hits[:8]) + " met in town."
+    start = time.perf_counter()
+    ninolex_gh.annotate(sentence)
+    build_trie_ms = (time.perf_counter() - start) * 1000
+    annotate_us = per_call_ns(ninolex_gh.annotate, [(sentence,)]) / 1000
+
+    # Peak memory of a load from the JSON itself, not the index cache
+    core.set_cache_dir(None)
+    core.set_backend(backend)
+    tracemalloc.start()
+    core._load_data()
+    peak_load_mb = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+
+    result = {
+        "import_ms": import_ms,
+        "cold_load_ms": cold_load_ms,
+        "warm_load_ns": warm_load_ns,
+        "peak_load_mb": peak_load_mb,
+        "lookup_hit_ns": lookup_hit_ns,
+        "lookup_miss_ns": lookup_miss_ns,
+        "list_graphemes_ms": list_graphemes_ms,
+        "build_trie_ms": build_trie_ms,
+        "annotate_us": annotate_us,
+    }
+    try:
+        import resource
+        # ru_maxrss is in KiB on Linux and bytes on macOS
+        scale = 1 if sys.platform == "darwin" else 1024
+        result["max_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2**20
+    except ImportError:  # Windows
+        pass
+    return result
+
+
+def measure_cached_load():
+    """Time a load served from the index cache written by an earlier run."""
+    from ninolex_gh import core
+
+    start = time.perf_counter()
+    core._load_data()
+    return {"cached_load_ms": (time.perf_counter() - start) * 1000}
+
+
+def run_measure(workdir, backend, cached_load=False):
+    env = dict(
+        os.environ,
+        PYTHONPATH=str(workdir / "src"),
+        NINOLEX_GH_CACHE_DIR=str(workdir / "cache"),
+    )
+    args = ["--measure", backend] + (["--cached-load"] if cached_load else [])
+    output = subprocess.run(
+        [sys.executable, __file__] + args,
+        env=env, cwd=workdir, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def run_timed(workdir, script):
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, str(workdir / "build" / script), "--force"],
+        cwd=workdir, check=True, capture_output=True,
+    )
+    return time.perf_counter() - start
+
+
+def bench_size(size):
+    with tempfile.TemporaryDirectory(prefix="ninolex-bench-") as tmp:
+        workdir = Path(tmp)
+        result = {"entries": prepare(size, workdir)}
+        for backend in BACKENDS:
+            result[backend] = run_measure(workdir, backend)
+        # The json run above wrote the index cache; time a load from it
+        result["json"].update(run_measure(workdir, "json", cached_load=True))
+        result["build_s"] = run_timed(workdir, "build_dictionary.py")
+        result["export_s"] = run_timed(workdir, "export.py")
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Reporting and comparison
+# ---------------------------------------------------------------------------
+
+def flatten(results):
+    """Map "size.backend.metric" (or "size.metric") to values."""
+    flat = {}
+    for size, result in results.items():
+        for key, value in result.items():
+            if isinstance(value, dict):
+                for metric, number in value.items():
+                    flat[f"{size}.{key}.{metric}"] = number
+            elif key != "entries":
+                flat[f"{size}.{key}"] = value
+    return flat
+
+
+def print_results(results):
+    print(f"{'size':>9} {'entries':>9} {'metric':<26} {'json':>12} {'mmap':>12}")
+    for size, result in results.items():
+        metrics = list(result[BACKENDS[0]])  # json: the superset of metrics
+        for i, metric in enumerate(metrics):
+            label = (size, f"{result['entries']:,}") if i == 0 else ("", "")
+            values = [result[b].get(metric) for b in BACKENDS]
+            print(f"{label[0]:>9} {label[1]:>9} {metric:<26} "
+                  + " ".join(f"{v:>12.2f}" if v is not None else f"{'-':>12}" for v in values))
+        for metric in ("build_s", "export_s"):
+            print(f"{'':>9} {'':>9} {metric:<26} {result[metric]:>12.2f}")
+
+
+def compare(current, baseline, threshold):
+    """Print metric ratios against a baseline; return the regressed metric names."""
+    now = flatten(current["results"])
+    before = flatten(baseline["results"])
+    regressions = []
+
+    print()
+    print(f"{'metric':<40} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for name in sorted(now.keys() & before.keys()):
+        old, new = before[name], now[name]
+        ratio = new / old if old else float("inf")
+        flag = ""
+        if ratio > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<40} {old:>12.2f} {new:>12.2f} {ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES,
+                        help="'bundled' and/or synthetic entry counts (default: %(default)s)")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE",
+                        help="compare against a saved results file")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="ratio above which a metric counts as regressed (default: 1.25)")
+    parser.add_argument("--measure", choices=BACKENDS, help=argparse.SUPPRESS)
+    parser.add_argument("--cached-load", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        result = measure_cached_load() if args.cached_load else measure(args.measure)
+        print(json.dumps(result))
+        return 0
+
+    sys.path.insert(0, str(ROOT / "src"))
+    import ninolex_gh
+
+    results = {}
+    for size in args.sizes:
+        print(f"Benchmarking {size}...", file=sys.stderr)
+        results[size] = bench_size(size)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "ninolex_gh": ninolex_gh.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+    print_results(results)
+
+    if args.output:
+        with args.output.open("w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"\nWrote {args.output}")
+
+    if args.compare:
+        with args.compare.open(encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} metric(s) regressed by more than {args.threshold:.2f}x")
+            return 1
+        print("\nNo regressions")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
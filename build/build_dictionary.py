@@ -4,18 +4,41 @@ Build the unified Ninolex-GH dictionary from domain-specific CSV sources.
 
 This script merges all CSV files under data/ into a single unified dictionary
 at dist/dictionary/ninolex_gh_dictionary.csv.
+
+Sources are the files listed in SOURCE_FILES, in that order, followed by any
+other data/<domain>/*.csv (sorted by path, domain taken from the directory
+name). Changed sources are normalized in parallel in a process pool and
+merged in source order, so the output is identical to a serial build.
+
+Builds are incremental (see build/manifest.py): only source CSVs whose
+content changed are re-normalized, and the unified CSV is not rewritten when
+no source changed. Pass --force to rebuild from scratch.
 """
 
+import argparse
 import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from manifest import (
+    cached_rows,
+    is_fresh,
+    load_manifest,
+    output_info,
+    record_output,
+    save_manifest,
+    sha256_file,
+    store_rows,
+)
+
 ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = ROOT / "data"
 DIST_DIR = ROOT / "dist"
 DICTIONARY_DIR = DIST_DIR / "dictionary"
 
-# Source files with their domain assignments
-# Add new domain CSVs here as they are created
+# Source files with their domain assignments, in merge order
+# New data/<domain>/*.csv files are picked up automatically after these
 SOURCE_FILES = [
     ("data/core/core_terms.csv", "core"),
     ("data/places/regions.csv", "places"),
@@ -90,32 +113,118 @@ def load_and_normalize(csv_path, domain):
     return entries
 
 
-def build_dictionary():
+def discover_sources():
+    """
+    Return (csv_path, domain) pairs for every existing source CSV.
+
+    SOURCE_FILES come first, in their listed order, so the unified
+    dictionary keeps its established order. Any other data/<domain>/*.csv
+    follows, sorted by path, with the directory name as its domain.
+    """
+    sources = [(csv_path, domain) for csv_path, domain in SOURCE_FILES
+               if (ROOT / csv_path).exists()]
+    listed = {csv_path for csv_path, _ in SOURCE_FILES}
+
+    for path in sorted(DATA_DIR.glob("*/*.csv")):
+        csv_path = path.relative_to(ROOT).as_posix()
+        if csv_path not in listed:
+            sources.append((csv_path, path.parent.name))
+
+    return sources
+
+
+def normalize_sources(sources, jobs=None):
+    """
+    Run load_and_normalize over (csv_path, domain) pairs, in a process
+    pool when there is more than one file and more than one job.
+    Returns a list of row lists in the same order as sources.
+    """
+    jobs = min(jobs or os.cpu_count() or 1, len(sources))
+    if jobs <= 1:
+        return [load_and_normalize(csv_path, domain) for csv_path, domain in sources]
+
+    paths, domains = zip(*sources)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # map() yields results in submission order, whatever order they finish in
+        return list(pool.map(load_and_normalize, paths, domains))
+
+
+def build_dictionary(force=False, jobs=None):
     """
     Merge all domain CSVs into a single unified dictionary file.
     Returns the number of entries written.
     """
     ensure_directories()
 
+    output_path = DICTIONARY_DIR / "ninolex_gh_dictionary.csv"
+    builder = Path(__file__).resolve()
+    sources = discover_sources()
+    inputs = [ROOT / csv_path for csv_path, _ in sources] + [builder]
+
+    manifest = load_manifest()
+    if not force and is_fresh(manifest, output_path, inputs):
+        count = output_info(manifest, output_path)["entries"]
+        print(f"{output_path} is up to date ({count} entries)")
+        return count
+
+    # Reuse cached rows for unchanged sources; collect the rest
+    builder_hash = sha256_file(builder)
+    hashes = {}
+    rows_by_path = {}
+    stale = []
+
+    for csv_path, domain in sources:
+        hashes[csv_path] = sha256_file(ROOT / csv_path)
+        rows = None if force else cached_rows(manifest, csv_path, hashes[csv_path], builder_hash)
+        if rows is None:
+            stale.append((csv_path, domain))
+        else:
+            rows_by_path[csv_path] = rows
+
+    for (csv_path, _), rows in zip(stale, normalize_sources(stale, jobs)):
+        store_rows(manifest, csv_path, hashes[csv_path], builder_hash, rows)
+        rows_by_path[csv_path] = rows
+
+    # Forget sources that no longer exist
+    for csv_path in list(manifest["sources"]):
+        if csv_path not in hashes:
+            del manifest["sources"][csv_path]
+
+    # Merge in source order
     all_entries = []
     files_processed = 0
 
-    for csv_path, domain in SOURCE_FILES:
-        entries = load_and_normalize(csv_path, domain)
+    for csv_path, _ in sources:
+        entries = rows_by_path[csv_path]
         if entries:
             all_entries.extend(entries)
             files_processed += 1
 
     # Write unified dictionary with explicit UTF-8 encoding
-    output_path = DICTIONARY_DIR / "ninolex_gh_dictionary.csv"
     with output_path.open("w", encoding="utf-8", newline="") as f:
         writer = csv.DictWriter(f, fieldnames=DICTIONARY_FIELDS)
         writer.writeheader()
         writer.writerows(all_entries)
 
-    print(f"Built {output_path} with {len(all_entries)} entries from {files_processed} source files")
+    record_output(manifest, output_path, inputs, entries=len(all_entries))
+    save_manifest(manifest)
+
+    print(
+        f"Built {output_path} with {len(all_entries)} entries from {files_processed} source files "
+        f"({len(stale)} re-normalized, {len(sources) - len(stale)} cached)"
+    )
     return len(all_entries)
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--force", action="store_true",
+                        help="ignore the build manifest and rebuild everything")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes for normalizing sources (default: CPU count)")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    build_dictionary()
+    args = parse_args()
+    build_dictionary(force=args.force, jobs=args.jobs)
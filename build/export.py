@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Export the unified Ninolex-GH dictionary in every published format.
+
+Reads dist/dictionary/ninolex_gh_dictionary.csv once, streaming one entry at
+a time, and fans each entry out to the registered writers. Every writer
+writes its output incrementally, so memory use does not grow with the size
+of the dictionary (apart from the PLS writer's set of seen graphemes).
+
+Registered formats:
+
+    json       dist/dictionary/ninolex_gh_dictionary.json      (indented)
+    min_json   dist/dictionary/ninolex_gh_dictionary.min.json  (minified)
+    lite_json  dist/dictionary/ninolex_gh_lite.json            (grapheme/phoneme only)
+    jsonl      dist/dictionary/ninolex_gh_dictionary.jsonl     (JSON Lines)
+    tsv        dist/dictionary/ninolex_gh_dictionary.tsv
+    pls        exports/ninolex_gh_core.pls                     (W3C PLS)
+
+Outputs whose inputs are unchanged are skipped (see build/manifest.py).
+
+Usage:
+    python build/export.py                    # all formats
+    python build/export.py --formats json,pls
+    python build/export.py --force
+"""
+
+import argparse
+import csv
+import json
+from contextlib import ExitStack
+from pathlib import Path
+
+from manifest import is_fresh, load_manifest, output_info, record_output, save_manifest
+
+ROOT = Path(__file__).resolve().parent.parent
+DICT_DIR = ROOT / "dist" / "dictionary"
+EXPORTS_DIR = ROOT / "exports"
+CSV_PATH = DICT_DIR / "ninolex_gh_dictionary.csv"
+
+# Entry fields, in output order
+FIELDS = [
+    "grapheme",
+    "phoneme",
+    "domain",
+    "category",
+    "region",
+    "city",
+    "alias",
+    "notes",
+    "source_file",
+]
+
+# Registered writer classes, by format name, in registration order
+WRITERS = {}
+
+
+def register_writer(cls):
+    """Class decorator registering a Writer subclass under cls.name."""
+    WRITERS[cls.name] = cls
+    return cls
+
+
+def ensure_dictionary():
+    """
+    Ensure the unified dictionary CSV exists.
+    If not, build it by importing build_dictionary.
+    """
+    if not CSV_PATH.exists():
+        print("Dictionary CSV not found. Building from source CSVs...")
+        from build_dictionary import build_dictionary
+        build_dictionary()
+
+
+def iter_entries():
+    """
+    Yield entries from the unified dictionary CSV one at a time.
+    Rows without a grapheme or phoneme are skipped.
+    """
+    # Use utf-8 encoding with newline="" for proper CSV handling
+    with CSV_PATH.open(encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            entry = {field: (row.get(field) or "").strip() for field in FIELDS}
+            if entry["grapheme"] and entry["phoneme"]:
+                yield entry
+
+
+def escape_xml(text):
+    """Escape special XML characters in text."""
+    return (
+        text
+        .replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace("'", "&apos;")
+        .replace('"', "&quot;")
+    )
+
+
+class Writer:
+    """
+    Base class for export writers.
+
+    Subclasses set ``name`` and ``path`` and implement write_entry();
+    begin() and end() write any header and footer. ``count`` is the number
+    of entries written.
+    """
+
+    name = None
+    path = None
+
+    def __init__(self, f):
+        self.f = f
+        self.count = 0
+
+    def begin(self):
+        pass
+
+    def write(self, entry):
+        if self.write_entry(entry) is not False:
+            self.count += 1
+
+    def write_entry(self, entry):
+        """Write one entry; return False if it was skipped."""
+        raise NotImplementedError
+
+    def end(self):
+        pass
+
+
+class JSONArrayWriter(Writer):
+    """Writes a JSON array one element at a time."""
+
+    separator = ","
+    first_separator = ""
+
+    def begin(self):
+        self.f.write("[")
+
+    def write_entry(self, entry):
+        self.f.write(self.separator if self.count else self.first_separator)
+        self.f.write(self.encode(entry))
+
+    def encode(self, entry):
+        return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+
+    def end(self):
+        self.f.write("]")
+
+
+@register_writer
+class JSONWriter(JSONArrayWriter):
+    """Indented JSON, identical to json.dump(entries, indent=2)."""
+
+    name = "json"
+    path = DICT_DIR / "ninolex_gh_dictionary.json"
+    separator = ",\n"
+    first_separator = "\n"
+
+    def encode(self, entry):
+        # ensure_ascii=False preserves IPA characters correctly
+        text = json.dumps(entry, ensure_ascii=False, indent=2)
+        return "  " + text.replace("\n", "\n  ")
+
+    def end(self):
+        self.f.write("\n]" if self.count else "]")
+
+
+@register_writer
+class MinifiedJSONWriter(JSONArrayWriter):
+    name = "min_json"
+    path = DICT_DIR / "ninolex_gh_dictionary.min.json"
+
+
+@register_writer
+class LiteJSONWriter(JSONArrayWriter):
+    """Grapheme/phoneme pairs only, for size-sensitive consumers."""
+
+    name = "lite_json"
+    path = DICT_DIR / "ninolex_gh_lite.json"
+
+    def encode(self, entry):
+        return super().encode({"grapheme": entry["grapheme"], "phoneme": entry["phoneme"]})
+
+
+@register_writer
+class JSONLinesWriter(Writer):
+    name = "jsonl"
+    path = DICT_DIR / "ninolex_gh_dictionary.jsonl"
+
+    def write_entry(self, entry):
+        self.f.write(json.dumps(entry, ensure_ascii=False))
+        self.f.write("\n")
+
+
+@register_writer
+class TSVWriter(Writer):
+    name = "tsv"
+    path = DICT_DIR / "ninolex_gh_dictionary.tsv"
+
+    def begin(self):
+        self.writer = csv.writer(self.f, delimiter="\t", lineterminator="\n")
+        self.writer.writerow(FIELDS)
+
+    def write_entry(self, entry):
+        self.writer.writerow([entry[field] for field in FIELDS])
+
+
+def pls_header(lang="en-GH"):
+    """Return the XML declaration and opening <lexicon> tag of a PLS file."""
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<lexicon version="1.0" alphabet="ipa" xml:lang="{lang}" '
+        'xmlns="http://www.w3.org/2005/01/pronunciation-lexicon">\n\n'
+    )
+
+
+PLS_FOOTER = "\n</lexicon>\n"
+
+
+def pls_lexeme(entry):
+    """Return the <lexeme> line for an entry."""
+    # Escape XML special characters in grapheme (phoneme should be clean IPA)
+    return (
+        f'  <lexeme><grapheme>{escape_xml(entry["grapheme"])}</grapheme>'
+        f'<phoneme>{entry["phoneme"]}</phoneme></lexeme>\n'
+    )
+
+
+@register_writer
+class PLSWriter(Writer):
+    """
+    W3C PLS lexicon for TTS engines like ElevenLabs.
+    Deduplicates by grapheme (case-insensitive); the first entry wins.
+    """
+
+    name = "pls"
+    path = EXPORTS_DIR / "ninolex_gh_core.pls"
+    lang = "en-GH"
+
+    def begin(self):
+        self.seen = set()
+        self.f.write(pls_header(self.lang))
+
+    def write_entry(self, entry):
+        key = entry["grapheme"].lower()
+        if key in self.seen:
+            return False
+        self.seen.add(key)
+        self.f.write(pls_lexeme(entry))
+
+    def end(self):
+        self.f.write(PLS_FOOTER)
+
+
+def export(formats=None, force=False):
+    """
+    Write the requested formats (default: all registered) in a single pass
+    over the unified dictionary. Formats whose output is up to date are
+    skipped unless force is True.
+    Returns a dict of format name to number of entries written.
+    """
+    names = list(formats or WRITERS)
+    unknown = [name for name in names if name not in WRITERS]
+    if unknown:
+        raise ValueError(f"Unknown export format(s): {', '.join(unknown)}")
+
+    ensure_dictionary()
+
+    inputs = [CSV_PATH, Path(__file__).resolve()]
+    manifest = load_manifest()
+    counts = {}
+    pending = []
+
+    for name in names:
+        cls = WRITERS[name]
+        if not force and is_fresh(manifest, cls.path, inputs):
+            counts[name] = output_info(manifest, cls.path)["entries"]
+            print(f"{cls.path} is up to date ({counts[name]} entries)")
+        else:
+            pending.append(cls)
+
+    if not pending:
+        return counts
+
+    with ExitStack() as stack:
+        writers = []
+        for cls in pending:
+            cls.path.parent.mkdir(parents=True, exist_ok=True)
+            f = stack.enter_context(cls.path.open("w", encoding="utf-8", newline=""))
+            writers.append(cls(f))
+
+        for writer in writers:
+            writer.begin()
+        for entry in iter_entries():
+            for writer in writers:
+                writer.write(entry)
+        for writer in writers:
+            writer.end()
+
+    for writer in writers:
+        record_output(manifest, writer.path, inputs, entries=writer.count)
+        counts[writer.name] = writer.count
+        print(f"Wrote {writer.path} with {writer.count} entries")
+    save_manifest(manifest)
+
+    return counts
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Export the unified dictionary.")
+    parser.add_argument(
+        "--formats",
+        help=f"comma-separated formats (default: all of {', '.join(WRITERS)})",
+    )
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate even if the dictionary is unchanged")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    export(args.formats.split(",") if args.formats else None, force=args.force)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Generate the memory-mappable binary lexicon for the Python package.
+
+Reads the packaged JSON snapshot (src/ninolex_gh/data/ninolex_gh_dictionary.json)
+and writes src/ninolex_gh/data/ninolex_gh_dictionary.bin next to it, so the
+binary lexicon always matches the data that ships in the wheel.
+
+Run this after syncing the package JSON (see RELEASE_CHECKLIST.md).
+"""
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_DATA_DIR = ROOT / "src" / "ninolex_gh" / "data"
+JSON_PATH = PACKAGE_DATA_DIR / "ninolex_gh_dictionary.json"
+BIN_PATH = PACKAGE_DATA_DIR / "ninolex_gh_dictionary.bin"
+
+# The file format lives in the package so the writer and reader stay in sync
+sys.path.insert(0, str(ROOT / "src"))
+from ninolex_gh.binary import write_lexicon  # noqa: E402
+
+
+def generate_binary():
+    """
+    Encode the packaged JSON snapshot as a binary lexicon.
+    Returns the number of records written.
+    """
+    with JSON_PATH.open(encoding="utf-8") as f:
+        entries = json.load(f)
+
+    count = write_lexicon(entries, BIN_PATH)
+    print(f"Wrote {BIN_PATH} with {count} entries ({BIN_PATH.stat().st_size:,} bytes)")
+    return count
+
+
+if __name__ == "__main__":
+    generate_binary()
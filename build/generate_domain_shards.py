@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Split the packaged dictionary into per-domain shards.
+
+Reads the packaged JSON snapshot (src/ninolex_gh/data/ninolex_gh_dictionary.json)
+and writes one file per domain to src/ninolex_gh/data/domains/<domain>.json,
+mirroring the data/<domain>/ source layout, plus an index.json listing the
+domains in dictionary order with their entry counts. The package loads only
+the shards a caller selects with ninolex_gh.load(domains=[...]).
+
+Run this after syncing the package JSON (see RELEASE_CHECKLIST.md).
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_DATA_DIR = ROOT / "src" / "ninolex_gh" / "data"
+JSON_PATH = PACKAGE_DATA_DIR / "ninolex_gh_dictionary.json"
+SHARDS_DIR = PACKAGE_DATA_DIR / "domains"
+INDEX_NAME = "index.json"
+
+
+def write_json(path, data):
+    """Write JSON in the same layout as the packaged snapshot."""
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def generate_domain_shards():
+    """
+    Write one JSON shard per domain and the shard index.
+    Returns the number of shards written.
+    """
+    data = JSON_PATH.read_bytes()
+    entries = json.loads(data)
+
+    # Domains in order of first appearance, entries in dictionary order
+    shards = {}
+    for entry in entries:
+        shards.setdefault(entry["domain"], []).append(entry)
+
+    SHARDS_DIR.mkdir(exist_ok=True)
+    index = {
+        "source_sha256": hashlib.sha256(data).hexdigest(),
+        "entries": len(entries),
+        "domains": [],
+    }
+
+    for domain, domain_entries in shards.items():
+        shard_path = SHARDS_DIR / f"{domain}.json"
+        write_json(shard_path, domain_entries)
+        index["domains"].append({
+            "domain": domain,
+            "file": shard_path.name,
+            "entries": len(domain_entries),
+        })
+        print(f"  {domain:<12} {len(domain_entries):>6} entries -> {shard_path.relative_to(ROOT)}")
+
+    # Remove shards of domains that no longer exist
+    current = {item["file"] for item in index["domains"]} | {INDEX_NAME}
+    for stale in SHARDS_DIR.glob("*.json"):
+        if stale.name not in current:
+            stale.unlink()
+            print(f"  removed {stale.relative_to(ROOT)}")
+
+    write_json(SHARDS_DIR / INDEX_NAME, index)
+    print(f"Wrote {len(shards)} domain shards to {SHARDS_DIR.relative_to(ROOT)}")
+    return len(shards)
+
+
+if __name__ == "__main__":
+    generate_domain_shards()
@@ -4,107 +4,206 @@ Generate W3C PLS (Pronunciation Lexicon Specification) export.
 
 Reads the unified dictionary and writes exports/ninolex_gh_core.pls
 for use with TTS engines like ElevenLabs.
-"""
-
-import csv
-from pathlib import Path
 
-ROOT = Path(__file__).resolve().parent.parent
-EXPORTS_DIR = ROOT / "exports"
-DICTIONARY_PATH = ROOT / "dist" / "dictionary" / "ninolex_gh_dictionary.csv"
+This is the "pls" writer of build/export.py; run export.py to produce
+every format in a single pass.
 
-EXPORTS_DIR.mkdir(exist_ok=True)
+Sharded export:
+    Hosted TTS engines cap lexicon size and entry counts. With --shard-by
+    and/or --max-bytes / --max-entries, the lexicon is instead split into
+    several PLS files under exports/pls/, streamed in one pass:
 
+        python build/generate_pls.py --shard-by domain
+        python build/generate_pls.py --shard-by category --max-entries 500
+        python build/generate_pls.py --max-bytes 100000
 
-def ensure_dictionary():
-    """
-    Ensure the unified dictionary exists.
-    If not, build it by importing build_dictionary.
-    """
-    if not DICTIONARY_PATH.exists():
-        print("Dictionary not found. Building from source CSVs...")
-        from build_dictionary import build_dictionary
-        build_dictionary()
+    exports/pls/index.json lists every shard with its group, entry count,
+    size and SHA-256, so only the shards that changed need re-uploading.
+    Shards are filled in dictionary order, so with --shard-by an edit only
+    changes the shards of the affected group.
+"""
 
+import argparse
+import hashlib
+import json
+import re
 
-def load_entries_from_dictionary():
-    """
-    Load entries from the unified dictionary CSV.
-    Returns a list of (grapheme, phoneme) tuples.
-    
-    Uses explicit UTF-8 encoding and proper newline handling.
-    """
-    entries = []
-    # Use utf-8 encoding with newline="" for proper CSV handling
-    with DICTIONARY_PATH.open(encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            grapheme = row.get("grapheme", "").strip()
-            phoneme = row.get("phoneme", "").strip()
-            if not grapheme or not phoneme:
-                continue
-            entries.append((grapheme, phoneme))
-    return entries
+from export import (
+    EXPORTS_DIR,
+    PLS_FOOTER,
+    WRITERS,
+    ensure_dictionary,
+    export,
+    iter_entries,
+    pls_header,
+    pls_lexeme,
+)
 
+PLS_PATH = WRITERS["pls"].path
+SHARDS_DIR = EXPORTS_DIR / "pls"
+SHARD_INDEX = "index.json"
 
-def escape_xml(text):
-    """Escape special XML characters in text."""
-    return (
-        text
-        .replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace("'", "&apos;")
-        .replace('"', "&quot;")
-    )
+# Fields a sharded export can be split by
+SHARD_FIELDS = ("domain", "category")
 
 
-def write_pls(entries, output_path, lang="en-GH"):
+def build_core(force=False):
+    """
+    Build the core PLS file from the unified dictionary.
+    Deduplicates by grapheme (case-insensitive).
+    Returns the number of entries written.
     """
-    Write entries to a W3C PLS file.
-    Uses explicit UTF-8 encoding for proper IPA character support.
+    return export(["pls"], force=force)["pls"]
+
+
+def slugify(text):
+    """Turn a group value into a file-name-safe slug."""
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_") or "uncategorized"
+
+
+class Shard:
+    """A PLS file being written, with its running size and hash."""
+
+    def __init__(self, path, group):
+        self.path = path
+        self.group = group
+        self.entries = 0
+        self.bytes = 0
+        self.sha256 = hashlib.sha256()
+        # Binary mode so the byte count matches the file on every platform
+        self.f = path.open("wb")
+        self.write(pls_header())
+
+    def write(self, text):
+        data = text.encode("utf-8")
+        self.f.write(data)
+        self.sha256.update(data)
+        self.bytes += len(data)
+
+    def fits(self, line_bytes, max_bytes, max_entries):
+        """Return True if one more lexeme of line_bytes stays within the limits."""
+        if not self.entries:
+            return True  # every shard takes at least one entry
+        if max_entries and self.entries >= max_entries:
+            return False
+        if max_bytes and self.bytes + line_bytes + len(PLS_FOOTER) > max_bytes:
+            return False
+        return True
+
+    def close(self):
+        self.write(PLS_FOOTER)
+        self.f.close()
+        return {
+            "file": self.path.name,
+            "group": self.group,
+            "entries": self.entries,
+            "bytes": self.bytes,
+            "sha256": self.sha256.hexdigest(),
+        }
+
+
+def write_pls_shards(output_dir=SHARDS_DIR, shard_by=None, max_bytes=None, max_entries=None):
     """
-    with output_path.open("w", encoding="utf-8") as f:
-        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-        f.write(
-            f'<lexicon version="1.0" alphabet="ipa" xml:lang="{lang}" '
-            'xmlns="http://www.w3.org/2005/01/pronunciation-lexicon">\n\n'
-        )
-        for grapheme, phoneme in entries:
-            # Escape XML special characters in grapheme (phoneme should be clean IPA)
-            safe_grapheme = escape_xml(grapheme)
-            f.write(
-                f'  <lexeme><grapheme>{safe_grapheme}</grapheme>'
-                f'<phoneme>{phoneme}</phoneme></lexeme>\n'
-            )
-        f.write('\n</lexicon>\n')
+    Stream the unified dictionary into several size-bounded PLS files.
 
+    Entries are grouped by shard_by ("domain", "category" or None for a
+    single group), and each group is split into numbered shards when
+    max_bytes or max_entries is set. Graphemes are deduplicated
+    case-insensitively across all shards, as in the core PLS.
 
-def build_core():
-    """
-    Build the core PLS file from the unified dictionary.
-    Deduplicates by grapheme (case-insensitive).
+    Writes output_dir/index.json and returns the list of shard records.
     """
-    # Ensure dictionary exists
-    ensure_dictionary()
+    if shard_by not in (None, *SHARD_FIELDS):
+        raise ValueError(f"shard_by must be one of {SHARD_FIELDS}, got {shard_by!r}")
 
-    # Load and deduplicate entries
-    entries = []
+    ensure_dictionary()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    numbered = bool(max_bytes or max_entries)
+    open_shards = {}
+    slugs = {}
+    counters = {}
+    records = []
     seen = set()
 
-    for grapheme, phoneme in load_entries_from_dictionary():
-        key = grapheme.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        entries.append((grapheme, phoneme))
-
-    # Write PLS
-    out = EXPORTS_DIR / "ninolex_gh_core.pls"
-    write_pls(entries, out)
-    print(f"Wrote {out} with {len(entries)} entries")
-    return len(entries)
+    def new_shard(group):
+        slug = slugs.get(group)
+        if slug is None:
+            slug = slugify(group)
+            if slug in slugs.values():
+                # Distinct values with the same slug ("Places" vs "places")
+                slug += "_" + hashlib.sha256(group.encode("utf-8")).hexdigest()[:8]
+            slugs[group] = slug
+        counters[slug] = counters.get(slug, 0) + 1
+        suffix = f"_{counters[slug]:03d}" if numbered else ""
+        return Shard(output_dir / f"ninolex_gh_{slug}{suffix}.pls", group)
+
+    try:
+        for entry in iter_entries():
+            key = entry["grapheme"].lower()
+            if key in seen:
+                continue
+            seen.add(key)
+
+            group = entry[shard_by] if shard_by else "core"
+            line = pls_lexeme(entry)
+            line_bytes = len(line.encode("utf-8"))
+
+            shard = open_shards.get(group)
+            if shard is None:
+                shard = open_shards[group] = new_shard(group)
+            elif not shard.fits(line_bytes, max_bytes, max_entries):
+                records.append(shard.close())
+                shard = open_shards[group] = new_shard(group)
+
+            shard.write(line)
+            shard.entries += 1
+    finally:
+        for shard in open_shards.values():
+            records.append(shard.close())
+
+    records.sort(key=lambda record: record["file"])
+
+    # Remove shards left over from a previous run with other settings
+    current = {record["file"] for record in records}
+    for stale in output_dir.glob("ninolex_gh_*.pls"):
+        if stale.name not in current:
+            stale.unlink()
+
+    index = {
+        "shard_by": shard_by,
+        "max_bytes": max_bytes,
+        "max_entries": max_entries,
+        "entries": sum(record["entries"] for record in records),
+        "shards": records,
+    }
+    with (output_dir / SHARD_INDEX).open("w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+    print(f"Wrote {len(records)} PLS shards with {index['entries']} entries to {output_dir}")
+    return records
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate the core PLS export.")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate even if the dictionary is unchanged")
+    parser.add_argument("--shard-by", choices=SHARD_FIELDS,
+                        help="write one PLS file per domain or category")
+    parser.add_argument("--max-bytes", type=int,
+                        help="maximum size of each PLS shard in bytes")
+    parser.add_argument("--max-entries", type=int,
+                        help="maximum number of lexemes per PLS shard")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    build_core()
+    args = parse_args()
+    if args.shard_by or args.max_bytes or args.max_entries:
+        write_pls_shards(
+            shard_by=args.shard_by,
+            max_bytes=args.max_bytes,
+            max_entries=args.max_entries,
+        )
+    else:
+        build_core(force=args.force)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Build manifest for incremental Ninolex-GH builds.
+
+The manifest (.build_cache/manifest.json) records a SHA-256 content hash for
+each source CSV and, for each generated output, the hashes of the inputs it
+was built from plus the hash of the output itself. The build scripts use it
+to:
+
+- reuse cached normalized rows for source CSVs whose content is unchanged
+- skip regenerating an output whose inputs are unchanged and whose file on
+  disk still matches the recorded hash
+
+Build scripts count as inputs of their own outputs, so editing a script
+invalidates what it produced. Delete .build_cache/ or pass --force to a
+build script to rebuild everything.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = ROOT / ".build_cache"
+ROWS_DIR = CACHE_DIR / "rows"
+MANIFEST_PATH = CACHE_DIR / "manifest.json"
+
+MANIFEST_VERSION = 1
+
+
+def relative(path):
+    """Return a path relative to the repository root, with forward slashes."""
+    return Path(path).resolve().relative_to(ROOT).as_posix()
+
+
+def sha256_file(path):
+    """Return the hex SHA-256 digest of a file, reading it in chunks."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def empty_manifest():
+    return {"version": MANIFEST_VERSION, "sources": {}, "outputs": {}}
+
+
+def load_manifest():
+    """Load the manifest, or return an empty one if missing or unreadable."""
+    try:
+        with MANIFEST_PATH.open(encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return empty_manifest()
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return empty_manifest()
+    return manifest
+
+
+def save_manifest(manifest):
+    """Write the manifest atomically (temp file + rename)."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    tmp_path = MANIFEST_PATH.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def input_hashes(paths):
+    """Map each input path (relative to ROOT) to its content hash."""
+    return {relative(p): sha256_file(p) for p in paths}
+
+
+def is_fresh(manifest, output_path, input_paths):
+    """
+    Return True if output_path was built from exactly these inputs and
+    has not been modified since.
+    """
+    record = manifest["outputs"].get(relative(output_path))
+    if record is None or not Path(output_path).exists():
+        return False
+    if record["inputs"] != input_hashes(input_paths):
+        return False
+    return record["sha256"] == sha256_file(output_path)
+
+
+def record_output(manifest, output_path, input_paths, **info):
+    """Record an output's input hashes, its own hash and any extra info."""
+    manifest["outputs"][relative(output_path)] = {
+        "inputs": input_hashes(input_paths),
+        "sha256": sha256_file(output_path),
+        **info,
+    }
+
+
+def output_info(manifest, output_path):
+    """Return the recorded info dict for an output (empty if unknown)."""
+    return manifest["outputs"].get(relative(output_path), {})
+
+
+def cached_rows(manifest, csv_path, sha256, builder):
+    """
+    Return cached normalized rows for a source CSV, or None if the source
+    or the code that normalized it (``builder`` hash) has changed.
+    """
+    record = manifest["sources"].get(csv_path)
+    if record is None or record["sha256"] != sha256 or record["builder"] != builder:
+        return None
+
+    rows_path = CACHE_DIR / record["rows"]
+    try:
+        with rows_path.open(encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def store_rows(manifest, csv_path, sha256, builder, rows):
+    """Cache normalized rows for a source CSV and record its hash."""
+    ROWS_DIR.mkdir(parents=True, exist_ok=True)
+    rows_name = csv_path.replace("/", "__") + ".json"
+    with (ROWS_DIR / rows_name).open("w", encoding="utf-8") as f:
+        json.dump(rows, f, ensure_ascii=False)
+
+    manifest["sources"][csv_path] = {
+        "sha256": sha256,
+        "builder": builder,
+        "rows": f"rows/{rows_name}",
+        "entries": len(rows),
+    }
@@ -34,12 +34,66 @@ Quick Start
 
 API Reference
 -------------
-**lookup(word, default=<missing>)**
+**lookup(word, default=<missing>, include_aliases=False, match="exact", fallback=None)**
     Look up a word's pronunciation.
     
-    - Returns the entry dict if found
+    - Returns the ``Entry`` if found
     - Returns ``default`` if provided and not found (even if default is None)
     - Raises ``WordNotFound`` if not found and no default provided
+    - With ``include_aliases=True``, also matches aliases such as "Kotoko"
+    - ``match="whitespace"``, ``"punctuation"`` or ``"diacritics"`` falls
+      back to progressively looser matching ("JB Danquah" finds
+      "J. B. Danquah"), each level with its own precomputed index
+    - With ``fallback="g2p"``, a word that is not found gets an entry whose
+      pronunciation is guessed from its spelling (see ``guess()``)
+
+**resolve(word, default=<missing>, match="exact")**
+    Look up a word by grapheme or alias.
+
+    - Returns ``Resolution(entry, matched_by)`` where ``matched_by`` is
+      ``"grapheme"`` or ``"alias"``
+    - ``lookup(word, include_aliases=True)`` returns just the entry
+
+**search(query, limit=10, max_distance=2)**
+    Fuzzy (typo-tolerant) search across graphemes, aliases and the words
+    of multi-word names. Returns ``SearchHit(entry, distance, matched,
+    matched_by)`` tuples, best first.
+
+**complete(prefix, limit=20, domain=None)**
+    Prefix completion (type-ahead) over graphemes, optionally restricted
+    to one domain. O(log n + k) per call.
+
+**lookup_many(words, default=None, return_stats=False, match="exact")**
+    Look up many words at once, returning results in input order.
+
+    - Each distinct word is normalized and resolved only once
+    - Misses are filled with ``default`` instead of raising
+    - With ``return_stats=True`` returns ``(results, stats)`` with
+      total/unique/hits/misses counts
+
+**guess(word)**
+    Guess an IPA pronunciation from the spelling of a Ghanaian name not in
+    the dictionary, with table-driven Akan, Ewe and Ga spelling rules
+    (dz → dʒ, ny → ɲ, kp → k͡p, gb → ɡ͡b, ...). Results are memoized in a
+    bounded LRU cache.
+
+**query(domain=None, category=None, region=None, city=None)**
+    Lazily iterate over entries matching all given filters, using
+    inverted indexes built once (e.g. all constituencies in Greater Accra).
+
+**lookup_by_phoneme(ipa, loose=False)**
+    Reverse lookup: entries pronounced as ``ipa`` (a homophone group).
+    ``loose=True`` ignores stress marks, length marks and syllable dots.
+
+**annotate(text)**
+    Find dictionary graphemes and aliases mentioned in free text.
+
+    - Returns a list of ``Match(start, end, text, entry)`` tuples
+    - Multi-word entries are matched; the longest match wins
+
+**to_ssml(text, alphabet="ipa", speak=True)**
+    Rewrite text as SSML with ``<phoneme>`` tags for recognised entities.
+    ``iter_ssml()`` yields the same output in chunks for large documents.
 
 **get_entry_count()**
     Return the total number of entries in the dictionary.
@@ -47,9 +101,48 @@ API Reference
 **list_graphemes()**
     Return a list of all graphemes (spellings) in the dictionary.
 
+**set_backend(backend)**
+    Select how the dictionary is loaded: ``"json"`` (default) or ``"mmap"``.
+    The ``NINOLEX_GH_BACKEND`` environment variable sets the initial value.
+    ``"mmap"`` memory-maps a compact binary lexicon for near-instant startup.
+
+**load(domains=None)**
+    Load the dictionary now, optionally only the given domains (e.g.
+    ``load(domains=["places", "core"])``). Each domain ships as its own
+    shard, so unselected domains are never parsed. ``list_domains()``
+    returns the available domain names.
+
+**set_cache_dir(path)**
+    Enable the on-disk cache of the JSON backend's built indexes in
+    ``path``, or disable it with ``None`` (the default unless
+    ``NINOLEX_GH_CACHE_DIR`` is set; ``1`` selects
+    ``$XDG_CACHE_HOME/ninolex_gh``). Cache files are keyed by the SHA-256
+    of the bundled data and the package version.
+
+**preload(indexes=False, freeze=False)**
+    Load the dictionary now, exactly once even under concurrent calls.
+    ``indexes=True`` also builds every lazily built index; ``freeze=True``
+    calls ``gc.freeze()`` so pre-fork workers share the lexicon
+    copy-on-write.
+
+**Lexicon(overlays=(), reload_interval=1.0)**
+    The bundled dictionary with private overlay files (CSV in the source
+    schema, or JSON) stacked on top, highest precedence first. Provides
+    ``lookup()``, ``resolve()`` and ``lookup_many()``; overlays are
+    re-read when their files change, and all instances share one copy of
+    the bundled data.
+
+**enable_metrics(enabled=True, miss_capacity=1000)**, **stats()**, **reset_stats()**
+    Opt-in instrumentation: hit/miss/normalization counters, lookup and
+    load latency histograms and the most frequently missed keys.
+    ``NINOLEX_GH_METRICS=1`` enables it at import.
+
 Entry Structure
 ---------------
-Each entry is a dict with the following keys:
+Each entry is an immutable ``Entry`` record. It reads like a dict
+(``entry["phoneme"]``, ``entry.get("alias")``, ``dict(entry)``), exposes
+the same fields as attributes (``entry.phoneme``), and ``entry.to_dict()``
+returns a mutable copy. Fields:
 
 - **grapheme**: Original spelling (str)
 - **phoneme**: IPA transcription (str)
@@ -86,15 +179,65 @@ License
 MIT License - see LICENSE file for details.
 """
 
-from .core import get_entry_count, list_graphemes, lookup
+from .core import (
+    Lexicon,
+    Match,
+    Resolution,
+    annotate,
+    complete,
+    enable_metrics,
+    get_entry_count,
+    list_domains,
+    list_graphemes,
+    load,
+    lookup,
+    lookup_by_phoneme,
+    lookup_many,
+    preload,
+    query,
+    reset_stats,
+    resolve,
+    set_backend,
+    set_cache_dir,
+    stats,
+)
+from .entry import Entry
 from .exceptions import NinolexError, WordNotFound
+from .g2p import guess
+from .search import SearchHit, search
+from .ssml import iter_ssml, to_ssml
 
 __all__ = [
     # Primary API
     "lookup",
+    "lookup_many",
+    "resolve",
+    "Resolution",
+    "lookup_by_phoneme",
+    "query",
+    "search",
+    "SearchHit",
+    "complete",
+    "annotate",
+    "Match",
+    "to_ssml",
+    "iter_ssml",
+    "guess",
     # Utility functions
     "get_entry_count",
     "list_graphemes",
+    "set_backend",
+    "set_cache_dir",
+    "load",
+    "list_domains",
+    "preload",
+    "Lexicon",
+    # Metrics
+    "enable_metrics",
+    "stats",
+    "reset_stats",
+    # Types
+    "Entry",
     # Exceptions
     "NinolexError",
     "WordNotFound",
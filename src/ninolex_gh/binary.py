@@ -0,0 +1,267 @@
+"""
+Ninolex-GH Binary Lexicon
+=========================
+
+A compact, memory-mappable encoding of the dictionary.
+
+The JSON snapshot has to be parsed in full and turned into a dict of dicts
+before the first lookup. The binary lexicon is laid out so that it can be
+memory-mapped and queried in place: opening it only reads a fixed-size
+header, lookups are a binary search over a compact sorted key table, and
+entries are decoded on demand. Pages are shared between processes mapping
+the same file (e.g. forked workers).
+
+The trade-off is per-access cost: an uncached lookup is a Python-level
+binary search plus a decode (about 15 us at 10k entries, against well
+under 1 us for the JSON backend's dict), and anything that walks every
+entry (list_graphemes(), building the annotation trie or the query
+indexes) decodes every record, 5-30x slower than the JSON backend. The
+last LOOKUP_CACHE_SIZE distinct keys looked up, hits and misses alike,
+are cached, so hot words cost about as much as a dict probe.
+
+File layout (all integers little-endian)::
+
+    header    HEADER struct (magic, version, counts, section offsets)
+    records   record_count x RECORD, in original dictionary order
+    keys      key_count x KEY_ITEM, sorted by normalized key
+    strings   UTF-8 string table
+
+Each RECORD is an (offset, length) reference to the record's field values,
+stored together in the string table separated by FIELD_SEPARATOR, so an
+entry is decoded with one slice and one decode. Each KEY_ITEM references
+a normalized key in the string table (each distinct key stored once) and
+holds its record number, so a binary search step reads 10 bytes and
+compares one key without touching the records.
+
+Build the file with ``python build/generate_binary.py``.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+
+from .core import _normalize_key
+from .entry import FIELDS, Entry
+from .exceptions import NinolexError
+
+# File signature and format version
+MAGIC = b"NLGH"
+VERSION = 2
+
+# magic, version, field count, record count, key count,
+# records offset, key table offset, strings offset
+HEADER = struct.Struct("<4sHHIIIII")
+
+# (uint32 offset, uint16 length) of the record's joined field values
+RECORD = struct.Struct("<IH")
+
+# (uint32 offset, uint16 length) of a normalized key, uint32 record number
+KEY_ITEM = struct.Struct("<IHI")
+
+# Separates the field values of a record in the string table
+FIELD_SEPARATOR = "\x1f"
+
+# Longest string a record or key can reference
+_MAX_STRING_BYTES = 0xFFFF
+
+# Distinct keys whose lookup results each BinaryLexicon keeps
+LOOKUP_CACHE_SIZE = 4096
+
+
+def write_lexicon(entries: Iterable[Mapping], output_path: Union[str, Path]) -> int:
+    """
+    Encode dictionary entries into a binary lexicon file.
+
+    Entries keep their original order in the record table. When several
+    entries share a normalized key, the last one is indexed, matching the
+    JSON loader in core.
+
+    Args:
+        entries: Entries (or dicts) with the keys in FIELDS.
+        output_path: Destination file.
+
+    Returns:
+        int: Number of records written.
+
+    Raises:
+        ValueError: If an entry is longer than the format allows or a field
+            contains FIELD_SEPARATOR.
+    """
+    table = bytearray()
+
+    def store(data: bytes, what: str) -> tuple:
+        if len(data) > _MAX_STRING_BYTES:
+            raise ValueError(f"{what} too long for binary lexicon: {data[:40]!r}...")
+        offset = len(table)
+        table.extend(data)
+        return offset, len(data)
+
+    records = bytearray()
+    keys: Dict[bytes, int] = {}
+    count = 0
+
+    for entry in entries:
+        values = [entry.get(field, "") for field in FIELDS]
+        if any(FIELD_SEPARATOR in value for value in values):
+            raise ValueError(
+                f"Field separator in binary lexicon entry: {entry['grapheme']!r}"
+            )
+        records.extend(RECORD.pack(
+            *store(FIELD_SEPARATOR.join(values).encode("utf-8"), "Entry")
+        ))
+        keys[_normalize_key(entry["grapheme"]).encode("utf-8")] = count
+        count += 1
+
+    key_table = bytearray()
+    for key in sorted(keys):
+        key_table.extend(KEY_ITEM.pack(*store(key, "Key"), keys[key]))
+
+    records_offset = HEADER.size
+    keys_offset = records_offset + len(records)
+    strings_offset = keys_offset + len(key_table)
+
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        len(FIELDS),
+        count,
+        len(keys),
+        records_offset,
+        keys_offset,
+        strings_offset,
+    )
+
+    with Path(output_path).open("wb") as f:
+        f.write(header)
+        f.write(records)
+        f.write(key_table)
+        f.write(table)
+
+    return count
+
+
+class BinaryRecords(Sequence):
+    """Read-only sequence view of the records, in original order."""
+
+    def __init__(self, lexicon: "BinaryLexicon") -> None:
+        self._lexicon = lexicon
+
+    def __len__(self) -> int:
+        return self._lexicon.record_count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("record index out of range")
+        return self._lexicon._decode(i)
+
+
+class BinaryLexicon(Mapping):
+    """
+    Memory-mapped binary lexicon.
+
+    Behaves as a read-only mapping of normalized grapheme to Entry, so
+    it can stand in for the JSON-backed cache in core. Entries are decoded
+    from the mapped file on access; nothing is materialized up front. The
+    results of the last LOOKUP_CACHE_SIZE distinct keys looked up are
+    cached (see the module docstring for the costs this avoids).
+
+    Args:
+        path: Path to a file produced by write_lexicon().
+
+    Raises:
+        NinolexError: If the file is not a supported binary lexicon.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < HEADER.size:
+            raise NinolexError(f"Not a Ninolex-GH binary lexicon: {path}")
+
+        (
+            magic,
+            version,
+            field_count,
+            self.record_count,
+            self.key_count,
+            self._records_offset,
+            self._keys_offset,
+            self._strings_offset,
+        ) = HEADER.unpack_from(self._mm, 0)
+
+        if magic != MAGIC or version != VERSION or field_count != len(FIELDS):
+            raise NinolexError(
+                f"Unsupported Ninolex-GH binary lexicon (version {version}): {path}"
+            )
+
+        self.records = BinaryRecords(self)
+        self._lookup = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._lookup_uncached)
+
+    def _decode(self, i: int) -> Entry:
+        offset, length = RECORD.unpack_from(self._mm, self._records_offset + i * RECORD.size)
+        start = self._strings_offset + offset
+        return Entry(*str(self._mm[start:start + length], "utf-8").split(FIELD_SEPARATOR))
+
+    def _key_at(self, position: int) -> bytes:
+        offset, length, _ = KEY_ITEM.unpack_from(
+            self._mm, self._keys_offset + position * KEY_ITEM.size
+        )
+        start = self._strings_offset + offset
+        return self._mm[start:start + length]
+
+    def _find(self, key: str) -> int:
+        """Return the record number for a normalized key, or -1."""
+        target = key.encode("utf-8")
+        mm = self._mm
+        unpack = KEY_ITEM.unpack_from
+        base = self._keys_offset
+        strings = self._strings_offset
+        item_size = KEY_ITEM.size
+        lo, hi = 0, self.key_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset, length, i = unpack(mm, base + mid * item_size)
+            start = strings + offset
+            probe = mm[start:start + length]
+            if probe < target:
+                lo = mid + 1
+            elif probe > target:
+                hi = mid
+            else:
+                return i
+        return -1
+
+    def _lookup_uncached(self, key: str) -> Optional[Entry]:
+        """Decode the entry for a normalized key, or None (cached as _lookup)."""
+        i = self._find(key)
+        return self._decode(i) if i >= 0 else None
+
+    def __getitem__(self, key: str) -> Entry:
+        entry = self._lookup(key) if isinstance(key, str) else None
+        if entry is None:
+            raise KeyError(key)
+        return entry
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._lookup(key) if isinstance(key, str) else None
+        return default if entry is None else entry
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._lookup(key) is not None
+
+    def __len__(self) -> int:
+        return self.key_count
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self.key_count):
+            yield self._key_at(position).decode("utf-8")
@@ -0,0 +1,123 @@
+"""
+Ninolex-GH Index Cache
+======================
+
+On-disk cache of the lookup structures built by core._load_data().
+
+Parsing the bundled JSON and building the normalized-key, alias and other
+indexes is repeated by every new process. The cache pickles the built
+structures once, so later processes (short-lived CLI and batch jobs in
+particular) load them in a single pass without re-normalizing anything.
+
+The cache is opt-in, since it writes to disk on first load: set
+``NINOLEX_GH_CACHE_DIR`` to a directory, or to ``1`` for
+``$XDG_CACHE_HOME/ninolex_gh`` (``~/.cache/ninolex_gh`` when
+XDG_CACHE_HOME is unset), or call ``ninolex_gh.set_cache_dir()``. Files
+are named after the package version, the loaded domains and the SHA-256
+of the bundled data, and record the version, hash and CACHE_FORMAT again
+inside, so a data or package upgrade simply misses the old file and
+writes a new one; superseded files for the same version are removed. Unreadable or mismatched files are ignored, and a cache
+directory that cannot be written only means the cache is not used.
+
+The files are pickles: like ``__pycache__``, the cache directory must only
+be writable by the user running the package.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Bumped whenever the layout of the cached payload changes
+# (2: domains and the folded matching-level indexes)
+CACHE_FORMAT = 2
+
+
+def user_cache_dir() -> Path:
+    """Return ``$XDG_CACHE_HOME/ninolex_gh`` (``~/.cache/ninolex_gh`` by default)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    return Path(base).expanduser() / "ninolex_gh"
+
+
+def default_cache_dir() -> Optional[Path]:
+    """
+    Return the directory configured by ``NINOLEX_GH_CACHE_DIR``, or None.
+
+    Unset, empty or ``0`` disables the cache; ``1`` selects user_cache_dir().
+    """
+    configured = os.environ.get("NINOLEX_GH_CACHE_DIR", "")
+    if configured in ("", "0"):
+        return None
+    if configured == "1":
+        return user_cache_dir()
+    return Path(configured).expanduser()
+
+
+def data_digest(data: bytes) -> str:
+    """SHA-256 hex digest identifying a bundled data file."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def cache_path(directory: Path, version: str, digest: str, label: str = "all") -> Path:
+    """
+    Path of the cache file for one data set.
+
+    ``label`` names the data set ("all", or the selected domains joined by
+    "+"), so services loading different domain subsets keep separate files.
+    """
+    return directory / f"index-{version}-{label}-{digest}.pickle"
+
+
+def read_cache(path: Path, version: str, digest: str) -> Optional[Dict[str, Any]]:
+    """Return the cached payload, or None if it is missing, stale or corrupt."""
+    try:
+        with path.open("rb") as f:
+            payload = pickle.load(f)
+    except Exception:
+        return None
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("format") != CACHE_FORMAT
+        or payload.get("version") != version
+        or payload.get("sha256") != digest
+    ):
+        return None
+    return payload
+
+
+def write_cache(path: Path, version: str, digest: str, payload: Dict[str, Any]) -> bool:
+    """
+    Atomically write ``payload`` to ``path``; return False if it cannot.
+
+    The file is written under a temporary name and renamed into place, so
+    concurrent readers see either no file or a complete one. Older files
+    for the same package version and data set are removed.
+    """
+    payload = dict(payload, format=CACHE_FORMAT, version=version, sha256=digest)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".index-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        return False
+
+    # The digest is the last "-" separated part of the name
+    prefix = path.name.rsplit("-", 1)[0]
+    for stale in path.parent.glob(f"{prefix}-*.pickle"):
+        if stale != path:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+    return True
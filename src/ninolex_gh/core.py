@@ -11,20 +11,72 @@ Architecture:
     - Data is loaded lazily on first access via _load_data()
     - A module-level cache (_CACHE) avoids repeated file I/O
     - All lookups are case-insensitive and Unicode-normalized (NFC)
+    - An alternative "mmap" backend (set_backend() or NINOLEX_GH_BACKEND)
+      memory-maps the binary lexicon and answers lookups by binary search
+      instead of parsing the JSON (see binary.py)
+    - Prefix completion uses sorted key arrays (_PREFIXES) searched with
+      bisect, one for all entries and one per domain
+    - Filtering by domain/category/region/city uses inverted indexes
+      (_FACETS) from normalized field value to entry positions
+    - Reverse phoneme lookups use exact and loose phoneme indexes
+      (_PHONEMES), each built on first use
+    - Free-text annotation uses a token trie (_TRIE) built once from the
+      graphemes and aliases, so a document is scanned in a single pass
+    - Lexicon stacks private overlay files (small per-overlay indexes) on
+      top of the shared bundled cache, reloading them when they change
+    - The JSON backend's built structures are pickled to an on-disk index
+      cache keyed by the data file's SHA-256 and the package version (see
+      cache.py), so later processes skip parsing and normalization
+    - Opt-in metrics (_METRICS, see metrics.py) count hits and misses and
+      time lookups and loads; when disabled each lookup pays one ``is None``
+      test
 
 Thread Safety:
     The module is safe for concurrent reads after initial load.
     The _CACHE is populated on first access and remains immutable thereafter.
+    Loading and every lazily built index are guarded by _LOAD_LOCK with
+    double-checked locking, so concurrent first calls load the data and
+    build each index exactly once. preload() does all of this up front,
+    e.g. in a pre-fork server's master process.
+    Entries are immutable Entry records (see entry.py), so a caller cannot
+    corrupt the shared cache by modifying a returned entry.
 """
 
 from __future__ import annotations
 
+import csv
+import gc
 import json
+import os
+import re
+import threading
 import unicodedata
+import warnings
+from bisect import bisect_left
+from collections import deque
 from importlib import resources
-from typing import Any, Dict, List, Union
+from pathlib import Path
+from time import monotonic, perf_counter_ns
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
-from .exceptions import WordNotFound
+from .entry import Entry
+from .exceptions import NinolexError, WordNotFound
+from .ipa import LENGTH, STRESS_MARKERS
+from .metrics import Metrics
 
 # ==============================================================================
 # SENTINEL & CACHE
@@ -33,12 +85,151 @@ from .exceptions import WordNotFound
 # Sentinel object for distinguishing "no default provided" from "default is None"
 _MISSING: Any = object()
 
+# Storage backends understood by _load_data()
+#   "json": parse the bundled JSON into a dict of Entry records (default)
+#   "mmap": memory-map the bundled binary lexicon and decode on demand
+_BACKENDS = ("json", "mmap")
+
+# Active backend, overridable via the NINOLEX_GH_BACKEND environment variable
+_BACKEND = os.environ.get("NINOLEX_GH_BACKEND", "json")
+
+# Lookup metrics; None (the default) disables instrumentation.
+# NINOLEX_GH_METRICS=1 enables it at import.
+_METRICS: Optional[Metrics] = (
+    Metrics() if os.environ.get("NINOLEX_GH_METRICS", "") not in ("", "0") else None
+)
+
+# Domains loaded by the JSON backend: None for the whole dictionary, or a
+# tuple of domain names (in dictionary order) whose shards under
+# data/domains/ are loaded instead. Set by load() or NINOLEX_GH_DOMAINS.
+_DOMAINS: Optional[Tuple[str, ...]] = (
+    tuple(d.strip() for d in os.environ["NINOLEX_GH_DOMAINS"].split(",") if d.strip())
+    if os.environ.get("NINOLEX_GH_DOMAINS") else None
+)
+
+# Shard index (data/domains/index.json), read on first use
+_DOMAIN_INDEX: Optional[List[Dict[str, Any]]] = None
+
+# Directory of the on-disk index cache (None, the default, disables it);
+# NINOLEX_GH_CACHE_DIR enables it at import. See cache.py, which is only
+# imported (with pickle, tempfile and hashlib) once the cache is enabled
+_CACHE_DIR: Optional[Path] = None
+if os.environ.get("NINOLEX_GH_CACHE_DIR", "") not in ("", "0"):
+    from .cache import default_cache_dir
+    
+    _CACHE_DIR = default_cache_dir()
+
+# SHA-256 of the loaded JSON data, and whether its cache file already holds
+# the optional indexes (so preload(indexes=True) rewrites it only once)
+_DATA_DIGEST: Optional[str] = None
+_CACHED_INDEXES = False
+
+# Serializes loading and index builds. Reentrant because index builders
+# call _load_data() while holding it.
+_LOAD_LOCK = threading.RLock()
+
 # Module-level cache for dictionary data
 # Structure: { normalized_grapheme: entry_dict, ... }
-_CACHE: Union[Dict[str, Dict[str, Any]], None] = None
+# (a BinaryLexicon mapping when the "mmap" backend is active)
+_CACHE: Union[Mapping[str, Entry], None] = None
 
 # Raw entries list (preserved for iteration and entry count)
-_RAW_ENTRIES: Union[List[Dict[str, Any]], None] = None
+_RAW_ENTRIES: Union[Sequence[Entry], None] = None
+
+# Secondary index of aliases (semicolon-split "alias" column)
+# Structure: { normalized_alias: entry_dict, ... }
+_ALIASES: Union[Dict[str, Entry], None] = None
+
+# Sorted key arrays used by complete(), built lazily from _CACHE
+# Structure: { domain_or_None: (sorted_keys, entries_in_key_order), ... }
+_PREFIXES: Union[Dict[Union[str, None], Tuple[List[str], List[Entry]]], None] = None
+
+# Fields that query() can filter on
+_FACET_FIELDS = ("domain", "category", "region", "city")
+
+# Inverted indexes used by query(), built lazily from _RAW_ENTRIES
+# Structure: { field: { normalized_value: [position, ...] }, ... }
+_FACETS: Union[Dict[str, Dict[str, List[int]]], None] = None
+
+# Reverse phoneme indexes used by lookup_by_phoneme(), built lazily
+# Structure: { loose_flag: { phoneme_key: (entry, ...), ... }, ... }
+_PHONEMES: Dict[bool, Dict[str, Tuple[Entry, ...]]] = {}
+
+# Marks ignored by loose phoneme matching: stress (ˈ ˌ), length (ː) and the
+# syllable dot
+_LOOSE_PHONEME_MARKS = str.maketrans("", "", "".join(sorted(STRESS_MARKERS | LENGTH)) + ".")
+
+# Token trie used by annotate(), built lazily from _CACHE and aliases
+# Structure: { token: { token: { ..., _TERMINAL: entry_dict } } }
+_TRIE: Union[Dict[str, Any], None] = None
+
+# Trie key marking the end of a grapheme (never produced by _TOKEN_RE)
+_TERMINAL = ""
+
+# Word tokens for annotation: letters, digits and combining diacritics.
+# Whitespace, hyphens and apostrophes between tokens are ignored when
+# matching, so "Sekondi-Takoradi" is matched token by token.
+_TOKEN_RE = re.compile(r"[\w\u0300-\u036f]+")
+
+# Separators that end a match ("Kumasi. Central bank ..."), unless the
+# grapheme itself has the same punctuation there ("J. B. Danquah")
+_HARD_SEPARATOR_RE = re.compile(r"[.,;:!?\n]")
+
+# Trie key prefix for a token that follows a hard separator; _TOKEN_RE
+# never produces it, so such edges only match across hard separators
+_HARD_MARK = "."
+
+# Matching levels accepted by lookup(match=...), strictest first. Each level
+# also applies the folding of the levels before it.
+_MATCH_LEVELS = ("exact", "whitespace", "punctuation", "diacritics")
+
+# Fallbacks accepted by lookup(fallback=...) for words not in the dictionary
+#   "g2p": guess the pronunciation from the spelling (see g2p.py)
+_FALLBACKS = (None, "g2p")
+
+# Folded-key indexes for the non-exact levels, built lazily per level
+# Structure: { level: (folded_graphemes, folded_aliases) }
+_FOLDED: Dict[str, Tuple[Dict[str, Entry], Dict[str, Entry]]] = {}
+
+# Everything but letters, digits and combining diacritics; removed by
+# punctuation-insensitive matching
+_PUNCTUATION_RE = re.compile(r"[^\w\u0300-\u036f]+|_+")
+
+# Letters of the Akan, Ewe and Ga alphabets and their usual spelling on
+# keyboards without them, used by diacritic-insensitive matching
+_LETTER_FOLDS = str.maketrans({
+    "ɛ": "e", "ɔ": "o", "ŋ": "ng", "ɖ": "d", "ƒ": "f", "ʋ": "v", "ɣ": "gh",
+})
+
+
+class Resolution(NamedTuple):
+    """
+    The result of resolve(): an entry and how the query matched it.
+
+    Attributes:
+        entry: The resolved dictionary entry.
+        matched_by: ``"grapheme"`` or ``"alias"``.
+    """
+
+    entry: Entry
+    matched_by: str
+
+
+class Match(NamedTuple):
+    """
+    A dictionary entry recognised in free text by annotate().
+
+    Attributes:
+        start: Offset of the first character of the match in the input text.
+        end: Offset one past the last character of the match.
+        text: The matched slice of the input text (original spelling).
+        entry: The dictionary entry the span resolved to.
+    """
+
+    start: int
+    end: int
+    text: str
+    entry: Entry
 
 
 # ==============================================================================
@@ -65,10 +256,97 @@ def _normalize_key(text: str) -> str:
     Returns:
         Normalized key string suitable for dictionary lookup.
     """
+    # NFC leaves ASCII unchanged, and most queries are ASCII
+    if text.isascii():
+        return text.strip().lower()
     return unicodedata.normalize("NFC", text).strip().lower()
 
 
-def _load_data() -> Dict[str, Dict[str, Any]]:
+def _fold_key(key: str, level: str) -> str:
+    """
+    Fold a normalized key for a non-exact matching level.
+
+    Levels are cumulative:
+        - whitespace: runs of whitespace collapse to a single space
+        - punctuation: everything but letters and digits is removed,
+          spaces included, so "J. B. Danquah" and "JB Danquah" share
+          the key "jbdanquah"
+        - diacritics: combining marks are removed as well and the
+          letters ɛ ɔ ŋ ɖ ƒ ʋ ɣ are spelled e o ng d f v gh
+    """
+    if level == "whitespace":
+        return " ".join(key.split())
+    if level == "diacritics" and not key.isascii():
+        key = "".join(
+            c for c in unicodedata.normalize("NFD", key) if not unicodedata.combining(c)
+        ).translate(_LETTER_FOLDS)
+    return _PUNCTUATION_RE.sub("", key)
+
+
+def _check_fallback(fallback: Optional[str]) -> None:
+    """Raise ValueError for an unknown fallback."""
+    if fallback not in _FALLBACKS:
+        raise ValueError(
+            f"Unknown Ninolex-GH fallback {fallback!r}; expected one of {_FALLBACKS}"
+        )
+
+
+def _guess_entry(word: str) -> Optional[Entry]:
+    """
+    Build an entry for a word not in the dictionary from its guessed
+    pronunciation (domain "g2p"), or None if nothing can be guessed.
+    """
+    # Imported here: the fallback is opt-in
+    from .g2p import guess
+
+    phoneme = guess(word)
+    if not phoneme:
+        return None
+    return Entry(
+        grapheme=word.strip(),
+        phoneme=phoneme,
+        domain="g2p",
+        category="guess",
+        notes="Guessed from the spelling; not in Ninolex-GH",
+    )
+
+
+def _missed_keys(misses: Dict[str, int]) -> Dict[str, int]:
+    """Sum per-word miss counts by normalized key, for Metrics.record_batch()."""
+    missed: Dict[str, int] = {}
+    for word, n in misses.items():
+        key = _normalize_key(word)
+        missed[key] = missed.get(key, 0) + n
+    return missed
+
+
+def _check_match(match: str) -> None:
+    """Raise ValueError for an unknown matching level."""
+    if match not in _MATCH_LEVELS:
+        raise ValueError(
+            f"Unknown Ninolex-GH match level {match!r}; expected one of {_MATCH_LEVELS}"
+        )
+
+
+def _reset_caches() -> None:
+    """Drop all loaded data and derived indexes so the next access reloads."""
+    global _CACHE, _RAW_ENTRIES, _ALIASES, _PREFIXES, _FACETS, _TRIE
+    global _DATA_DIGEST, _CACHED_INDEXES
+
+    with _LOAD_LOCK:
+        _DATA_DIGEST = None
+        _CACHED_INDEXES = False
+        _CACHE = None
+        _RAW_ENTRIES = None
+        _ALIASES = None
+        _PREFIXES = None
+        _FACETS = None
+        _PHONEMES.clear()
+        _FOLDED.clear()
+        _TRIE = None
+
+
+def _load_data() -> Mapping[str, Entry]:
     """
     Load and cache the dictionary data from the bundled JSON file.
     
@@ -80,42 +358,855 @@ def _load_data() -> Dict[str, Dict[str, Any]]:
         - System packages
     
     The data is cached in the module-level _CACHE variable to avoid
-    repeated file I/O on subsequent lookups.
+    repeated file I/O on subsequent lookups. The alias index (_ALIASES) is
+    built in the same pass. The built structures are also written to the
+    on-disk index cache, and read back from it by later processes while
+    the data file and package version are unchanged.
+    
+    With the "mmap" backend the binary lexicon is memory-mapped instead;
+    only its header is read here and entries are decoded on access. The
+    alias index is then built on first use by _load_aliases().
     
     Returns:
-        dict: Mapping of normalized graphemes to entry dictionaries.
+        dict: Mapping of normalized graphemes to Entry records.
         
     Note:
         This function is idempotent; calling it multiple times returns
-        the same cached dictionary instance.
+        the same cached dictionary instance. Concurrent first calls are
+        serialized by _LOAD_LOCK, so the data is parsed exactly once.
     """
-    global _CACHE, _RAW_ENTRIES
+    cache = _CACHE
+    if cache is not None:
+        return cache
+    
+    with _LOAD_LOCK:
+        # Another thread may have finished loading while we waited
+        if _CACHE is not None:
+            return _CACHE
+        return _load_data_locked()
+
+
+def _load_data_locked() -> Mapping[str, Entry]:
+    """Load the data for _load_data(); the caller holds _LOAD_LOCK."""
+    global _CACHE, _RAW_ENTRIES, _ALIASES, _PREFIXES, _FACETS
+    global _DATA_DIGEST, _CACHED_INDEXES, _DOMAINS
+    
+    if _BACKEND not in _BACKENDS:
+        raise ValueError(
+            f"Unknown Ninolex-GH backend {_BACKEND!r}; expected one of {_BACKENDS}"
+        )
     
-    if _CACHE is not None:
+    metrics = _METRICS
+    start = perf_counter_ns() if metrics is not None else 0
+    
+    data_files = resources.files("ninolex_gh.data")
+    
+    if _BACKEND == "mmap":
+        if _DOMAINS is not None:
+            raise ValueError(
+                "Loading selected domains requires the json backend; the mmap "
+                "backend maps the whole lexicon"
+            )
+        
+        from .binary import BinaryLexicon
+        
+        # as_file() yields the real path for regular installs; for zipped
+        # packages the extracted copy stays mapped after it is removed
+        bin_file = data_files.joinpath("ninolex_gh_dictionary.bin")
+        with resources.as_file(bin_file) as path:
+            lexicon = BinaryLexicon(path)
+        
+        # Publish _CACHE last: readers that see it also see the rest
+        _RAW_ENTRIES = lexicon.records
+        _CACHE = lexicon
+        if metrics is not None:
+            metrics.record_load(perf_counter_ns() - start)
         return _CACHE
     
     # Load JSON from package resources (Python 3.9+ API)
-    # This works regardless of how the package is installed
-    data_files = resources.files("ninolex_gh.data")
-    json_file = data_files.joinpath("ninolex_gh_dictionary.json")
+    # This works regardless of how the package is installed. With a domain
+    # selection only those shards are read, in dictionary order.
+    if _DOMAINS is None:
+        parts = [data_files.joinpath("ninolex_gh_dictionary.json").read_bytes()]
+    else:
+        # Validates a selection made through NINOLEX_GH_DOMAINS
+        _DOMAINS = _select_domains(_DOMAINS)
+        shards = data_files.joinpath("domains")
+        parts = [
+            shards.joinpath(item["file"]).read_bytes()
+            for item in _load_domain_index()
+            if item["domain"] in _DOMAINS
+        ]
     
-    with json_file.open("r", encoding="utf-8") as f:
-        _RAW_ENTRIES = json.load(f)
+    # Reuse the structures built by an earlier process when the index
+    # cache holds them for exactly this data and package version
+    payload = None
+    if _CACHE_DIR is not None:
+        from . import __version__
+        from . import cache as _index_cache
+        
+        _DATA_DIGEST = _index_cache.data_digest(b"\n".join(parts))
+        payload = _index_cache.read_cache(
+            _cache_file(__version__), __version__, _DATA_DIGEST
+        )
     
-    # Build lookup cache with normalized keys
-    _CACHE = {
-        _normalize_key(entry["grapheme"]): entry
-        for entry in _RAW_ENTRIES
-    }
+    if payload is not None:
+        entries = payload["entries"]
+        aliases = payload["aliases"]
+        cache = payload["mapping"]
+        _PREFIXES = payload.get("prefixes")
+        _FACETS = payload.get("facets")
+        _PHONEMES.update(payload.get("phonemes", {}))
+        _FOLDED.update(payload.get("folded", {}))
+        _CACHED_INDEXES = _PREFIXES is not None
+    else:
+        entries = [Entry.from_dict(item) for part in parts for item in json.loads(part)]
+        
+        # Build lookup cache with normalized keys
+        cache = {
+            _normalize_key(entry["grapheme"]): entry
+            for entry in entries
+        }
+        aliases = _build_alias_index(entries)
+    
+    # Publish _CACHE last: readers that see it also see the rest
+    _RAW_ENTRIES = entries
+    _ALIASES = aliases
+    _CACHE = cache
+    
+    if payload is None and _DATA_DIGEST is not None:
+        _save_index_cache()
     
+    if metrics is not None:
+        metrics.record_load(perf_counter_ns() - start)
     return _CACHE
 
 
+def _save_index_cache() -> bool:
+    """
+    Write the loaded JSON data and any indexes built so far to the cache.
+
+    The annotation trie and the fuzzy search index are not cached: loading
+    their many small objects from a pickle is no faster than rebuilding
+    them.
+    """
+    if _CACHE_DIR is None or _DATA_DIGEST is None:
+        return False
+
+    from . import __version__
+    from . import cache as _index_cache
+
+    with _LOAD_LOCK:
+        payload = {
+            "domains": _DOMAINS,
+            "entries": _RAW_ENTRIES,
+            "mapping": _CACHE,
+            "aliases": _ALIASES,
+        }
+        if (
+            _PREFIXES is not None
+            and _FACETS is not None
+            and len(_PHONEMES) == 2
+            and len(_FOLDED) == len(_MATCH_LEVELS) - 1
+        ):
+            payload.update(
+                prefixes=_PREFIXES,
+                facets=_FACETS,
+                phonemes=dict(_PHONEMES),
+                folded=dict(_FOLDED),
+            )
+        return _index_cache.write_cache(
+            _cache_file(__version__), __version__, _DATA_DIGEST, payload
+        )
+
+
+def _cache_file(version: str) -> Path:
+    """Index cache file for the loaded data set (see cache.cache_path())."""
+    from . import cache as _index_cache
+
+    label = "all" if _DOMAINS is None else "+".join(_DOMAINS)
+    return _index_cache.cache_path(_CACHE_DIR, version, _DATA_DIGEST, label)
+
+
+def _load_domain_index() -> List[Dict[str, Any]]:
+    """
+    Return the packaged shard index: ``[{"domain", "file", "entries"}, ...]``
+    in dictionary order (written by build/generate_domain_shards.py).
+    """
+    global _DOMAIN_INDEX
+
+    if _DOMAIN_INDEX is None:
+        index_file = resources.files("ninolex_gh.data").joinpath("domains").joinpath("index.json")
+        _DOMAIN_INDEX = json.loads(index_file.read_bytes())["domains"]
+    return _DOMAIN_INDEX
+
+
+def _select_domains(domains: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Validate domain names and return them in dictionary order.
+
+    Raises:
+        ValueError: If a domain is not in the packaged data.
+    """
+    available = [item["domain"] for item in _load_domain_index()]
+    requested = {domain.strip().lower() for domain in domains}
+    unknown = requested.difference(available)
+    if unknown:
+        raise ValueError(
+            f"Unknown Ninolex-GH domain(s) {sorted(unknown)}; expected some of {available}"
+        )
+    return tuple(domain for domain in available if domain in requested)
+
+
+def _split_aliases(alias: str) -> List[str]:
+    """
+    Split a semicolon-separated alias field into individual aliases.
+
+    Empty items and surrounding whitespace are dropped, so
+    ``"Motown; Achimota"`` becomes ``["Motown", "Achimota"]``.
+    """
+    return [a.strip() for a in alias.split(";") if a.strip()]
+
+
+def _build_alias_index(entries: Iterable[Entry]) -> Dict[str, Entry]:
+    """
+    Map each normalized alias to its entry.
+
+    When several entries share an alias, the first one in dictionary order
+    keeps it.
+    """
+    index: Dict[str, Entry] = {}
+    for entry in entries:
+        alias = entry.get("alias")
+        if not alias:
+            continue
+        for name in _split_aliases(alias):
+            index.setdefault(_normalize_key(name), entry)
+    return index
+
+
+def _load_aliases() -> Dict[str, Entry]:
+    """
+    Return the alias index, building it if the backend did not.
+
+    The JSON backend builds it in _load_data(); the mmap backend defers it
+    until the first alias-aware lookup so startup stays cheap.
+    """
+    global _ALIASES
+
+    _load_data()
+    aliases = _ALIASES
+    if aliases is None:
+        with _LOAD_LOCK:
+            if _ALIASES is None:
+                _ALIASES = _build_alias_index(_RAW_ENTRIES)
+            aliases = _ALIASES
+    return aliases
+
+
+def _load_prefixes() -> Dict[Union[str, None], Tuple[List[str], List[Entry]]]:
+    """
+    Build and cache the sorted key arrays used by complete().
+
+    The ``None`` slot covers every entry; each domain (by normalized
+    name, as in the query facets) also gets its own array so
+    domain-filtered completion never has to skip other domains.
+    """
+    global _PREFIXES
+
+    prefixes = _PREFIXES
+    if prefixes is not None:
+        return prefixes
+
+    with _LOAD_LOCK:
+        if _PREFIXES is not None:
+            return _PREFIXES
+
+        items = sorted(_load_data().items(), key=lambda item: item[0])
+        by_domain: Dict[Union[str, None], Tuple[List[str], List[Entry]]] = {
+            None: ([k for k, _ in items], [e for _, e in items]),
+        }
+        for key, entry in items:
+            keys, entries = by_domain.setdefault(
+                _normalize_key(entry["domain"]), ([], [])
+            )
+            keys.append(key)
+            entries.append(entry)
+
+        _PREFIXES = by_domain
+        return _PREFIXES
+
+
+def _load_facets() -> Dict[str, Dict[str, List[int]]]:
+    """
+    Build and cache the per-field inverted indexes used by query().
+
+    Each posting list holds positions into _RAW_ENTRIES in ascending
+    (dictionary) order.
+    """
+    global _FACETS
+
+    facets = _FACETS
+    if facets is not None:
+        return facets
+
+    with _LOAD_LOCK:
+        if _FACETS is not None:
+            return _FACETS
+
+        _load_data()
+        facets = {field: {} for field in _FACET_FIELDS}
+        for position, entry in enumerate(_RAW_ENTRIES):
+            for field in _FACET_FIELDS:
+                facets[field].setdefault(_normalize_key(entry[field]), []).append(position)
+
+        _FACETS = facets
+        return _FACETS
+
+
+def _iter_query(positions: Iterable[int], rest: List[Tuple[str, str]]) -> Iterator[Entry]:
+    """Yield entries at ``positions`` whose fields match all of ``rest``."""
+    entries = _RAW_ENTRIES
+    for position in positions:
+        entry = entries[position]
+        if all(_normalize_key(entry[field]) == key for field, key in rest):
+            yield entry
+
+
+
+def _phoneme_key(ipa: str, loose: bool = False) -> str:
+    """
+    Normalize an IPA string for reverse lookup.
+
+    Applies NFC normalization and collapses whitespace. In loose mode,
+    stress marks, length marks and syllable dots are also removed, so
+    "ˈwa.tʃe" and "watʃe" share a key.
+    """
+    key = " ".join(unicodedata.normalize("NFC", ipa).split())
+    if loose:
+        key = " ".join(key.translate(_LOOSE_PHONEME_MARKS).split())
+    return key
+
+
+def _load_phonemes(loose: bool) -> Dict[str, Tuple[Entry, ...]]:
+    """Build and cache the exact or loose phoneme index on first use."""
+    index = _PHONEMES.get(loose)
+    if index is not None:
+        return index
+
+    with _LOAD_LOCK:
+        index = _PHONEMES.get(loose)
+        if index is not None:
+            return index
+
+        _load_data()
+        groups: Dict[str, List[Entry]] = {}
+        for entry in _RAW_ENTRIES:
+            groups.setdefault(_phoneme_key(entry["phoneme"], loose), []).append(entry)
+
+        index = {key: tuple(entries) for key, entries in groups.items()}
+        _PHONEMES[loose] = index
+        return index
+
+
+def _load_folded(level: str) -> Tuple[Dict[str, Entry], Dict[str, Entry]]:
+    """
+    Build and cache the folded grapheme and alias indexes for ``level``.
+
+    When several keys fold to the same key, the first one in dictionary
+    order keeps it.
+    """
+    folded = _FOLDED.get(level)
+    if folded is not None:
+        return folded
+
+    with _LOAD_LOCK:
+        folded = _FOLDED.get(level)
+        if folded is not None:
+            return folded
+
+        graphemes: Dict[str, Entry] = {}
+        for key, entry in _load_data().items():
+            graphemes.setdefault(_fold_key(key, level), entry)
+        aliases: Dict[str, Entry] = {}
+        for key, entry in _load_aliases().items():
+            aliases.setdefault(_fold_key(key, level), entry)
+
+        folded = (graphemes, aliases)
+        _FOLDED[level] = folded
+        return folded
+
+
+def _find_loose(
+    key: str, include_aliases: bool, match: str
+) -> Tuple[Optional[Entry], str]:
+    """
+    Resolve a normalized key that is not an exact grapheme:
+    ``(entry, matched_by)``.
+
+    Tries the exact alias, then the folded grapheme and the folded alias
+    for ``match``, so graphemes keep precedence over aliases at every
+    level.
+    """
+    if include_aliases:
+        entry = _load_aliases().get(key)
+        if entry is not None:
+            return entry, "alias"
+
+    if match == "exact":
+        return None, "grapheme"
+
+    graphemes, aliases = _load_folded(match)
+    folded = _fold_key(key, match)
+    entry = graphemes.get(folded)
+    if entry is not None or not include_aliases:
+        return entry, "grapheme"
+    return aliases.get(folded), "alias"
+
+
+def _tokenize_key(key: str) -> Tuple[str, ...]:
+    """Split a normalized key into its word tokens."""
+    return tuple(_TOKEN_RE.findall(key))
+
+
+def _trie_path(key: str) -> Tuple[str, ...]:
+    """
+    Split a normalized key into trie edge keys.
+
+    Every token after the first that follows a hard separator is prefixed
+    with _HARD_MARK, so "j. b. danquah" becomes ("j", ".b", ".danquah").
+    """
+    path = []
+    last = None
+    for m in _TOKEN_RE.finditer(key):
+        token = m.group()
+        if last is not None and _HARD_SEPARATOR_RE.search(key, last, m.start()):
+            token = _HARD_MARK + token
+        path.append(token)
+        last = m.end()
+    return tuple(path)
+
+
+def _build_trie(
+    mapping: Mapping[str, Entry], aliases: Mapping[str, Entry]
+) -> Dict[str, Any]:
+    """
+    Build a token trie from normalized grapheme and alias maps.
+
+    Graphemes are inserted first, then aliases, so a grapheme always wins
+    over an alias that tokenizes identically. A key with hard punctuation
+    between its tokens is inserted both as written (see _trie_path()) and
+    with the punctuation ignored, so "J. B. Danquah" also matches
+    "J B Danquah".
+
+    Returns:
+        dict: Root node of the token trie.
+    """
+    root: Dict[str, Any] = {}
+
+    def insert(key: str, entry: Entry) -> None:
+        path = _trie_path(key)
+        if not path:
+            return
+        for tokens in {path, _tokenize_key(key)}:
+            node = root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node.setdefault(_TERMINAL, entry)
+
+    for key, entry in mapping.items():
+        insert(key, entry)
+
+    for key, entry in aliases.items():
+        insert(key, entry)
+
+    return root
+
+
+def _load_trie() -> Dict[str, Any]:
+    """
+    Build and cache the token trie used for free-text annotation.
+
+    Within graphemes and aliases the entry resolved by lookup() (or the
+    first alias seen) is kept; see _build_trie().
+
+    Returns:
+        dict: Root node of the token trie.
+    """
+    global _TRIE
+
+    trie = _TRIE
+    if trie is None:
+        with _LOAD_LOCK:
+            if _TRIE is None:
+                _TRIE = _build_trie(_load_data(), _load_aliases())
+            trie = _TRIE
+    return trie
+
+
+def _iter_tokens(text: str) -> Iterator[Tuple[int, int, str, str]]:
+    """
+    Lazily yield ``(start, end, word, link)`` for each token of ``text``.
+
+    ``word`` is the normalized token used to start a trie walk; ``link``
+    is the edge key used to extend a walk onto it (see _trie_path()).
+    """
+    last = 0
+    for m in _TOKEN_RE.finditer(text):
+        token = m.group()
+        if not token.isascii():
+            token = unicodedata.normalize("NFC", token)
+        token = token.lower()
+        start, end = m.span()
+        if _HARD_SEPARATOR_RE.search(text, last, start):
+            yield start, end, token, _HARD_MARK + token
+        else:
+            yield start, end, token, token
+        last = end
+
+
+def _iter_matches(text: str, trie: Optional[Dict[str, Any]] = None) -> Iterator[Match]:
+    """
+    Yield leftmost-longest dictionary matches in ``text``.
+
+    Tokens are read lazily into a small look-ahead window; from the first
+    token in the window the trie is walked as far as it goes and the
+    longest complete grapheme is taken, after which the scan resumes after
+    the match. Cost is linear in the number of tokens (times the token
+    length of the longest grapheme), and memory is bounded by that length
+    rather than by the size of the text.
+
+    A match never spans a hard separator (``.,;:!?`` or a newline) unless
+    the grapheme has hard punctuation in the same place, so "Kumasi.
+    Central bank" does not match the Kumasi Central constituency.
+
+    ``trie`` defaults to the trie for the loaded dictionary; tools pass one
+    built with _build_trie() from other data.
+    """
+    if trie is None:
+        trie = _load_trie()
+
+    tokens = _iter_tokens(text)
+    window: Deque[Tuple[int, int, str, str]] = deque()
+
+    while True:
+        if not window:
+            token = next(tokens, None)
+            if token is None:
+                return
+            window.append(token)
+
+        node = trie
+        best_end = 0
+        best_entry = None
+        j = 0
+        while True:
+            if j == len(window):
+                token = next(tokens, None)
+                if token is None:
+                    break
+                window.append(token)
+            node = node.get(window[j][2] if j == 0 else window[j][3])
+            if node is None:
+                break
+            j += 1
+            entry = node.get(_TERMINAL)
+            if entry is not None:
+                best_end = j
+                best_entry = entry
+
+        if best_entry is None:
+            window.popleft()
+            continue
+
+        start = window[0][0]
+        end = window[best_end - 1][1]
+        yield Match(start, end, text[start:end], best_entry)
+        for _ in range(best_end):
+            window.popleft()
+
+
 # ==============================================================================
 # PUBLIC API
 # ==============================================================================
 
-def lookup(word: str, default: Any = _MISSING) -> Dict[str, Any]:
+def set_backend(backend: str) -> None:
+    """
+    Select how the dictionary is loaded.
+    
+    Any data already loaded is discarded and reloaded on next access.
+    
+    Args:
+        backend: One of:
+            - "json": Parse the bundled JSON into memory (default).
+            - "mmap": Memory-map the bundled binary lexicon. Startup only
+              reads a small header (about 6 ms instead of 160 ms at 10k
+              entries) and pages are shared between forked workers, but
+              every access is a Python-level binary search and decode:
+              about 15 us for an uncached lookup at 10k entries, against
+              under 1 us with "json". The last few thousand distinct
+              words looked up are cached, so hot words stay cheap. Full
+              scans decode every record and are 5-30x slower than with
+              "json": list_graphemes(), and the first annotate(),
+              complete(), query() or lookup_by_phoneme() call, which
+              builds its index. Choose it for fast startup and low memory
+              rather than for hot loops over the whole dictionary.
+    
+    Raises:
+        ValueError: If ``backend`` is not recognised.
+    
+    Example:
+        >>> import ninolex_gh
+        >>> ninolex_gh.set_backend("mmap")
+        >>> ninolex_gh.lookup("Kumasi")["phoneme"]
+        'kuˈmɑːsi'
+    """
+    global _BACKEND
+    
+    if backend not in _BACKENDS:
+        raise ValueError(
+            f"Unknown Ninolex-GH backend {backend!r}; expected one of {_BACKENDS}"
+        )
+    
+    with _LOAD_LOCK:
+        _BACKEND = backend
+        _reset_caches()
+
+
+def load(domains: Optional[Iterable[str]] = None) -> int:
+    """
+    Load the dictionary now, optionally only some of its domains.
+    
+    The package ships each domain (core, places, people, sports,
+    education, ...) as a separate shard. A service that needs only some of
+    them can load just those: the other shards are never read or parsed, so
+    startup time and memory scale with the selection. Every function
+    (lookup(), annotate(), complete(), search(), Lexicon, ...) then works
+    on the selected entries only; words from other domains are not found.
+    ``load()`` or ``load(None)`` returns to the whole dictionary. The
+    ``NINOLEX_GH_DOMAINS`` environment variable (e.g. ``places,core``) sets
+    the initial selection.
+    
+    Changing the selection discards any data already loaded. Domain
+    selection requires the JSON backend.
+    
+    Args:
+        domains: Domain names to load, or None for all of them.
+    
+    Returns:
+        int: Number of entries loaded.
+    
+    Raises:
+        ValueError: If a domain is unknown, or the mmap backend is active.
+    
+    Example:
+        >>> import ninolex_gh
+        >>> ninolex_gh.load(domains=["places", "core"])
+        64
+        >>> ninolex_gh.lookup("Kumasi")["domain"]
+        'places'
+        >>> ninolex_gh.lookup("Kwame Nkrumah", default=None) is None
+        True
+    """
+    global _DOMAINS
+    
+    selected = _select_domains(domains) if domains is not None else None
+    with _LOAD_LOCK:
+        if selected is not None and _BACKEND == "mmap":
+            raise ValueError("Loading selected domains requires the json backend")
+        if selected != _DOMAINS:
+            _DOMAINS = selected
+            _reset_caches()
+        return len(_load_data())
+
+
+def list_domains() -> List[str]:
+    """
+    Return the domains shipped with the package, in dictionary order.
+    
+    These are the names accepted by load(domains=...), whether or not they
+    are currently loaded.
+    
+    Example:
+        >>> import ninolex_gh
+        >>> ninolex_gh.list_domains()
+        ['core', 'places', 'sports', 'people', 'education']
+    """
+    return [item["domain"] for item in _load_domain_index()]
+
+
+def preload(indexes: bool = False, freeze: bool = False) -> int:
+    """
+    Load the dictionary now instead of on first lookup.
+    
+    Safe to call from several threads at once: the data is loaded (and
+    each index built) exactly once, and every caller returns after it is
+    ready. Calling it again is cheap.
+    
+    For pre-fork servers (gunicorn, uWSGI), call it in the master process
+    before workers are forked, with ``freeze=True``. Forked workers then
+    share the loaded lexicon copy-on-write. Freezing moves every object
+    currently tracked by the garbage collector into a permanent generation
+    (``gc.freeze()``), so collections in the workers no longer touch, and
+    thereby copy, the shared pages. This applies to the whole process, so
+    call it once start-up is complete.
+    
+    Args:
+        indexes: Also build the indexes that are otherwise built on first
+                 use: aliases, prefix completion, query facets, both
+                 phoneme indexes, the folded indexes of every matching
+                 level, the annotation trie and the fuzzy search index.
+                 All but the last two are added to the on-disk index
+                 cache when it is enabled (see set_cache_dir()), so
+                 later processes load them instead of rebuilding.
+        freeze: Run a full collection and then ``gc.freeze()`` after
+                loading.
+    
+    Returns:
+        int: Number of entries loaded.
+    
+    Example:
+        >>> import ninolex_gh
+        >>> ninolex_gh.preload(indexes=True, freeze=True) > 100
+        True
+    """
+    global _CACHED_INDEXES
+    
+    mapping = _load_data()
+    _load_aliases()
+    
+    if indexes:
+        from .search import _load_index
+        
+        _load_prefixes()
+        _load_facets()
+        _load_phonemes(False)
+        _load_phonemes(True)
+        for level in _MATCH_LEVELS[1:]:
+            _load_folded(level)
+        _load_trie()
+        _load_index()
+        
+        # Keep the newly built indexes for the next process too
+        if not _CACHED_INDEXES and _save_index_cache():
+            _CACHED_INDEXES = True
+    
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    
+    return len(mapping)
+
+
+def set_cache_dir(path: Union[str, "os.PathLike[str]", None]) -> None:
+    """
+    Enable the on-disk index cache in ``path``, or disable it.
+    
+    The JSON backend pickles the structures it builds (entries, the
+    normalized-key and alias indexes, and after preload(indexes=True) the
+    completion, query and phoneme indexes) into a file keyed by the SHA-256
+    of the bundled data and the package version. Later processes load that
+    file instead of parsing and normalizing the JSON; a changed data file or
+    package version misses the cache and rewrites it.
+    
+    The cache is disabled by default, so importing the package never
+    writes to disk. The ``NINOLEX_GH_CACHE_DIR`` environment variable
+    enables it at import: a directory, or ``1`` for
+    ``$XDG_CACHE_HOME/ninolex_gh`` (``~/.cache/ninolex_gh``). If the
+    directory cannot be written the cache is silently skipped.
+    
+    Any data already loaded is discarded and reloaded on next access.
+    
+    Args:
+        path: Cache directory, or None to disable the cache.
+    
+    Example:
+        >>> import ninolex_gh
+        >>> ninolex_gh.set_cache_dir("/var/cache/ninolex_gh")
+        >>> ninolex_gh.set_cache_dir(None)  # always parse the bundled JSON
+    """
+    global _CACHE_DIR
+    
+    with _LOAD_LOCK:
+        _CACHE_DIR = Path(path).expanduser() if path is not None else None
+        _reset_caches()
+
+
+def enable_metrics(enabled: bool = True, miss_capacity: int = 1000) -> None:
+    """
+    Turn lookup instrumentation on or off.
+    
+    While enabled, lookup(), resolve() and lookup_many() count hits, misses
+    and key normalizations and record their latency, dictionary loads are
+    timed, and missed keys are tallied in a bounded frequency sketch. Read
+    the results with stats(). Setting ``NINOLEX_GH_METRICS=1`` enables
+    metrics at import.
+    
+    Enabling starts from empty counters; disabling discards them.
+    
+    Args:
+        enabled: True to start recording, False to stop.
+        miss_capacity: Maximum number of distinct missed keys tracked.
+    
+    Example:
+        >>> import ninolex_gh
+        >>> ninolex_gh.enable_metrics()
+        >>> ninolex_gh.lookup("Kumasi")["phoneme"]
+        'kuˈmɑːsi'
+        >>> ninolex_gh.stats()["hits"]
+        1
+    """
+    global _METRICS
+    
+    _METRICS = Metrics(miss_capacity) if enabled else None
+
+
+def stats(top_misses: Optional[int] = 50) -> Dict[str, Any]:
+    """
+    Return a snapshot of the lookup metrics.
+    
+    Args:
+        top_misses: Number of most frequent missed keys to include
+                    (None for every tracked key).
+    
+    Returns:
+        dict: ``{"enabled": False}`` when metrics are off. Otherwise:
+            - lookups, hits, alias_hits, misses (int) and hit_rate (float)
+            - normalizations (int): Keys normalized for lookups
+            - lookup_latency, batch_latency, load_latency (dict): count,
+              total_ms, mean_us, p50_us/p90_us/p99_us (bucket upper bounds),
+              max_us and non-empty bucket counts; batch_latency has one
+              sample per lookup_many() call
+            - top_misses (list): ``{"key", "count", "error"}`` dicts, most
+              frequent first; ``count`` may overestimate by up to ``error``
+    
+    Example:
+        >>> import ninolex_gh
+        >>> ninolex_gh.enable_metrics()
+        >>> ninolex_gh.lookup("Nsawam-Adoagyiri", default=None)
+        >>> ninolex_gh.stats()["top_misses"]
+        [{'key': 'nsawam-adoagyiri', 'count': 1, 'error': 0}]
+    """
+    metrics = _METRICS
+    if metrics is None:
+        return {"enabled": False}
+    return metrics.snapshot(top_misses)
+
+
+def reset_stats() -> None:
+    """Zero all counters, histograms and the miss sketch (if enabled)."""
+    metrics = _METRICS
+    if metrics is not None:
+        metrics.reset()
+
+
+def lookup(
+    word: str,
+    default: Any = _MISSING,
+    include_aliases: bool = False,
+    match: str = "exact",
+    fallback: Optional[str] = None,
+) -> Entry:
     """
     Look up a word in the Ninolex-GH dictionary.
     
@@ -129,9 +1220,34 @@ def lookup(word: str, default: Any = _MISSING) -> Dict[str, Any]:
         default: Value to return if word is not found.
                  - If not provided: raises WordNotFound
                  - If provided (including None, [], {}, etc.): returns that value
+        
+        include_aliases: Also match aliases and abbreviations (e.g. "Kotoko",
+                 "PRESEC", "Osagyefo") when no grapheme matches.
+                 Graphemes always take precedence over aliases.
+        
+        match: How loosely to match when the exact key is not found:
+                 - "exact" (default): case and Unicode form only
+                 - "whitespace": also collapse runs of whitespace
+                 - "punctuation": also ignore punctuation and spaces
+                   ("JB Danquah" finds "J. B. Danquah")
+                 - "diacritics": also ignore diacritics and spell the
+                   letters ɛ ɔ ŋ ɖ ƒ ʋ ɣ as e o ng d f v gh
+                 Each level has its own precomputed index, built on first
+                 use, so a loose lookup is one extra dict probe. Exact
+                 matches are always preferred.
+        
+        fallback: What to do when nothing matches:
+                 - None (default): return ``default`` or raise WordNotFound
+                 - "g2p": return an entry with a pronunciation guessed
+                   from the spelling by Akan, Ewe and Ga rules (see
+                   guess()). It has domain "g2p" and category "guess",
+                   and ``default`` is used only if nothing can be guessed.
     
     Returns:
-        dict: The full entry dictionary when found, containing:
+        Entry: The full, immutable entry when found. It reads like a dict
+        (``entry["phoneme"]``, ``entry.get("alias")``) and exposes the same
+        fields as attributes (``entry.phoneme``); ``entry.to_dict()`` returns
+        a mutable dict copy. Fields:
             - grapheme (str): Original spelling
             - phoneme (str): IPA transcription
             - domain (str): Category domain (core, places, people, etc.)
@@ -146,6 +1262,7 @@ def lookup(word: str, default: Any = _MISSING) -> Dict[str, Any]:
     
     Raises:
         WordNotFound: If word is not in dictionary and no default was provided.
+        ValueError: If ``match`` or ``fallback`` is not known.
     
     Examples:
         >>> import ninolex_gh
@@ -166,17 +1283,53 @@ def lookup(word: str, default: Any = _MISSING) -> Dict[str, Any]:
         >>> ninolex_gh.lookup("xyz", default={"phoneme": "unknown"})
         {'phoneme': 'unknown'}
         
+        >>> # Aliases and abbreviations
+        >>> ninolex_gh.lookup("Kotoko", include_aliases=True)["grapheme"]
+        'Asante Kotoko'
+        
+        >>> # Punctuation-insensitive matching
+        >>> ninolex_gh.lookup("JB Danquah", match="punctuation")["grapheme"]
+        'J. B. Danquah'
+        
+        >>> # Guessed pronunciation for a name not in the dictionary
+        >>> ninolex_gh.lookup("Dzigbordi Kpodo", fallback="g2p")["phoneme"]
+        'dʒiˈɡ͡bɔːdi ˈk͡podo'
+        
         >>> # Raises exception if no default provided
         >>> ninolex_gh.lookup("nonexistent")
         Traceback (most recent call last):
             ...
         ninolex_gh.WordNotFound: Grapheme not found in Ninolex-GH: 'nonexistent'
     """
-    mapping = _load_data()
+    metrics = _METRICS
+    if metrics is not None:
+        start = perf_counter_ns()
+    
+    if match != "exact":
+        _check_match(match)
+    if fallback is not None:
+        _check_fallback(fallback)
+    
     key = _normalize_key(word)
+    entry = _load_data().get(key)
+    matched_by = "grapheme"
+    
+    if entry is None:
+        entry, matched_by = _find_loose(key, include_aliases, match)
+    
+    if metrics is not None:
+        metrics.record_lookup(
+            key, matched_by if entry is not None else None, perf_counter_ns() - start
+        )
+    
+    if entry is not None:
+        return entry
     
-    if key in mapping:
-        return mapping[key]
+    # Misses still count as misses in the metrics above
+    if fallback is not None:
+        entry = _guess_entry(word)
+        if entry is not None:
+            return entry
     
     # Word not found - check if a default was explicitly provided
     if default is not _MISSING:
@@ -185,6 +1338,297 @@ def lookup(word: str, default: Any = _MISSING) -> Dict[str, Any]:
     raise WordNotFound(f"Grapheme not found in Ninolex-GH: {word!r}")
 
 
+def resolve(word: str, default: Any = _MISSING, match: str = "exact") -> Resolution:
+    """
+    Look up a word by grapheme or alias and report which one matched.
+    
+    Graphemes take precedence; aliases are consulted only when no grapheme
+    matches. Both are resolved with a single dict probe each.
+    
+    Args:
+        word: The grapheme or alias to look up. Case-insensitive.
+        default: Value to return if nothing matches. If not provided,
+                 WordNotFound is raised.
+        match: Matching level, as for lookup().
+    
+    Returns:
+        Resolution: ``(entry, matched_by)`` where ``matched_by`` is
+        ``"grapheme"`` or ``"alias"``. Or ``default`` if provided and the
+        word is not found.
+    
+    Raises:
+        WordNotFound: If nothing matches and no default was provided.
+        ValueError: If ``match`` is not a known matching level.
+    
+    Example:
+        >>> import ninolex_gh
+        >>> entry, matched_by = ninolex_gh.resolve("PRESEC")
+        >>> entry["grapheme"], matched_by
+        ("Presbyterian Boys' Secondary School", 'alias')
+    """
+    metrics = _METRICS
+    if metrics is not None:
+        start = perf_counter_ns()
+    
+    if match != "exact":
+        _check_match(match)
+    
+    key = _normalize_key(word)
+    entry = _load_data().get(key)
+    matched_by = "grapheme"
+    
+    if entry is None:
+        entry, matched_by = _find_loose(key, True, match)
+    
+    if metrics is not None:
+        metrics.record_lookup(
+            key, matched_by if entry is not None else None, perf_counter_ns() - start
+        )
+    
+    if entry is not None:
+        return Resolution(entry, matched_by)
+    
+    if default is not _MISSING:
+        return default
+    
+    raise WordNotFound(f"Grapheme or alias not found in Ninolex-GH: {word!r}")
+
+
+def lookup_many(
+    words: Iterable[str],
+    default: Any = None,
+    return_stats: bool = False,
+    include_aliases: bool = False,
+    match: str = "exact",
+    fallback: Optional[str] = None,
+) -> Union[List[Any], Tuple[List[Any], Dict[str, int]]]:
+    """
+    Look up many words at once, returning results in input order.
+
+    Each distinct input string is normalized and resolved only once, and
+    misses are filled with ``default`` instead of raising, which makes this
+    considerably cheaper than calling lookup() in a loop and catching
+    WordNotFound for large token batches.
+
+    Args:
+        words: Iterable of graphemes to look up. Case-insensitive.
+        default: Value used for words that are not found (default None).
+        return_stats: If True, also return a summary dict.
+        include_aliases: Also match aliases when no grapheme matches.
+        match: Matching level, as for lookup().
+        fallback: "g2p" to fill misses with guessed entries, as for
+                  lookup(); they still count as misses in the stats.
+
+    Returns:
+        list: One result per input word (Entry or ``default``).
+
+        If ``return_stats`` is True, a ``(results, stats)`` tuple where
+        ``stats`` has the keys:
+            - total (int): Number of input words
+            - unique (int): Number of distinct input strings
+            - hits (int): Input words that resolved to an entry
+            - misses (int): Input words that did not resolve
+
+    Example:
+        >>> import ninolex_gh
+        >>> results, stats = ninolex_gh.lookup_many(
+        ...     ["Accra", "accra", "xyz"], return_stats=True
+        ... )
+        >>> [r["grapheme"] if r else None for r in results]
+        ['Accra', 'Accra', None]
+        >>> stats
+        {'total': 3, 'unique': 2, 'hits': 2, 'misses': 1}
+    """
+    metrics = _METRICS
+    if metrics is not None:
+        start = perf_counter_ns()
+    
+    _check_match(match)
+    _check_fallback(fallback)
+    mapping = _load_data()
+    get = mapping.get
+    aliases = _load_aliases() if include_aliases else {}
+    loose = match != "exact"
+    resolved: Dict[str, Any] = {}
+    by_alias: Set[str] = set()
+    misses: Dict[str, int] = {}
+    results = []
+    hits = 0
+    alias_hits = 0
+
+    for word in words:
+        try:
+            entry = resolved[word]
+        except KeyError:
+            key = _normalize_key(word)
+            entry = get(key, _MISSING)
+            if entry is _MISSING:
+                entry = aliases.get(key, _MISSING)
+                if entry is not _MISSING:
+                    by_alias.add(word)
+            if entry is _MISSING and loose:
+                entry, matched_by = _find_loose(key, include_aliases, match)
+                if entry is None:
+                    entry = _MISSING
+                elif matched_by == "alias":
+                    by_alias.add(word)
+            resolved[word] = entry
+
+        if entry is _MISSING:
+            if metrics is not None:
+                misses[word] = misses.get(word, 0) + 1
+            guessed = _guess_entry(word) if fallback is not None else None
+            results.append(default if guessed is None else guessed)
+        else:
+            results.append(entry)
+            hits += 1
+            if by_alias and word in by_alias:
+                alias_hits += 1
+
+    if metrics is not None:
+        metrics.record_batch(
+            len(results), hits, alias_hits, len(resolved), _missed_keys(misses),
+            perf_counter_ns() - start,
+        )
+
+    if not return_stats:
+        return results
+
+    stats = {
+        "total": len(results),
+        "unique": len(resolved),
+        "hits": hits,
+        "misses": len(results) - hits,
+    }
+    return results, stats
+
+
+def complete(
+    prefix: str,
+    limit: int = 20,
+    domain: Union[str, None] = None,
+) -> List[Entry]:
+    """
+    Return entries whose grapheme starts with ``prefix`` (type-ahead).
+    
+    Matching is case-insensitive and Unicode-normalized. Results are in
+    alphabetical order of the normalized grapheme. Each call is a binary
+    search into a sorted key array built once, so it costs O(log n + k)
+    for k results regardless of dictionary size.
+    
+    Args:
+        prefix: The text typed so far. An empty prefix matches everything.
+        limit: Maximum number of entries to return.
+        domain: Restrict completion to one domain (e.g. "places");
+                case-insensitive, as in query().
+    
+    Returns:
+        list[dict]: Up to ``limit`` matching entries.
+    
+    Example:
+        >>> import ninolex_gh
+        >>> [e["grapheme"] for e in ninolex_gh.complete("ablekuma")]
+        ['Ablekuma Central', 'Ablekuma North', 'Ablekuma West']
+        >>> [e["grapheme"] for e in ninolex_gh.complete("ac", domain="places")]
+        ['Accra']
+    """
+    # Only trim leading whitespace: a trailing space is part of the prefix
+    key = unicodedata.normalize("NFC", prefix).lstrip().lower()
+    
+    if domain is not None:
+        domain = _normalize_key(domain)
+    keys, entries = _load_prefixes().get(domain, ((), ()))
+    start = bisect_left(keys, key)
+    results = []
+    
+    for i in range(start, min(start + limit, len(keys))):
+        if not keys[i].startswith(key):
+            break
+        results.append(entries[i])
+    
+    return results
+
+
+def lookup_by_phoneme(ipa: str, loose: bool = False) -> List[Entry]:
+    """
+    Find the entries pronounced as ``ipa`` (reverse lookup).
+    
+    Useful for reconciling ASR or phoneme-level output with graphemes. All
+    entries sharing a pronunciation are returned, so the result doubles as
+    a homophone group.
+    
+    Args:
+        ipa: IPA transcription to look up. Unicode-normalized (NFC) and
+             whitespace-collapsed before matching.
+        loose: Ignore stress marks (ˈ ˌ), length marks (ː) and syllable
+               dots (.) on both sides, e.g. "watʃe" matches "ˈwa.tʃe".
+    
+    Returns:
+        list[Entry]: Matching entries in dictionary order (empty if none).
+    
+    Example:
+        >>> import ninolex_gh
+        >>> [e["grapheme"] for e in ninolex_gh.lookup_by_phoneme("ˈwa.tʃe")]
+        ['waakye']
+        >>> [e["grapheme"] for e in ninolex_gh.lookup_by_phoneme("watʃe", loose=True)]
+        ['waakye']
+    """
+    index = _load_phonemes(loose)
+    return list(index.get(_phoneme_key(ipa, loose), ()))
+
+
+def query(
+    domain: Union[str, None] = None,
+    category: Union[str, None] = None,
+    region: Union[str, None] = None,
+    city: Union[str, None] = None,
+) -> Iterator[Entry]:
+    """
+    Iterate over entries matching every given filter.
+    
+    Filters are case-insensitive exact matches on the field value; pass an
+    empty string to select entries where the field is blank. Omitted (None)
+    filters match everything.
+    
+    Each field has an inverted index built once on first use. A combined
+    filter walks only the shortest matching posting list and checks the
+    remaining filters on those entries, so the cost is proportional to the
+    most selective filter, not to the dictionary size. Results are produced
+    lazily, in dictionary order.
+    
+    Args:
+        domain: e.g. "places", "people", "education".
+        category: e.g. "constituency", "football_club", "shs".
+        region: e.g. "Greater Accra", "Ashanti".
+        city: e.g. "Kumasi", "Cape Coast".
+    
+    Returns:
+        Iterator[Entry]: Matching entries.
+    
+    Example:
+        >>> import ninolex_gh
+        >>> clubs = ninolex_gh.query(category="football_club", city="Kumasi")
+        >>> [e["grapheme"] for e in clubs]
+        ['Asante Kotoko', 'Nations FC']
+    """
+    facets = _load_facets()
+    entries = _RAW_ENTRIES
+    filters = [
+        (field, _normalize_key(value))
+        for field, value in zip(_FACET_FIELDS, (domain, category, region, city))
+        if value is not None
+    ]
+    
+    if not filters:
+        return iter(entries)
+    
+    # Drive the scan from the most selective filter
+    filters.sort(key=lambda f: len(facets[f[0]].get(f[1], ())))
+    (field, key), rest = filters[0], filters[1:]
+    
+    return _iter_query(facets[field].get(key, ()), rest)
+
+
 def get_entry_count() -> int:
     """
     Return the total number of entries in the dictionary.
@@ -227,3 +1671,441 @@ def list_graphemes() -> List[str]:
     
     # Return original graphemes from raw entries (preserves order and case)
     return [entry["grapheme"] for entry in _RAW_ENTRIES]
+
+
+def annotate(text: str) -> List[Match]:
+    """
+    Find every dictionary grapheme or alias mentioned in free text.
+
+    Matching is case-insensitive and Unicode-normalized, works across
+    multi-word entries ("Kwame Nkrumah", "Ablekuma Central") and prefers the
+    longest match at each position. Punctuation between words is ignored,
+    so "Presbyterian Boys' Secondary School" and "J. B. Danquah" are found
+    whether or not the apostrophe or dots are present.
+
+    The matcher is a token trie built once on first use; each call is a
+    single linear pass over the text.
+
+    Args:
+        text: The document to scan.
+
+    Returns:
+        list[Match]: Non-overlapping matches in document order. Each has
+        ``start``/``end`` offsets into ``text``, the matched ``text`` and the
+        resolved ``entry`` dict.
+
+    Example:
+        >>> import ninolex_gh
+        >>> [m.text for m in ninolex_gh.annotate("Kwame Nkrumah was born near Accra.")]
+        ['Kwame Nkrumah', 'Accra']
+        >>> ninolex_gh.annotate("Kotoko won")[0].entry["grapheme"]
+        'Asante Kotoko'
+    """
+    return list(_iter_matches(text))
+
+
+# ==============================================================================
+# LAYERED LEXICONS
+# ==============================================================================
+
+class _Overlay(NamedTuple):
+    """One parsed overlay file, as stacked by Lexicon."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    mapping: Dict[str, Entry]
+    aliases: Dict[str, Entry]
+    # Matching level -> (folded grapheme index, folded alias index)
+    folded: Dict[str, Tuple[Dict[str, Entry], Dict[str, Entry]]]
+
+
+def _fold_index(index: Dict[str, Entry], level: str) -> Dict[str, Entry]:
+    """Fold the keys of ``index`` for ``level``; the first key folded wins."""
+    folded: Dict[str, Entry] = {}
+    for key, entry in index.items():
+        folded.setdefault(_fold_key(key, level), entry)
+    return folded
+
+
+def _read_overlay_rows(path: Path) -> List[Mapping[str, Any]]:
+    """Read the raw rows of a CSV or JSON overlay file."""
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        # Same conventions as build_dictionary.py: BOM-tolerant, newline=""
+        with path.open(encoding="utf-8-sig", newline="") as f:
+            return list(csv.DictReader(f))
+    if suffix == ".json":
+        with path.open(encoding="utf-8") as f:
+            rows = json.load(f)
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise NinolexError(f"Overlay must be a JSON array of entry objects: {path}")
+        return rows
+    raise NinolexError(f"Unsupported overlay format {suffix!r} (expected .csv or .json): {path}")
+
+
+def _load_overlay(path: Path) -> _Overlay:
+    """
+    Parse an overlay file into its own small grapheme and alias indexes.
+
+    Rows use the source CSV schema of build_dictionary.py (grapheme,
+    phoneme, category, region, city, alias, notes) or the unified JSON
+    schema; rows without a grapheme or phoneme are skipped, and ``domain``
+    defaults to "overlay". As with the bundled data, a later row with the
+    same normalized grapheme replaces an earlier one. Overlays are small,
+    so the folded indexes of every matching level are built up front.
+    """
+    # Stat before reading: a write that lands mid-read bumps the mtime
+    # again and is picked up by the next check
+    stat = path.stat()
+    source_file = str(path)
+    entries = []
+    for row in _read_overlay_rows(path):
+        fields = {
+            field: str(row.get(field) or "").strip()
+            for field in ("grapheme", "phoneme", "domain", "category",
+                          "region", "city", "alias", "notes")
+        }
+        if not fields["grapheme"] or not fields["phoneme"]:
+            continue
+        fields["domain"] = fields["domain"] or "overlay"
+        entries.append(Entry(source_file=source_file, **fields))
+
+    mapping = {_normalize_key(entry["grapheme"]): entry for entry in entries}
+    aliases = _build_alias_index(entries)
+    return _Overlay(
+        path=path,
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        mapping=mapping,
+        aliases=aliases,
+        folded={
+            level: (_fold_index(mapping, level), _fold_index(aliases, level))
+            for level in _MATCH_LEVELS[1:]
+        },
+    )
+
+
+class Lexicon:
+    """
+    The bundled dictionary with private overlay files stacked on top.
+
+    Overlays are CSV files in the source schema used by
+    ``build/build_dictionary.py`` or JSON arrays of entries. They are listed
+    highest precedence first: a word is looked up in each overlay in turn
+    and then in the bundled dictionary, so an overlay entry overrides a
+    bundled entry with the same grapheme and otherwise extends the
+    dictionary. As everywhere else, graphemes in any layer take precedence
+    over aliases.
+
+    Each overlay is held as its own small index; the bundled data is the
+    process-wide cache used by lookup(), so any number of Lexicon
+    instances (one per tenant, say) share a single copy of it.
+
+    Hot reload:
+        At most once every ``reload_interval`` seconds a lookup stats the
+        overlay files, and any whose modification time or size changed is
+        re-read. The new overlays are built on the side and swapped in
+        with a single reference assignment, so in-flight lookups never
+        wait and always see either the old or the new set. If a changed
+        file cannot be read, the previous version stays in use, a
+        RuntimeWarning is issued and the error is kept in ``last_error``.
+        Replace overlay files atomically (write a temporary file, then
+        ``os.replace()``) so a half-written file is never read.
+        ``reload_interval=None`` disables automatic checks; call reload()
+        instead.
+
+    Args:
+        overlays: Paths of overlay files, highest precedence first.
+        reload_interval: Seconds between modification checks, or None.
+
+    Raises:
+        NinolexError: If an overlay has an unsupported format.
+        OSError: If an overlay cannot be read.
+
+    Example:
+        >>> import ninolex_gh
+        >>> tenant = ninolex_gh.Lexicon(["acme_brands.csv", "acme_staff.json"])
+        >>> tenant.lookup("Acmefon")["phoneme"]        # from an overlay
+        'ˈak.mɪ.fɔn'
+        >>> tenant.lookup("Kumasi")["phoneme"]         # from the bundled data
+        'kuˈmɑːsi'
+    """
+
+    def __init__(
+        self,
+        overlays: Iterable[Union[str, "os.PathLike[str]"]] = (),
+        reload_interval: Optional[float] = 1.0,
+    ) -> None:
+        self.reload_interval = reload_interval
+        self.last_error: Optional[Exception] = None
+        self._reload_lock = threading.Lock()
+        self._layers: Tuple[_Overlay, ...] = tuple(_load_overlay(Path(p)) for p in overlays)
+        self._next_check = monotonic() + (reload_interval or 0.0)
+
+    def __repr__(self) -> str:
+        paths = ", ".join(repr(str(path)) for path in self.overlays)
+        return f"Lexicon([{paths}])"
+
+    @property
+    def overlays(self) -> Tuple[Path, ...]:
+        """Overlay file paths, highest precedence first."""
+        return tuple(layer.path for layer in self._layers)
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Re-read overlays whose modification time or size changed.
+
+        Args:
+            force: Re-read every overlay, changed or not.
+
+        Returns:
+            bool: True if any overlay was re-read.
+
+        Raises:
+            NinolexError, OSError, ValueError: If a changed overlay cannot
+            be read; the current overlays then stay in use.
+        """
+        with self._reload_lock:
+            return self._reload(force)
+
+    def _reload(self, force: bool) -> bool:
+        """Swap in re-read overlays; the caller holds _reload_lock."""
+        self._next_check = monotonic() + (self.reload_interval or 0.0)
+        layers = []
+        changed = False
+        for layer in self._layers:
+            stat = layer.path.stat()
+            if force or (stat.st_mtime_ns, stat.st_size) != (layer.mtime_ns, layer.size):
+                layer = _load_overlay(layer.path)
+                changed = True
+            layers.append(layer)
+
+        if changed:
+            self._layers = tuple(layers)
+        return changed
+
+    def _current(self) -> Tuple[_Overlay, ...]:
+        """Return the overlays to use, reloading changed files when due."""
+        if self.reload_interval is not None and monotonic() >= self._next_check:
+            # Only one thread checks; the others keep using the current layers
+            if self._reload_lock.acquire(blocking=False):
+                try:
+                    self._reload(False)
+                except (OSError, ValueError, NinolexError) as e:
+                    self.last_error = e
+                    warnings.warn(
+                        f"Keeping previous Ninolex-GH overlays; reload failed: {e}",
+                        RuntimeWarning,
+                        stacklevel=2,
+                    )
+                finally:
+                    self._reload_lock.release()
+        return self._layers
+
+    def _find(
+        self, key: str, include_aliases: bool, match: str
+    ) -> Tuple[Optional[Entry], str]:
+        """Resolve a normalized key through the layers: ``(entry, matched_by)``."""
+        layers = self._current()
+        for layer in layers:
+            entry = layer.mapping.get(key)
+            if entry is not None:
+                return entry, "grapheme"
+
+        entry = _load_data().get(key)
+        if entry is not None:
+            return entry, "grapheme"
+        return self._find_loose(layers, key, include_aliases, match)
+
+    @staticmethod
+    def _find_loose(
+        layers: Tuple[_Overlay, ...], key: str, include_aliases: bool, match: str
+    ) -> Tuple[Optional[Entry], str]:
+        """
+        Resolve a normalized key that is not an exact grapheme in any
+        layer, in the order of the module-level _find_loose(): exact
+        alias, folded grapheme, folded alias. At each step the overlays
+        are consulted before the bundled data.
+        """
+        if include_aliases:
+            for layer in layers:
+                entry = layer.aliases.get(key)
+                if entry is not None:
+                    return entry, "alias"
+            entry = _load_aliases().get(key)
+            if entry is not None:
+                return entry, "alias"
+
+        if match == "exact":
+            return None, "grapheme"
+
+        folded = _fold_key(key, match)
+        for layer in layers:
+            entry = layer.folded[match][0].get(folded)
+            if entry is not None:
+                return entry, "grapheme"
+        graphemes, aliases = _load_folded(match)
+        entry = graphemes.get(folded)
+        if entry is not None or not include_aliases:
+            return entry, "grapheme"
+
+        for layer in layers:
+            entry = layer.folded[match][1].get(folded)
+            if entry is not None:
+                return entry, "alias"
+        return aliases.get(folded), "alias"
+
+    def lookup(
+        self,
+        word: str,
+        default: Any = _MISSING,
+        include_aliases: bool = False,
+        match: str = "exact",
+        fallback: Optional[str] = None,
+    ) -> Entry:
+        """
+        Look up a word in the overlays, then the bundled dictionary.
+
+        Same arguments, return value and exceptions as the module-level
+        lookup(). Looser matching levels fold the overlay keys too, and
+        an exact match in any layer beats a folded one.
+        """
+        metrics = _METRICS
+        if metrics is not None:
+            start = perf_counter_ns()
+
+        if match != "exact":
+            _check_match(match)
+        if fallback is not None:
+            _check_fallback(fallback)
+
+        key = _normalize_key(word)
+        entry, matched_by = self._find(key, include_aliases, match)
+
+        if metrics is not None:
+            metrics.record_lookup(
+                key, matched_by if entry is not None else None, perf_counter_ns() - start
+            )
+
+        if entry is not None:
+            return entry
+        if fallback is not None:
+            entry = _guess_entry(word)
+            if entry is not None:
+                return entry
+        if default is not _MISSING:
+            return default
+        raise WordNotFound(f"Grapheme not found in Ninolex-GH: {word!r}")
+
+    def resolve(
+        self, word: str, default: Any = _MISSING, match: str = "exact"
+    ) -> Resolution:
+        """
+        Look up a word by grapheme or alias through every layer.
+
+        Same arguments, return value and exceptions as the module-level
+        resolve().
+        """
+        metrics = _METRICS
+        if metrics is not None:
+            start = perf_counter_ns()
+
+        if match != "exact":
+            _check_match(match)
+
+        key = _normalize_key(word)
+        entry, matched_by = self._find(key, True, match)
+
+        if metrics is not None:
+            metrics.record_lookup(
+                key, matched_by if entry is not None else None, perf_counter_ns() - start
+            )
+
+        if entry is not None:
+            return Resolution(entry, matched_by)
+        if default is not _MISSING:
+            return default
+        raise WordNotFound(f"Grapheme or alias not found in Ninolex-GH: {word!r}")
+
+    def lookup_many(
+        self,
+        words: Iterable[str],
+        default: Any = None,
+        return_stats: bool = False,
+        include_aliases: bool = False,
+        match: str = "exact",
+        fallback: Optional[str] = None,
+    ) -> Union[List[Any], Tuple[List[Any], Dict[str, int]]]:
+        """
+        Look up many words, returning results in input order.
+
+        Same arguments and return value as the module-level lookup_many().
+        The overlays are checked for changes at most once per call, so a
+        batch never mixes two versions of an overlay.
+        """
+        metrics = _METRICS
+        if metrics is not None:
+            start = perf_counter_ns()
+
+        _check_match(match)
+        _check_fallback(fallback)
+        layers = self._current()
+        mapping = _load_data()
+        loose = include_aliases or match != "exact"
+        resolved: Dict[str, Any] = {}
+        by_alias: Set[str] = set()
+        misses: Dict[str, int] = {}
+        results = []
+        hits = 0
+        alias_hits = 0
+
+        for word in words:
+            try:
+                entry = resolved[word]
+            except KeyError:
+                key = _normalize_key(word)
+                entry = _MISSING
+                for layer in layers:
+                    entry = layer.mapping.get(key, _MISSING)
+                    if entry is not _MISSING:
+                        break
+                else:
+                    entry = mapping.get(key, _MISSING)
+                    if entry is _MISSING and loose:
+                        found, matched_by = self._find_loose(
+                            layers, key, include_aliases, match
+                        )
+                        if found is not None:
+                            entry = found
+                            if matched_by == "alias":
+                                by_alias.add(word)
+                resolved[word] = entry
+
+            if entry is _MISSING:
+                if metrics is not None:
+                    misses[word] = misses.get(word, 0) + 1
+                guessed = _guess_entry(word) if fallback is not None else None
+                results.append(default if guessed is None else guessed)
+            else:
+                results.append(entry)
+                hits += 1
+                if by_alias and word in by_alias:
+                    alias_hits += 1
+
+        if metrics is not None:
+            metrics.record_batch(
+                len(results), hits, alias_hits, len(resolved), _missed_keys(misses),
+                perf_counter_ns() - start,
+            )
+
+        if not return_stats:
+            return results
+
+        stats = {
+            "total": len(results),
+            "unique": len(resolved),
+            "hits": hits,
+            "misses": len(results) - hits,
+        }
+        return results, stats
@@ -0,0 +1,113 @@
+"""
+Ninolex-GH Entry Type
+=====================
+
+Immutable record type for dictionary entries.
+
+Entries used to be plain dicts shared with every caller, so a caller that
+mutated one corrupted the cache for the whole process. Entry is a frozen,
+``__slots__``-based record instead:
+
+    - Read-only: assigning or deleting a field raises AttributeError
+    - Compact: no per-instance ``__dict__``, and the categorical fields
+      (domain, category, region, city, source_file) are interned so each
+      distinct value is stored once across the whole lexicon
+    - Dict-compatible: it is a read-only Mapping, so ``entry["phoneme"]``,
+      ``entry.get("alias")``, ``dict(entry)`` and comparison with dicts keep
+      working; ``entry.to_dict()`` returns a mutable copy
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+
+# Entry fields, in canonical order (matches DICTIONARY_FIELDS in the build)
+FIELDS = (
+    "grapheme",
+    "phoneme",
+    "domain",
+    "category",
+    "region",
+    "city",
+    "alias",
+    "notes",
+    "source_file",
+)
+
+_FIELD_SET = frozenset(FIELDS)
+
+# Low-cardinality fields whose values are interned on construction
+INTERNED_FIELDS = frozenset({"domain", "category", "region", "city", "source_file"})
+
+
+class Entry(Mapping):
+    """
+    An immutable dictionary entry.
+
+    Fields are available as attributes (``entry.phoneme``) and, for
+    compatibility with the original dict entries, as keys
+    (``entry["phoneme"]``).
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(
+        self,
+        grapheme: str,
+        phoneme: str,
+        domain: str = "",
+        category: str = "",
+        region: str = "",
+        city: str = "",
+        alias: str = "",
+        notes: str = "",
+        source_file: str = "",
+    ) -> None:
+        init = object.__setattr__
+        init(self, "grapheme", grapheme)
+        init(self, "phoneme", phoneme)
+        init(self, "domain", sys.intern(domain))
+        init(self, "category", sys.intern(category))
+        init(self, "region", sys.intern(region))
+        init(self, "city", sys.intern(city))
+        init(self, "alias", alias)
+        init(self, "notes", notes)
+        init(self, "source_file", sys.intern(source_file))
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Entry":
+        """Build an entry from a dict with the keys in FIELDS."""
+        return cls(*(data.get(field, "") for field in FIELDS))
+
+    def to_dict(self) -> Dict[str, str]:
+        """Return the entry as a new, mutable dict."""
+        return {field: getattr(self, field) for field in FIELDS}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Entry is immutable; cannot set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Entry is immutable; cannot delete {name!r}")
+
+    def __reduce__(self):
+        return (Entry, tuple(getattr(self, field) for field in FIELDS))
+
+    def __getitem__(self, key: str) -> str:
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, field) for field in FIELDS))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in FIELDS)
+        return f"Entry({fields})"
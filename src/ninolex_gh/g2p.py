@@ -0,0 +1,255 @@
+"""
+Ninolex-GH Spelling-to-IPA Guesser
+==================================
+
+Rule-based grapheme-to-phoneme (G2P) fallback for names that are not in the
+dictionary, so speech synthesis can read an unseen "Dzigbordi" or
+"Nkrumah" with Ghanaian rather than English spelling rules.
+
+The rules follow the conventions of IPA_GUIDE.md for Akan, Ewe and Ga
+orthography (dz → dʒ, ky → tʃ, gy → dʒ, ny → ɲ, kp → k͡p, gb → ɡ͡b, ...).
+They live in the RULES table, compiled on first use (not at import) into
+one regular expression per first letter, so each word is converted in a
+single left-to-right scan that costs a dict lookup and one anchored match
+per spelling unit. Primary stress is placed on the penultimate syllable,
+which suits most Akan names.
+Output uses only the characters of ``ninolex_gh.ipa.ALLOWED_CHARS`` and
+passes the labial-velar tie-bar check.
+
+This is a guess, not a transcription: the ATR vowel contrast and tone are
+not written in these orthographies, so e/ɛ and o/ɔ are read as written.
+Results are kept in a bounded LRU cache, so repeated misses in a
+synthesis path cost a dict lookup.
+
+Example:
+    >>> from ninolex_gh import guess
+    >>> guess("Dzigbordi")
+    'dʒiˈɡ͡bɔːdi'
+    >>> guess("Nkrumah")
+    'ŋˈkruma'
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Distinct normalized words whose guesses are kept
+CACHE_SIZE = 4096
+
+_VOWEL_LETTERS = "aeiouɛɔ"
+_BEFORE_VOWEL = f"(?=[{_VOWEL_LETTERS}])"
+_NOT_BEFORE_VOWEL = f"(?![{_VOWEL_LETTERS}])"
+
+# Ordered (pattern, IPA) rules over lowercased spelling with tone marks
+# removed. Patterns are regular expressions that start with a literal
+# letter and have no capturing groups; at each position the first rule
+# that matches wins, so longer spellings come before their prefixes. An
+# IPA of None copies the letter. Letters no rule matches are dropped.
+RULES: Tuple[Tuple[str, Optional[str]], ...] = (
+    # Labial-velars, written with a tie-bar (IPA_GUIDE.md)
+    ("kp", "k͡p"),
+    ("gb", "ɡ͡b"),
+    ("ŋm", "ŋ͡m"),
+    # Affricates and palatals: Dzifa, Kyebi, Agyeman, Adjei, Sunyani
+    ("dz", "dʒ"),
+    ("dj", "dʒ"),
+    ("ky", "tʃ"),
+    ("gy", "dʒ"),
+    ("ch", "tʃ"),
+    ("j", "dʒ"),
+    ("hy", "ʃ"),
+    ("sh", "ʃ"),
+    ("ny", "ɲ"),
+    # Akan labialized affricates: Adwoa, Twi
+    ("dwoa", "dʒwa"),
+    ("dw", "dʒw"),
+    ("tw", "tʃw"),
+    # Velar nasal: Agyemang, Bolgatanga, Nkrumah, Danquah
+    ("ng" + _BEFORE_VOWEL, "ŋɡ"),
+    ("ng", "ŋ"),
+    ("n(?=[kgq])", "ŋ"),
+    ("qu", "kw"),
+    # Other digraphs
+    ("gh", "ɡ"),
+    ("ph", "f"),
+    ("th", "t"),
+    ("ck", "k"),
+    # Silent final h: Mensah, Asamoah
+    ("h$", ""),
+    # Long vowels and diphthongs: Naa, Nii, Dedei, Yaw, Dzigbordi, Zanetor
+    ("aa", "aː"),
+    ("ee", "eː"),
+    ("ii", "iː"),
+    ("oo", "oː"),
+    ("uu", "uː"),
+    ("ɛɛ", "ɛː"),
+    ("ɔɔ", "ɔː"),
+    ("ei", "eɪ"),
+    ("ey$", "e"),
+    ("aw" + _NOT_BEFORE_VOWEL, "aʊ"),
+    ("oa", "wa"),
+    ("or" + _NOT_BEFORE_VOWEL, "ɔː"),
+    ("ar" + _NOT_BEFORE_VOWEL, "aː"),
+    # Single letters
+    ("a", "a"),
+    ("e", "e"),
+    ("i", "i"),
+    ("o", "o"),
+    ("u", "u"),
+    ("ɛ", "ɛ"),
+    ("ɔ", "ɔ"),
+    ("y" + _BEFORE_VOWEL, "j"),
+    ("y", "i"),
+    ("c", "k"),
+    ("q", "k"),
+    ("g", "ɡ"),
+    ("ɖ", "d"),
+    ("ƒ", "f"),
+    ("ʋ", "v"),
+    ("ɣ", "ɡ"),
+    ("ŋ", "ŋ"),
+    ("x", "x"),
+    *((letter, None) for letter in "bdfhklmnprstvwz"),
+    # Nasalized vowels keep their tilde
+    ("\u0303", "\u0303"),
+)
+
+
+
+def _compile_rules(
+    rules: Tuple[Tuple[str, Optional[str]], ...]
+) -> Dict[str, Tuple["re.Pattern[str]", Tuple[Optional[str], ...]]]:
+    """
+    Group rules by first letter, each group compiled to one alternation.
+
+    Returns ``{letter: (regex, outputs)}``, where group ``i`` of ``regex``
+    is the rule whose IPA is ``outputs[i]``.
+    """
+    grouped: Dict[str, List[Tuple[str, Optional[str]]]] = {}
+    for pattern, ipa in rules:
+        grouped.setdefault(pattern[0], []).append((pattern, ipa))
+    return {
+        letter: (
+            re.compile("|".join(f"({pattern})" for pattern, _ in group)),
+            (None,) + tuple(letter if ipa is None else ipa for _, ipa in group),
+        )
+        for letter, group in grouped.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _rules_by_letter() -> Dict[str, Tuple["re.Pattern[str]", Tuple[Optional[str], ...]]]:
+    """RULES compiled by _compile_rules(), on first use."""
+    return _compile_rules(RULES)
+
+
+# Doubled consonant letters are read once: Akuffo, Addo, Winneba
+_GEMINATE_RE = re.compile(r"([bcdfghjklmnpqrstvwxz])\1")
+
+# Vowel letters of syllable nuclei, consonants that may follow another
+# consonant within an onset (Nkrumah, Agbogbloshie), and syllabic nasals
+_VOWELS = frozenset(_VOWEL_LETTERS)
+_ONSET_SECONDS = frozenset("rlwj")
+_NASALS = frozenset("mnŋ")
+
+# Word boundaries: anything but letters and the tilde
+_WORD_RE = re.compile("[^\\W\\d_]+(?:\u0303[^\\W\\d_]*)*")
+
+# Tie-bar safety net for k/p and ɡ/b produced by separate rules
+_UNTIED = (("kp", "k͡p"), ("ɡb", "ɡ͡b"))
+
+
+def _units(word: str) -> List[str]:
+    """Convert one lowercased word to IPA units, one per matched rule."""
+    if _GEMINATE_RE.search(word):
+        word = _GEMINATE_RE.sub(r"\1", word)
+    rules_by_letter = _rules_by_letter()
+    units = []
+    pos = 0
+    end = len(word)
+    while pos < end:
+        rules = rules_by_letter.get(word[pos])
+        m = rules[0].match(word, pos) if rules is not None else None
+        if m is None:
+            pos += 1
+            continue
+        ipa = rules[1][m.lastindex]
+        if ipa:
+            units.append(ipa)
+        pos = m.end()
+    return units
+
+
+def _stress(units: List[str]) -> str:
+    """
+    Join IPA units, marking primary stress on the penultimate syllable.
+
+    Each unit containing a vowel is a syllable nucleus. The stress mark
+    goes before its onset: all consonants after the previous nucleus when
+    there is at most one, otherwise the last consonant together with the
+    one before it when the last is r, l, w or j. A word-initial nasal
+    before a consonant (Nkrumah, Mpraeso) is left outside the onset.
+    Monosyllables are left unmarked.
+    """
+    nuclei = [i for i, unit in enumerate(units) if not _VOWELS.isdisjoint(unit)]
+    if len(nuclei) < 2:
+        return "".join(units)
+
+    nucleus = nuclei[-2]
+    previous = nuclei[-3] if len(nuclei) > 2 else -1
+    onset = nucleus
+    if previous == -1:
+        onset = 1 if units[0] in _NASALS and _VOWELS.isdisjoint(units[1]) else 0
+    elif nucleus - previous > 1:
+        onset = nucleus - 1
+        if (
+            nucleus - previous > 2
+            and units[onset] in _ONSET_SECONDS
+            and units[onset - 1][0] not in _ONSET_SECONDS
+        ):
+            onset -= 1
+    return "".join(units[:onset]) + "ˈ" + "".join(units[onset:])
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _guess_key(key: str) -> str:
+    """Guess the IPA for a lowercased, stripped string (cached)."""
+    if not key.isascii():
+        # Drop tone and other marks, keeping the nasalization tilde
+        key = "".join(
+            c for c in unicodedata.normalize("NFD", key)
+            if c == "\u0303" or not unicodedata.combining(c)
+        )
+    words = (_stress(_units(word)) for word in _WORD_RE.findall(key))
+    ipa = " ".join(word for word in words if word)
+    for untied, tied in _UNTIED:
+        if untied in ipa:
+            ipa = ipa.replace(untied, tied)
+    return ipa
+
+
+def guess(word: str) -> str:
+    """
+    Guess an IPA transcription from the spelling of a Ghanaian name.
+
+    Akan, Ewe and Ga spelling rules (see RULES) are applied to each word;
+    punctuation and digits are ignored, and hyphens and spaces separate
+    words. Results are cached for the CACHE_SIZE most recently used
+    distinct inputs.
+
+    Args:
+        word: A word or multi-word name, in any case.
+
+    Returns:
+        str: An IPA string using only ``ninolex_gh.ipa.ALLOWED_CHARS``, or
+        an empty string if the input contains no letters.
+
+    Example:
+        >>> from ninolex_gh import guess
+        >>> guess("Kpando")
+        'ˈk͡pando'
+    """
+    return _guess_key(word.strip().lower())
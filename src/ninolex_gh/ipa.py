@@ -0,0 +1,233 @@
+"""
+Ninolex-GH IPA Validation
+=========================
+
+The approved IPA character set and a validation engine for phoneme strings.
+
+This is the engine behind ``tests/validate_ipa.py`` and can be imported to
+check other data (e.g. private dictionary extensions) against the same
+rules:
+
+    - Character validation against the approved IPA subset
+    - Tie-bar check for labial-velars (kp, gb should use k͡p, ɡ͡b)
+    - Stress marker validation (no ASCII apostrophe allowed)
+
+Each phoneme is checked with one precompiled character-class regex and one
+labial-velar regex, and large entry lists are validated in chunks across a
+process pool.
+
+Example:
+    >>> from ninolex_gh.ipa import validate_phoneme
+    >>> validate_phoneme("ˈakra")
+    set()
+    >>> validate_phoneme("'akra")
+    {"'"}
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+# ==============================================================================
+# ALLOWED IPA CHARACTER SET FOR NINOLEX-GH
+# ==============================================================================
+# This defines the subset of IPA symbols approved for Ghanaian English
+# transcriptions. See IPA_GUIDE.md for full conventions.
+
+# Vowels (monophthongs and common diphthong components)
+# Includes ɒ (U+0252) and ɜ (U+025C) for British English-influenced Ghanaian pronunciations
+VOWELS = frozenset("aeiouɪʊɛɔəɑæʌɒɜ")
+
+# Long vowel marker
+LENGTH = frozenset("ː")
+
+# Consonants
+CONSONANTS = frozenset(
+    "bdfghjklmnpqrstvwxyzŋʃʒθðɲɾʔ"
+)
+
+# Affricates and special consonants (individual characters)
+# tʃ, dʒ, tɕ, dʑ are composed of these
+AFFRICATE_PARTS = frozenset("tɕdʑ")
+
+# Labial-velars (k͡p, ɡ͡b) - component characters
+# Tie bars: ͡ (U+0361) and ͜ (U+035C) join them
+# Also include both 'g' (U+0067) and 'ɡ' (U+0261) for flexibility
+TIE_BARS = frozenset("͜͡")
+LABIAL_VELAR_PARTS = frozenset("ɡ") | TIE_BARS
+
+# Stress and prosody markers
+# ˈ (U+02C8) - primary stress
+# ˌ (U+02CC) - secondary stress
+# NOTE: ASCII apostrophe ' (U+0027) is NOT allowed
+STRESS_MARKERS = frozenset("ˈˌ")
+
+# Syllable separators and spacing
+SEPARATORS = frozenset(". -")
+
+# Nasalization and other diacritics
+# Including syllabic marker ̩ (U+0329) for syllabic consonants like n̩
+DIACRITICS = frozenset("̩̃̀́̂̄")  # combining tilde, accents, syllabic marker
+
+# Whitespace (for multi-word entries)
+WHITESPACE = frozenset(" ")
+
+# Combine all allowed characters
+ALLOWED_CHARS = (
+    VOWELS
+    | LENGTH
+    | CONSONANTS
+    | AFFRICATE_PARTS
+    | LABIAL_VELAR_PARTS
+    | STRESS_MARKERS
+    | SEPARATORS
+    | DIACRITICS
+    | WHITESPACE
+)
+
+# ==============================================================================
+# FORBIDDEN CHARACTERS
+# ==============================================================================
+# These characters are explicitly forbidden and should trigger errors
+
+# ASCII apostrophe - often mistakenly used instead of IPA stress marker
+FORBIDDEN_CHARS = frozenset("'")  # U+0027
+
+# Any character outside the approved set (forbidden characters included)
+_INVALID_RE = re.compile(
+    "[^" + "".join(re.escape(c) for c in sorted(ALLOWED_CHARS - FORBIDDEN_CHARS)) + "]"
+)
+
+# kp / gb written as two segments, i.e. without a tie-bar between them
+_UNTIED_RE = re.compile("kp|[gɡ]b")
+_UNTIED_KP = "'kp' without tie-bar (should be 'k͡p' or 'k͜p')"
+_UNTIED_GB = "'gb' without tie-bar (should be 'ɡ͡b' or 'g͡b')"
+
+# Entries per chunk when validating in a process pool
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def validate_phoneme(phoneme: str) -> Set[str]:
+    """
+    Check if a phoneme string contains only allowed characters.
+
+    Args:
+        phoneme: An IPA transcription.
+
+    Returns:
+        set[str]: The invalid characters found, or an empty set if valid.
+    """
+    return set(_INVALID_RE.findall(phoneme))
+
+
+def check_tiebar_labial_velars(phoneme: str) -> List[str]:
+    """
+    Check for labial-velar sequences (kp, gb) that lack a tie-bar.
+
+    Proper forms: k͡p, k͜p, ɡ͡b, g͡b, ɡ͜b, g͜b
+    Suspicious forms: kp, gb (without tie-bar between them)
+
+    Args:
+        phoneme: An IPA transcription.
+
+    Returns:
+        list[str]: Descriptions of the suspicious sequences found, or an
+        empty list if clean.
+    """
+    # First letter of each untied pair: "k", "g" or "ɡ"
+    untied = {match.group()[0] for match in _UNTIED_RE.finditer(phoneme)}
+    issues: List[str] = []
+    if "k" in untied:
+        issues.append(_UNTIED_KP)
+    if untied - {"k"}:
+        issues.append(_UNTIED_GB)
+    return issues
+
+
+def _validate_chunk(
+    chunk: List[Tuple[str, str, str]],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Validate (grapheme, phoneme, source_file) rows; return (errors, warnings)."""
+    errors = []
+    warnings = []
+    invalid_search = _INVALID_RE.search
+    untied_search = _UNTIED_RE.search
+
+    for grapheme, phoneme, source_file in chunk:
+        # Fast path: one regex scan each for the (usual) clean phoneme
+        if invalid_search(phoneme):
+            errors.append({
+                "grapheme": grapheme,
+                "phoneme": phoneme,
+                "invalid_chars": sorted(validate_phoneme(phoneme)),
+                "source_file": source_file,
+            })
+        if untied_search(phoneme):
+            warnings.append({
+                "grapheme": grapheme,
+                "phoneme": phoneme,
+                "issues": check_tiebar_labial_velars(phoneme),
+                "source_file": source_file,
+            })
+
+    return errors, warnings
+
+
+def validate_entries(
+    entries: Iterable[Mapping],
+    jobs: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """
+    Validate the phonemes of many dictionary entries.
+
+    Entries are split into chunks of ``chunk_size``; when there is more than
+    one chunk and more than one job, chunks are validated in a process pool.
+    Results keep the input order either way.
+
+    Args:
+        entries: Entries (or dicts) with ``grapheme``, ``phoneme`` and
+            optionally ``source_file``.
+        jobs: Worker processes (default: CPU count; 1 disables the pool).
+        chunk_size: Entries per chunk.
+
+    Returns:
+        dict: A JSON-serializable report::
+
+            {
+                "entries": int,
+                "errors": [{"grapheme", "phoneme", "invalid_chars", "source_file"}],
+                "warnings": [{"grapheme", "phoneme", "issues", "source_file"}],
+            }
+
+        Character errors make a dictionary invalid; tie-bar warnings are
+        advisory.
+    """
+    rows = [
+        (
+            entry.get("grapheme", ""),
+            entry.get("phoneme", ""),
+            entry.get("source_file", "") or "unknown",
+        )
+        for entry in entries
+    ]
+    chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+    jobs = min(jobs or os.cpu_count() or 1, len(chunks))
+
+    if jobs <= 1:
+        results = [_validate_chunk(chunk) for chunk in chunks]
+    else:
+        # Imported here: it loads multiprocessing, which `import ninolex_gh`
+        # should not pay for
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_validate_chunk, chunks))
+
+    report: Dict[str, Any] = {"entries": len(rows), "errors": [], "warnings": []}
+    for errors, warnings in results:
+        report["errors"].extend(errors)
+        report["warnings"].extend(warnings)
+    return report
@@ -0,0 +1,224 @@
+"""
+Ninolex-GH Metrics
+==================
+
+Opt-in instrumentation for dictionary lookups.
+
+When enabled (``ninolex_gh.enable_metrics()`` or ``NINOLEX_GH_METRICS=1``)
+core records into a single Metrics instance:
+
+    - Counters: lookups, hits (by grapheme or alias), misses and key
+      normalizations
+    - Latency histograms for single lookups, lookup_many() batches and
+      dictionary loads, with fixed power-of-two buckets so recording is a
+      bisect and an increment. Batches get their own histogram so a large
+      batch does not read as one slow lookup
+    - A bounded Space-Saving sketch of missed keys, so the most frequent
+      misses (the entries most worth adding) can be reported without
+      keeping every miss
+
+When disabled core holds no Metrics instance and each instrumented call
+pays a single ``is None`` test.
+
+Updates are not locked; under heavy multi-threaded use counts are
+approximate, which is acceptable for monitoring.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional
+
+# Histogram bucket upper bounds in nanoseconds: 256 ns, 512 ns, ... ~34 s.
+# Anything slower falls into a final overflow bucket.
+BUCKET_BOUNDS_NS = tuple(1 << shift for shift in range(8, 36))
+
+# Missed keys tracked by default; see MissSketch
+DEFAULT_MISS_CAPACITY = 1000
+
+
+def _format_ns(ns: int) -> str:
+    """Short human-readable label for a bucket bound ("512ns", "4.1us", "8.39ms")."""
+    for unit, scale in (("s", 10**9), ("ms", 10**6), ("us", 10**3)):
+        if ns >= scale:
+            return f"{ns / scale:.3g}{unit}"
+    return f"{ns}ns"
+
+
+class Histogram:
+    """Latency histogram over BUCKET_BOUNDS_NS."""
+
+    __slots__ = ("counts", "count", "total_ns", "max_ns")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKET_BOUNDS_NS) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns: int) -> None:
+        self.counts[bisect_left(BUCKET_BOUNDS_NS, ns)] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentile(self, fraction: float) -> int:
+        """
+        Upper bound (ns) of the bucket holding the given fraction of samples,
+        capped at the largest sample seen.
+        """
+        if not self.count:
+            return 0
+        rank = fraction * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                if i < len(BUCKET_BOUNDS_NS):
+                    return min(BUCKET_BOUNDS_NS[i], self.max_ns)
+                break
+        return self.max_ns
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / self.count / 1e3 if self.count else 0.0,
+            "p50_us": self.percentile(0.50) / 1e3,
+            "p90_us": self.percentile(0.90) / 1e3,
+            "p99_us": self.percentile(0.99) / 1e3,
+            "max_us": self.max_ns / 1e3,
+            "buckets": {
+                ("<=" + _format_ns(BUCKET_BOUNDS_NS[i]) if i < len(BUCKET_BOUNDS_NS)
+                 else ">" + _format_ns(BUCKET_BOUNDS_NS[-1])): n
+                for i, n in enumerate(self.counts) if n
+            },
+        }
+
+
+class MissSketch:
+    """
+    Bounded frequency sketch of missed keys (Space-Saving).
+
+    At most ``capacity`` keys are tracked. When a new key arrives and the
+    sketch is full, it is pruned back to the ``capacity // 2`` most frequent
+    keys, and later new keys start from the largest pruned count. A key's
+    reported count therefore never underestimates its true count and
+    overestimates it by at most its ``error``, and frequent misses stay
+    tracked while one-off misses are evicted. Pruning in batches keeps the amortized cost per miss at O(log capacity).
+    """
+
+    __slots__ = ("capacity", "counts", "errors", "floor")
+
+    def __init__(self, capacity: int = DEFAULT_MISS_CAPACITY) -> None:
+        if capacity < 2:
+            raise ValueError("miss sketch capacity must be at least 2")
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.floor = 0
+
+    def add(self, key: str, n: int = 1) -> None:
+        """Count ``n`` misses of ``key``."""
+        counts = self.counts
+        if key in counts:
+            counts[key] += n
+            return
+        if len(counts) >= self.capacity:
+            self._prune()
+        counts[key] = self.floor + n
+        if self.floor:
+            self.errors[key] = self.floor
+
+    def _prune(self) -> None:
+        ranked = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        keep = self.capacity // 2
+        self.floor = max(self.floor, ranked[keep][1])
+        self.counts = dict(ranked[:keep])
+        self.errors = {k: e for k, e in self.errors.items() if k in self.counts}
+
+    def top(self, n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Tracked keys by descending count: ``[{"key", "count", "error"}, ...]``."""
+        ranked = sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))
+        if n is not None:
+            ranked = ranked[:n]
+        return [
+            {"key": key, "count": count, "error": self.errors.get(key, 0)}
+            for key, count in ranked
+        ]
+
+
+class Metrics:
+    """Counters, histograms and the miss sketch recorded by core."""
+
+    def __init__(self, miss_capacity: int = DEFAULT_MISS_CAPACITY) -> None:
+        self.miss_capacity = miss_capacity
+        self.reset()
+
+    def reset(self) -> None:
+        self.lookups = 0
+        self.hits = 0
+        self.alias_hits = 0
+        self.misses = 0
+        self.normalizations = 0
+        self.lookup_latency = Histogram()
+        self.batch_latency = Histogram()
+        self.load_latency = Histogram()
+        self.missed = MissSketch(self.miss_capacity)
+
+    def record_lookup(self, key: str, matched_by: Optional[str], ns: int) -> None:
+        """Record one lookup of normalized ``key`` (``matched_by`` None on a miss)."""
+        self.lookups += 1
+        self.normalizations += 1
+        if matched_by is None:
+            self.misses += 1
+            self.missed.add(key)
+        else:
+            self.hits += 1
+            if matched_by == "alias":
+                self.alias_hits += 1
+        self.lookup_latency.record(ns)
+
+    def record_batch(
+        self,
+        total: int,
+        hits: int,
+        alias_hits: int,
+        normalized: int,
+        missed_keys: Dict[str, int],
+        ns: int,
+    ) -> None:
+        """
+        Record a lookup_many() call of ``total`` words.
+
+        Its latency is one batch_latency sample. ``missed_keys`` maps each
+        missed normalized key to the number of input words that missed
+        with it, so the sketch agrees with the ``misses`` counter.
+        """
+        self.lookups += total
+        self.hits += hits
+        self.alias_hits += alias_hits
+        self.misses += total - hits
+        self.normalizations += normalized
+        for key, n in missed_keys.items():
+            self.missed.add(key, n)
+        self.batch_latency.record(ns)
+
+    def record_load(self, ns: int) -> None:
+        self.load_latency.record(ns)
+
+    def snapshot(self, top_misses: Optional[int] = 50) -> Dict[str, Any]:
+        return {
+            "enabled": True,
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "alias_hits": self.alias_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / self.lookups if self.lookups else 0.0,
+            "normalizations": self.normalizations,
+            "lookup_latency": self.lookup_latency.snapshot(),
+            "batch_latency": self.batch_latency.snapshot(),
+            "load_latency": self.load_latency.snapshot(),
+            "top_misses": self.missed.top(top_misses),
+        }
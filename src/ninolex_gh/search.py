@@ -0,0 +1,311 @@
+"""
+Ninolex-GH Fuzzy Search
+=======================
+
+Approximate (typo-tolerant) search across graphemes, aliases and the
+individual words of multi-word names, so "Nkruma", "Kumase" or "Achimotta"
+still find the intended entry.
+
+Index:
+    Every searchable name of length ``L`` is split into ``D + 2`` contiguous
+    segments, where ``D`` is the largest edit distance the index supports
+    (default 2). Each segment is stored in a dict keyed by
+    ``(L, segment number, segment text)``.
+
+Query:
+    ``d <= D`` edits can touch at most ``d`` of a name's ``D + 2`` segments,
+    so by the pigeonhole principle at least ``D + 2 - d`` segments survive
+    intact and appear in the query, shifted by at most ``d`` characters. A
+    query probes the dict for each candidate length, segment and shift (a
+    fixed number of O(1) lookups, independent of dictionary size), keeps
+    only names that matched enough distinct segments, and verifies those
+    with a bounded Levenshtein distance.
+
+    Names shorter than ``D + 2`` characters cannot be segmented and are kept
+    in a small list checked on every query. Queries with ``max_distance``
+    larger than ``D`` fall back to scanning names of compatible length.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from . import core
+from .entry import Entry
+
+# Largest edit distance the default index is built for
+DEFAULT_MAX_DISTANCE = 2
+
+# Words shorter than this are not indexed on their own
+_MIN_WORD_LENGTH = 3
+
+# Ranking of how a name matched (lower is better)
+_KIND_RANK = {"grapheme": 0, "alias": 1, "word": 2}
+
+
+class SearchHit(NamedTuple):
+    """
+    A fuzzy search result.
+
+    Attributes:
+        entry: The matching dictionary entry.
+        distance: Edit distance between the query and ``matched``.
+        matched: The normalized name that matched (grapheme, alias or word).
+        matched_by: ``"grapheme"``, ``"alias"`` or ``"word"`` (a single word
+            of a multi-word grapheme or alias).
+    """
+
+    entry: Entry
+    distance: int
+    matched: str
+    matched_by: str
+
+
+def _segments(length: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split ``length`` characters into ``parts`` contiguous segments.
+
+    Returns ``(start, size)`` pairs; the last ``length % parts`` segments
+    are one character longer than the others.
+    """
+    base, extra = divmod(length, parts)
+    bounds = []
+    start = 0
+    for i in range(parts):
+        size = base + (i >= parts - extra)
+        bounds.append((start, size))
+        start += size
+    return bounds
+
+
+def _bounded_levenshtein(a: str, b: str, limit: int) -> int:
+    """
+    Levenshtein distance between ``a`` and ``b``, or ``limit + 1`` if the
+    distance exceeds ``limit``. Stops as soon as a row exceeds the limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            cost = previous[j - 1] + (ca != cb)
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            current.append(cost)
+            if cost < row_min:
+                row_min = cost
+        if row_min > limit:
+            return limit + 1
+        previous = current
+
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+
+class SearchIndex:
+    """
+    Segment (pigeonhole) index over dictionary names.
+
+    Each distinct normalized name is indexed once, however many entries
+    share it (common given names, "Central", "School", ...); the entries
+    are attached to it as targets.
+
+    Usually built once from the loaded dictionary by search(); it can also
+    be built directly from any list of entry dicts (e.g. for benchmarks).
+
+    Args:
+        entries: Entries (or dicts) with at least ``grapheme`` and ``alias``.
+        max_distance: Largest edit distance served from the index.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[Mapping],
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+    ) -> None:
+        self.max_distance = max_distance
+        self._names: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        self._targets: List[List[Tuple[Mapping, str]]] = []
+        self._segment_index: Dict[Tuple[int, int, str], List[int]] = {}
+        self._by_length: Dict[int, List[int]] = {}
+        self._short: List[int] = []
+
+        for entry in entries:
+            names = [(core._normalize_key(entry["grapheme"]), "grapheme")]
+            names.extend(
+                (core._normalize_key(a), "alias")
+                for a in core._split_aliases(entry.get("alias", ""))
+            )
+            for name, _ in list(names):
+                words = core._tokenize_key(name)
+                if len(words) > 1:
+                    names.extend(
+                        (w, "word") for w in words if len(w) >= _MIN_WORD_LENGTH
+                    )
+
+            # First (best) kind wins when a name repeats within an entry
+            kinds: Dict[str, str] = {}
+            for name, kind in names:
+                if name:
+                    kinds.setdefault(name, kind)
+            for name, kind in kinds.items():
+                self._add(name, entry, kind)
+
+    def _add(self, name: str, entry: Mapping, kind: str) -> None:
+        i = self._name_ids.get(name)
+        if i is not None:
+            self._targets[i].append((entry, kind))
+            return
+
+        i = self._name_ids[name] = len(self._names)
+        length = len(name)
+        self._names.append(name)
+        self._targets.append([(entry, kind)])
+        self._by_length.setdefault(length, []).append(i)
+
+        parts = self.max_distance + 2
+        if length < parts:
+            self._short.append(i)
+            return
+
+        for n, (start, size) in enumerate(_segments(length, parts)):
+            key = (length, n, name[start:start + size])
+            self._segment_index.setdefault(key, []).append(i)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _candidates(self, query: str, max_distance: int) -> Set[int]:
+        length = len(query)
+        low = max(length - max_distance, 1)
+        high = length + max_distance
+        candidates: Set[int] = set()
+
+        if max_distance > self.max_distance:
+            # Beyond what the segments guarantee: scan the length window
+            for size in range(low, high + 1):
+                candidates.update(self._by_length.get(size, ()))
+            return candidates
+
+        parts = self.max_distance + 2
+        required = parts - max_distance
+        index = self._segment_index
+        counts: Counter = Counter()
+
+        for name_length in range(max(low, parts), high + 1):
+            for n, (start, size) in enumerate(_segments(name_length, parts)):
+                # Names containing segment n at any allowed shift
+                matched: Set[int] = set()
+                first = max(start - max_distance, 0)
+                last = min(start + max_distance, length - size)
+                for shift in range(first, last + 1):
+                    posting = index.get((name_length, n, query[shift:shift + size]))
+                    if posting:
+                        matched.update(posting)
+                counts.update(matched)
+
+        candidates.update(i for i, count in counts.items() if count >= required)
+        candidates.update(self._short)
+        return candidates
+
+    def search(self, query: str, limit: int = 10, max_distance: int = 2) -> List[SearchHit]:
+        """Return up to ``limit`` hits within ``max_distance`` of ``query``."""
+        key = core._normalize_key(query)
+        if not key or limit <= 0:
+            return []
+
+        names = self._names
+        query_length = len(key)
+        matches: Dict[int, List[int]] = {}
+
+        for i in self._candidates(key, max_distance):
+            name = names[i]
+            if abs(len(name) - query_length) > max_distance:
+                continue
+            distance = _bounded_levenshtein(key, name, max_distance)
+            if distance <= max_distance:
+                matches.setdefault(distance, []).append(i)
+
+        # Expand names to entries one distance at a time, best first, so a
+        # common word matching thousands of entries is only expanded if the
+        # closer matches did not already fill the limit
+        results: List[SearchHit] = []
+        seen: Set[int] = set()
+        for distance in sorted(matches):
+            hits = [
+                SearchHit(entry, distance, names[i], kind)
+                for i in matches[distance]
+                for entry, kind in self._targets[i]
+            ]
+            hits.sort(key=_rank)
+            for hit in hits:
+                if id(hit.entry) in seen:
+                    continue
+                seen.add(id(hit.entry))
+                results.append(hit)
+                if len(results) == limit:
+                    return results
+
+        return results
+
+
+def _rank(hit: SearchHit) -> Tuple[int, int, str]:
+    return (hit.distance, _KIND_RANK[hit.matched_by], hit.matched)
+
+
+# Index over the loaded dictionary, and the _CACHE object it was built from
+_INDEX: Optional[SearchIndex] = None
+_INDEX_SOURCE: Any = None
+
+
+def _load_index() -> SearchIndex:
+    """Build the search index for the loaded dictionary on first use."""
+    global _INDEX, _INDEX_SOURCE
+
+    mapping = core._load_data()
+    index = _INDEX
+    if index is None or _INDEX_SOURCE is not mapping:
+        with core._LOAD_LOCK:
+            if _INDEX is None or _INDEX_SOURCE is not mapping:
+                _INDEX = SearchIndex(core._RAW_ENTRIES)
+                _INDEX_SOURCE = mapping
+            index = _INDEX
+    return index
+
+
+def search(query: str, limit: int = 10, max_distance: int = 2) -> List[SearchHit]:
+    """
+    Fuzzy search across graphemes, aliases and words of multi-word names.
+
+    Matching is case-insensitive and Unicode-normalized. Results are ranked
+    by edit distance, then by how the name matched (grapheme before alias
+    before single word), and each entry appears at most once.
+
+    The segment index is built on first use; each query makes a fixed
+    number of dict probes and verifies only the names they return.
+
+    Args:
+        query: The (possibly misspelled) text to search for.
+        limit: Maximum number of results to return.
+        max_distance: Maximum Levenshtein edit distance to accept.
+
+    Returns:
+        list[SearchHit]: Hits ordered best first.
+
+    Example:
+        >>> import ninolex_gh
+        >>> ninolex_gh.search("Kumase")[0].entry["grapheme"]
+        'Kumasi'
+        >>> hit = ninolex_gh.search("Nkruma")[0]
+        >>> hit.entry["grapheme"], hit.matched_by
+        ('Kwame Nkrumah', 'word')
+    """
+    return _load_index().search(query, limit=limit, max_distance=max_distance)
@@ -0,0 +1,410 @@
+"""
+Ninolex-GH HTTP Service
+=======================
+
+A small, dependency-free asyncio HTTP/1.1 server exposing the dictionary to
+services written in other languages.
+
+Usage::
+
+    python -m ninolex_gh.serve --host 127.0.0.1 --port 8080
+
+Endpoints:
+    ``GET /lookup?word=Kumasi[&aliases=1]``
+        ``{"entry": {...}}``, or 404 ``{"error": ..., "word": ...}``.
+
+    ``POST /lookup`` with ``{"words": [...], "include_aliases": false}``
+        ``{"results": [entry or null, ...], "stats": {...}}`` in input order.
+
+    ``POST /ssml`` with ``{"text": "...", "speak": true}`` (or a plain-text body)
+        The text as SSML with ``<phoneme>`` tags (``application/ssml+xml``).
+
+    ``GET /health``
+        ``{"status": "ok", "entries": N, "requests": N, "batches": N}``.
+
+    ``GET /stats``
+        ninolex_gh.stats(): hit/miss counts, latency histograms and the most
+        frequent misses (start with ``--metrics`` to record them).
+
+Design:
+    - The lexicon (and the annotation trie) is loaded once at startup and
+      shared by every connection
+    - Connections are kept alive (HTTP/1.1 default, or HTTP/1.0 with
+      ``Connection: keep-alive``) until the client closes them or they sit
+      idle for ``--idle-timeout`` seconds
+    - Single-word lookups are micro-batched: lookups arriving while the
+      event loop is busy are queued and resolved together by one
+      lookup_many() call at the end of the loop iteration (or after
+      ``--batch-window`` milliseconds), so repeated words in a burst are
+      normalized and resolved once
+
+The load generator in ``benchmarks/bench_serve.py`` measures throughput and
+latency percentiles against a running server.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from . import core
+from .ssml import to_ssml
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+# Largest request body accepted, in bytes
+MAX_BODY_SIZE = 1 << 20
+
+# Largest number of header lines accepted per request
+MAX_HEADERS = 100
+
+# Lookups resolved per lookup_many() call at most
+MAX_BATCH_SIZE = 1024
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+
+# (status, content type, body, extra headers)
+Response = Tuple[int, str, bytes, Dict[str, str]]
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+def _json_response(status: int, data: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+    body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    return status, "application/json; charset=utf-8", body, headers or {}
+
+
+def _entry_dict(entry: Any) -> Optional[Dict[str, str]]:
+    return None if entry is None else entry.to_dict()
+
+
+class LookupBatcher:
+    """
+    Collects concurrent single-word lookups and resolves them in batches.
+
+    submit() returns a future; the queued lookups are resolved together by
+    lookup_many() once the event loop has handled the other ready requests
+    (``window`` 0) or after ``window`` seconds, or immediately once
+    ``max_size`` lookups are queued.
+    """
+
+    def __init__(self, window: float = 0.0, max_size: int = MAX_BATCH_SIZE) -> None:
+        self.window = window
+        self.max_size = max_size
+        self.batches = 0
+        self._pending: List[Tuple[str, bool, asyncio.Future]] = []
+        self._handle: Optional[asyncio.Handle] = None
+
+    def submit(self, word: str, include_aliases: bool = False) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((word, include_aliases, future))
+
+        if len(self._pending) >= self.max_size:
+            self.flush()
+        elif self._handle is None:
+            if self.window > 0:
+                self._handle = loop.call_later(self.window, self.flush)
+            else:
+                self._handle = loop.call_soon(self.flush)
+        return future
+
+    def flush(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self.batches += 1
+
+        for include_aliases in (False, True):
+            group = [item for item in batch if item[1] is include_aliases]
+            if not group:
+                continue
+            try:
+                results = core.lookup_many(
+                    [word for word, _, _ in group], include_aliases=include_aliases
+                )
+            except Exception as e:  # pragma: no cover - defensive
+                for _, _, future in group:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, _, future), entry in zip(group, results):
+                if not future.done():
+                    future.set_result(entry)
+
+
+class LexiconServer:
+    """
+    Asyncio HTTP server answering lookup, batch lookup and SSML requests.
+
+    Args:
+        host: Interface to bind.
+        port: TCP port to bind (0 picks a free port).
+        batch_window: Seconds to wait for more lookups before resolving a
+            batch (0 resolves at the end of the current loop iteration).
+        idle_timeout: Seconds an idle keep-alive connection stays open.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        batch_window: float = 0.0,
+        idle_timeout: float = 15.0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.batcher = LookupBatcher(window=batch_window)
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """Load the lexicon and start listening."""
+        core.preload()
+        core._load_trie()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except (asyncio.TimeoutError, ValueError):
+                    break  # idle, or a request line longer than the stream limit
+                if not request_line:
+                    break
+                if not request_line.strip():
+                    continue  # tolerate stray CRLF between requests
+
+                keep_alive = False
+                body = None
+                try:
+                    method, target, version, headers = await self._read_head(request_line, reader)
+                    keep_alive = self._keep_alive(version, headers)
+                    body = await self._read_body(headers, reader)
+                    response = await self._dispatch(method, target, headers, body)
+                except _HTTPError as e:
+                    response = _json_response(e.status, {"error": str(e)}, e.headers)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                except Exception as e:  # pragma: no cover - defensive
+                    response = _json_response(500, {"error": f"{type(e).__name__}: {e}"})
+
+                if body is None:
+                    # The request was not read completely; the stream cannot be reused
+                    keep_alive = False
+
+                self.requests += 1
+                self._write(writer, response, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _read_head(
+        self, request_line: bytes, reader: asyncio.StreamReader
+    ) -> Tuple[str, str, str, Dict[str, str]]:
+        parts = request_line.decode("latin-1").split()
+        if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+            raise _HTTPError(400, "Malformed request line")
+        method, target, version = parts
+
+        headers: Dict[str, str] = {}
+        for _ in range(MAX_HEADERS + 1):
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return method, target, version, headers
+            name, sep, value = line.decode("latin-1").partition(":")
+            if not sep:
+                raise _HTTPError(400, "Malformed header line")
+            headers[name.strip().lower()] = value.strip()
+        raise _HTTPError(400, "Too many headers")
+
+    @staticmethod
+    def _keep_alive(version: str, headers: Dict[str, str]) -> bool:
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            return connection != "close"
+        return connection == "keep-alive"
+
+    @staticmethod
+    async def _read_body(headers: Dict[str, str], reader: asyncio.StreamReader) -> bytes:
+        if "transfer-encoding" in headers:
+            raise _HTTPError(411, "Chunked request bodies are not supported; send Content-Length")
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise _HTTPError(400, "Invalid Content-Length") from None
+        if length > MAX_BODY_SIZE:
+            raise _HTTPError(413, f"Request body larger than {MAX_BODY_SIZE} bytes")
+        return await reader.readexactly(length) if length > 0 else b""
+
+    @staticmethod
+    def _write(writer: asyncio.StreamWriter, response: Response, keep_alive: bool) -> None:
+        status, content_type, body, extra = response
+        head = [
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        head.extend(f"{name}: {value}" for name, value in extra.items())
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+
+    async def _dispatch(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> Response:
+        url = urlsplit(target)
+        route = (url.path.rstrip("/") or "/", method)
+
+        if route == ("/lookup", "GET"):
+            return await self._lookup(parse_qs(url.query))
+        if route == ("/lookup", "POST"):
+            return self._lookup_batch(self._json_body(body))
+        if route == ("/ssml", "POST"):
+            return self._ssml(headers, body)
+        if route == ("/health", "GET"):
+            return _json_response(200, {
+                "status": "ok",
+                "entries": core.get_entry_count(),
+                "requests": self.requests,
+                "batches": self.batcher.batches,
+            })
+        if route == ("/stats", "GET"):
+            return _json_response(200, core.stats())
+
+        allowed = {
+            "/lookup": "GET, POST", "/ssml": "POST", "/health": "GET", "/stats": "GET",
+        }.get(route[0])
+        if allowed:
+            raise _HTTPError(405, f"{method} not allowed on {route[0]}", {"Allow": allowed})
+        raise _HTTPError(404, f"No such endpoint: {url.path}")
+
+    @staticmethod
+    def _json_body(body: bytes) -> Any:
+        try:
+            return json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError):
+            raise _HTTPError(400, "Request body must be UTF-8 JSON") from None
+
+    async def _lookup(self, params: Dict[str, List[str]]) -> Response:
+        words = params.get("word")
+        if not words:
+            raise _HTTPError(400, "Missing 'word' query parameter")
+        include_aliases = params.get("aliases", ["0"])[0].lower() in _TRUE_VALUES
+
+        entry = await self.batcher.submit(words[0], include_aliases)
+        if entry is None:
+            return _json_response(404, {"error": "Word not found", "word": words[0]})
+        return _json_response(200, {"entry": entry.to_dict()})
+
+    @staticmethod
+    def _lookup_batch(data: Any) -> Response:
+        words = data.get("words") if isinstance(data, dict) else None
+        if not isinstance(words, list) or not all(isinstance(w, str) for w in words):
+            raise _HTTPError(400, "Expected {\"words\": [\"...\", ...]}")
+
+        results, stats = core.lookup_many(
+            words,
+            return_stats=True,
+            include_aliases=bool(data.get("include_aliases", False)),
+        )
+        return _json_response(200, {
+            "results": [_entry_dict(entry) for entry in results],
+            "stats": stats,
+        })
+
+    def _ssml(self, headers: Dict[str, str], body: bytes) -> Response:
+        speak = True
+        if headers.get("content-type", "").startswith("application/json"):
+            data = self._json_body(body)
+            text = data.get("text") if isinstance(data, dict) else None
+            if not isinstance(text, str):
+                raise _HTTPError(400, "Expected {\"text\": \"...\"}")
+            speak = bool(data.get("speak", True))
+        else:
+            try:
+                text = body.decode("utf-8")
+            except UnicodeDecodeError:
+                raise _HTTPError(400, "Request body must be UTF-8 text") from None
+
+        ssml = to_ssml(text, speak=speak).encode("utf-8")
+        return 200, "application/ssml+xml; charset=utf-8", ssml, {}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m ninolex_gh.serve",
+        description="Serve Ninolex-GH lookups and SSML over HTTP.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"interface to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port (default: {DEFAULT_PORT})")
+    parser.add_argument("--batch-window", type=float, default=0.0, metavar="MS",
+                        help="milliseconds to collect concurrent lookups into a batch (default: 0)")
+    parser.add_argument("--idle-timeout", type=float, default=15.0, metavar="SECONDS",
+                        help="close idle keep-alive connections after this long (default: 15)")
+    parser.add_argument("--metrics", action="store_true",
+                        help="record lookup metrics, served at GET /stats")
+    args = parser.parse_args(argv)
+
+    if args.metrics:
+        core.enable_metrics()
+
+    server = LexiconServer(
+        host=args.host,
+        port=args.port,
+        batch_window=args.batch_window / 1000,
+        idle_timeout=args.idle_timeout,
+    )
+
+    async def run() -> None:
+        await server.start()
+        print(f"Serving {core.get_entry_count()} entries on http://{server.host}:{server.port}",
+              flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Ninolex-GH SSML Module
+======================
+
+Rewrites free text as SSML, wrapping every recognised dictionary entry in a
+``<phoneme>`` tag carrying its IPA transcription.
+
+Entity recognition is delegated to the token trie in core (the same matcher
+used by annotate()), so a document is scanned once and output is produced
+as it goes. Use iter_ssml() to stream the result in chunks, or to_ssml()
+when a single string is more convenient.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, List
+
+from .core import _iter_matches
+
+# Supported values for the ``alphabet`` argument.
+# The dictionary stores IPA only; other alphabets would need a converter.
+SUPPORTED_ALPHABETS = ("ipa",)
+
+# Default size (in characters) of the chunks yielded by iter_ssml()
+DEFAULT_CHUNK_SIZE = 8192
+
+# Same replacements as escape_xml() in build/export.py, applied in a
+# single pass with str.translate instead of five chained .replace() calls.
+_XML_ESCAPES = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    "'": "&apos;",
+    '"': "&quot;",
+})
+
+
+def _escape_xml(text: str) -> str:
+    """Escape special XML characters in text or attribute values."""
+    return text.translate(_XML_ESCAPES)
+
+
+def _split_point(text: str, start: int, stop: int) -> int:
+    """
+    Where to cut ``text[start:]`` so the piece ends by ``stop``: just after
+    the last whitespace before ``stop``, or at ``stop`` if there is none.
+    """
+    cut = max(text.rfind(" ", start, stop), text.rfind("\n", start, stop))
+    return cut + 1 if cut >= start else stop
+
+
+def iter_ssml(
+    text: str,
+    alphabet: str = "ipa",
+    speak: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Stream ``text`` as SSML with ``<phoneme>`` tags for recognised entities.
+
+    Args:
+        text: Plain text to rewrite.
+        alphabet: Phonetic alphabet for the ``ph`` attribute. Only "ipa"
+                  is currently supported.
+        speak: Wrap the output in a ``<speak>`` root element.
+        chunk_size: Approximate number of characters per yielded chunk.
+                    Text between entities is split at whitespace so no
+                    chunk grows much beyond it (XML escaping and a single
+                    ``<phoneme>`` element can still push a chunk over).
+
+    Yields:
+        str: Consecutive pieces of the SSML document. Joining them gives
+        the same result as to_ssml().
+
+    Raises:
+        ValueError: If ``alphabet`` is not supported or ``chunk_size`` is
+            not positive.
+    """
+    if alphabet not in SUPPORTED_ALPHABETS:
+        raise ValueError(
+            f"Unsupported alphabet {alphabet!r}; expected one of {SUPPORTED_ALPHABETS}"
+        )
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+    buffer: List[str] = []
+    size = 0
+
+    if speak:
+        buffer.append("<speak>")
+        size += 7
+
+    def add_text(start: int, end: int) -> Iterator[str]:
+        """Append escaped ``text[start:end]``, yielding each full chunk."""
+        nonlocal buffer, size
+        while start < end:
+            stop = start + max(chunk_size - size, 1)
+            cut = end if end <= stop else _split_point(text, start, stop)
+            piece = _escape_xml(text[start:cut])
+            buffer.append(piece)
+            size += len(piece)
+            start = cut
+            if size >= chunk_size or start < end:
+                yield "".join(buffer)
+                buffer = []
+                size = 0
+
+    pos = 0
+    for match in _iter_matches(text):
+        if match.start > pos:
+            yield from add_text(pos, match.start)
+
+        piece = (
+            f'<phoneme alphabet="{alphabet}" '
+            f'ph="{_escape_xml(match.entry["phoneme"])}">'
+            f"{_escape_xml(match.text)}</phoneme>"
+        )
+        buffer.append(piece)
+        size += len(piece)
+        pos = match.end
+
+        if size >= chunk_size:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+
+    if pos < len(text):
+        yield from add_text(pos, len(text))
+
+    if speak:
+        buffer.append("</speak>")
+
+    if buffer:
+        yield "".join(buffer)
+
+
+def to_ssml(text: str, alphabet: str = "ipa", speak: bool = True) -> str:
+    """
+    Rewrite ``text`` as SSML with ``<phoneme>`` tags for recognised entities.
+
+    All other text is XML-escaped. For large documents prefer iter_ssml(),
+    which yields the same output in chunks.
+
+    Args:
+        text: Plain text to rewrite.
+        alphabet: Phonetic alphabet for the ``ph`` attribute ("ipa").
+        speak: Wrap the output in a ``<speak>`` root element.
+
+    Returns:
+        str: The SSML document.
+
+    Raises:
+        ValueError: If ``alphabet`` is not supported.
+
+    Example:
+        >>> import ninolex_gh
+        >>> ninolex_gh.to_ssml("Fish & waakye", speak=False)
+        'Fish &amp; <phoneme alphabet="ipa" ph="ˈwa.tʃe">waakye</phoneme>'
+    """
+    return "".join(iter_ssml(text, alphabet=alphabet, speak=speak))
@@ -7,6 +7,9 @@ contain only allowed IPA characters and separators.
 
 Usage:
     python3 tests/validate_ipa.py
+    python3 tests/validate_ipa.py --json report.json   # also write a JSON report
+    python3 tests/validate_ipa.py --json -             # JSON report only, on stdout
+    python3 tests/validate_ipa.py --changed-only       # skip sources unchanged since the last clean run
 
 Exit codes:
     0 - All phonemes are valid
@@ -16,80 +19,27 @@ Checks performed:
     1. Character validation against approved IPA subset
     2. Tie-bar check for labial-velars (kp, gb should use k͡p, ɡ͡b)
     3. Stress marker validation (no ASCII apostrophe allowed)
+
+The checks themselves live in ninolex_gh.ipa, which can be imported to
+validate other data; large dictionaries are validated in parallel.
 """
 
+import argparse
+import hashlib
 import json
-import re
 import sys
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
 DICTIONARY_PATH = ROOT / "dist" / "dictionary" / "ninolex_gh_dictionary.json"
 
-# ==============================================================================
-# ALLOWED IPA CHARACTER SET FOR NINOLEX-GH
-# ==============================================================================
-# This defines the subset of IPA symbols approved for Ghanaian English
-# transcriptions. See IPA_GUIDE.md for full conventions.
-
-# Vowels (monophthongs and common diphthong components)
-# Includes ɒ (U+0252) and ɜ (U+025C) for British English-influenced Ghanaian pronunciations
-VOWELS = set("aeiouɪʊɛɔəɑæʌɒɜ")
-
-# Long vowel marker
-LENGTH = set("ː")
-
-# Consonants
-CONSONANTS = set(
-    "bdfghjklmnpqrstvwxyzŋʃʒθðɲɾʔ"
-)
-
-# Affricates and special consonants (individual characters)
-# tʃ, dʒ, tɕ, dʑ are composed of these
-AFFRICATE_PARTS = set("tɕdʑ")
-
-# Labial-velars (k͡p, ɡ͡b) - component characters
-# Tie bars: ͡ (U+0361) and ͜ (U+035C) join them
-# Also include both 'g' (U+0067) and 'ɡ' (U+0261) for flexibility
-TIE_BARS = set("͜͡")
-LABIAL_VELAR_PARTS = set("ɡ") | TIE_BARS
-
-# Stress and prosody markers
-# ˈ (U+02C8) - primary stress
-# ˌ (U+02CC) - secondary stress
-# NOTE: ASCII apostrophe ' (U+0027) is NOT allowed
-STRESS_MARKERS = set("ˈˌ")
-
-# Syllable separators and spacing
-SEPARATORS = set(". -")
-
-# Nasalization and other diacritics
-# Including syllabic marker ̩ (U+0329) for syllabic consonants like n̩
-DIACRITICS = set("̩̃̀́̂̄")  # combining tilde, accents, syllabic marker
-
-# Whitespace (for multi-word entries)
-WHITESPACE = set(" ")
-
-# Combine all allowed characters
-ALLOWED_CHARS = (
-    VOWELS
-    | LENGTH
-    | CONSONANTS
-    | AFFRICATE_PARTS
-    | LABIAL_VELAR_PARTS
-    | STRESS_MARKERS
-    | SEPARATORS
-    | DIACRITICS
-    | WHITESPACE
-)
-
-# ==============================================================================
-# FORBIDDEN CHARACTERS
-# ==============================================================================
-# These characters are explicitly forbidden and should trigger errors
-
-# ASCII apostrophe - often mistakenly used instead of IPA stress marker
-FORBIDDEN_CHARS = set("'")  # U+0027
+# Last successful validation per source CSV, for --changed-only
+STATE_PATH = ROOT / ".build_cache" / "validate_ipa.json"
+
+# The character set and checks live in the package (ninolex_gh.ipa)
+sys.path.insert(0, str(ROOT / "src"))
+from ninolex_gh import ipa  # noqa: E402
+from ninolex_gh.ipa import validate_entries  # noqa: E402
 
 
 def load_dictionary():
@@ -103,86 +53,94 @@ def load_dictionary():
         return json.load(f)
 
 
-def validate_phoneme(phoneme):
-    """
-    Check if a phoneme string contains only allowed characters.
-    
-    Returns:
-        A set of invalid characters found, or empty set if valid.
-    """
-    invalid = set()
-    for char in phoneme:
-        # Check for explicitly forbidden characters first
-        if char in FORBIDDEN_CHARS:
-            invalid.add(char)
-        elif char not in ALLOWED_CHARS:
-            invalid.add(char)
-    return invalid
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
-def check_tiebar_labial_velars(phoneme):
+def source_hashes(entries):
     """
-    Check for labial-velar sequences (kp, gb) that lack a tie-bar.
-    
-    Proper forms: k͡p, k͜p, ɡ͡b, g͡b, ɡ͜b, g͜b
-    Suspicious forms: kp, gb (without tie-bar between them)
-    
-    Returns:
-        A list of suspicious sequences found, or empty list if clean.
+    Hash each source CSV referenced by the entries, together with the
+    validator itself so that rule changes revalidate everything.
     """
-    issues = []
-    
-    # Pattern for kp without tie-bar
-    # Match 'k' followed by 'p' but NOT with a tie-bar in between
-    if re.search(r'k(?![͜͡])p', phoneme):
-        issues.append("'kp' without tie-bar (should be 'k͡p' or 'k͜p')")
-    
-    # Pattern for gb without tie-bar
-    # Match 'g' or 'ɡ' followed by 'b' but NOT with a tie-bar in between
-    if re.search(r'[gɡ](?![͜͡])b', phoneme):
-        issues.append("'gb' without tie-bar (should be 'ɡ͡b' or 'g͡b')")
-    
-    return issues
+    rules = sha256_file(Path(ipa.__file__))
+    hashes = {}
+    for source_file in {entry.get("source_file", "") for entry in entries}:
+        path = ROOT / source_file
+        if source_file and path.is_file():
+            hashes[source_file] = f"{rules}:{sha256_file(path)}"
+    return hashes
+
+
+def load_state():
+    try:
+        with STATE_PATH.open(encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(hashes, report):
+    """Record sources that validated without character errors."""
+    failed = {err["source_file"] for err in report["errors"]}
+    state = {source: digest for source, digest in hashes.items() if source not in failed}
+    STATE_PATH.parent.mkdir(exist_ok=True)
+    with STATE_PATH.open("w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Validate dictionary IPA transcriptions.")
+    parser.add_argument("--json", metavar="PATH",
+                        help="write a JSON report to PATH ('-' for stdout instead of text)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="only validate entries whose source CSV changed since the last clean run")
+    return parser.parse_args()
 
 
 def main():
     """Run IPA validation on all dictionary entries."""
+    args = parse_args()
+    entries = load_dictionary()
+    hashes = source_hashes(entries)
+    loaded = len(entries)
+
+    if args.changed_only:
+        state = load_state()
+        entries = [
+            entry for entry in entries
+            if hashes.get(entry.get("source_file", "")) is None
+            or state.get(entry["source_file"]) != hashes[entry["source_file"]]
+        ]
+
+    report = validate_entries(entries, jobs=args.jobs)
+    save_state(hashes, report)
+
+    if args.json:
+        report["dictionary_entries"] = loaded
+        text = json.dumps(report, ensure_ascii=False, indent=2)
+        if args.json == "-":
+            print(text)
+            sys.exit(1 if report["errors"] else 0)
+        Path(args.json).write_text(text + "\n", encoding="utf-8")
+
     print("=" * 70)
     print("Ninolex-GH IPA Validation")
     print("=" * 70)
     print()
 
-    entries = load_dictionary()
-    print(f"Loaded {len(entries)} entries from dictionary")
+    print(f"Loaded {loaded} entries from dictionary")
+    if args.changed_only:
+        print(f"Validating {len(entries)} entries from changed sources")
     print()
 
-    char_errors = []
-    tiebar_warnings = []
-
-    for entry in entries:
-        grapheme = entry.get("grapheme", "")
-        phoneme = entry.get("phoneme", "")
-        source_file = entry.get("source_file", "unknown")
-        
-        # Check 1: Invalid characters
-        invalid_chars = validate_phoneme(phoneme)
-        if invalid_chars:
-            char_errors.append({
-                "grapheme": grapheme,
-                "phoneme": phoneme,
-                "invalid_chars": invalid_chars,
-                "source_file": source_file,
-            })
-        
-        # Check 2: Tie-bar for labial-velars
-        tiebar_issues = check_tiebar_labial_velars(phoneme)
-        if tiebar_issues:
-            tiebar_warnings.append({
-                "grapheme": grapheme,
-                "phoneme": phoneme,
-                "issues": tiebar_issues,
-                "source_file": source_file,
-            })
+    char_errors = report["errors"]
+    tiebar_warnings = report["warnings"]
 
     # ==== Report: Character validation ====
     print("-" * 70)
@@ -240,7 +198,7 @@ def main():
     print("=" * 70)
     print("SUMMARY")
     print("=" * 70)
-    print(f"  Entries validated: {len(entries)}")
+    print(f"  Entries validated: {report['entries']}")
     print(f"  Character errors:  {len(char_errors)}")
     print(f"  Tie-bar warnings:  {len(tiebar_warnings)}")
     print()
@@ -249,7 +207,7 @@ def main():
     if char_errors:
         print("Please review IPA_GUIDE.md and correct the errors above.")
         print("If a character is legitimately needed, add it to ALLOWED_CHARS")
-        print("in tests/validate_ipa.py")
+        print("in src/ninolex_gh/ipa.py")
         sys.exit(1)
     else:
         print("✅ Validation passed (warnings may still need attention)")
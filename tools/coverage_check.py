@@ -2,199 +2,361 @@
 """
 Coverage Check Script for Ninolex-GH
 
-This script estimates dictionary coverage against a sample text file.
+This script estimates dictionary coverage against a text corpus.
 It extracts candidate proper nouns and checks how many are in the dictionary.
 
 Usage:
-    python3 tools/coverage_check.py path/to/news_article.txt
+    python3 tools/coverage_check.py PATH [PATH ...] [--report gaps.csv|gaps.json]
 
 Example:
     python3 tools/coverage_check.py samples/ghanaweb_article.txt
+    python3 tools/coverage_check.py corpus/ --report gaps.json --jobs 8
 
 Output:
     - Total tokens in the text
     - Candidate proper nouns extracted
-    - Matches found in Ninolex-GH
+    - Candidates fully matched in Ninolex-GH
     - Coverage percentage
-    - List of unmatched candidates (for gap analysis)
+    - Most frequent matched entries and unmatched candidates (for gap analysis)
+    - Optionally, a frequency-ranked gap report as CSV or JSON (--report)
+
+How it works:
+    - Files (and *.txt files under directories, see --pattern) are read in
+      chunks that end on a line break, so memory use stays flat however large
+      the corpus is
+    - Chunks are analysed in a process pool; each worker builds the
+      dictionary's token trie once
+    - Dictionary graphemes and aliases are matched leftmost-longest over
+      word tokens, the same way as ninolex_gh.annotate(), so multi-word
+      names like "Kwame Nkrumah" or "Asante Kotoko" match as a whole
+    - Candidates are runs of capitalised words (starting uppercase,
+      containing lowercase, not a common English word) joined by spaces or
+      hyphens; the parts of a candidate not covered by a dictionary match are
+      reported as gaps
 
 Notes:
-    - Uses a simple heuristic: tokens starting with uppercase, containing lowercase
     - Not perfect NLP; intended for internal gap analysis
     - Works best with clean text (not HTML)
 """
 
+import argparse
+import csv
 import json
-import re
+import os
 import sys
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
 DICTIONARY_PATH = ROOT / "dist" / "dictionary" / "ninolex_gh_dictionary.json"
 
+# Matching reuses the package's tokenizer and trie
+sys.path.insert(0, str(ROOT / "src"))
+from ninolex_gh import core  # noqa: E402
+from ninolex_gh.entry import Entry  # noqa: E402
+
+# Characters of text read per chunk (chunks are extended to the next line break)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Common English words that often appear capitalized
+COMMON_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "must", "shall", "can", "this", "that",
+    "these", "those", "it", "its", "he", "she", "they", "we", "you", "i",
+    "his", "her", "their", "our", "your", "my", "who", "which", "what",
+    "when", "where", "why", "how", "if", "then", "so", "as", "not", "no",
+    "yes", "all", "some", "any", "each", "every", "both", "few", "many",
+    "more", "most", "other", "such", "only", "also", "just", "now", "new",
+    "first", "last", "one", "two", "three", "said", "says", "told", "according",
+    "president", "minister", "chief", "dr", "mr", "mrs", "ms", "prof",
+    "january", "february", "march", "april", "may", "june", "july",
+    "august", "september", "october", "november", "december",
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+})
+
+# Characters that may separate the words of one candidate ("Akufo-Addo")
+JOINERS = frozenset(" \t-")
 
-def load_dictionary():
-    """Load the unified dictionary and return a set of lowercase graphemes."""
-    if not DICTIONARY_PATH.exists():
-        print(f"Error: Dictionary not found at {DICTIONARY_PATH}")
+# Token trie, built once per worker process by init_worker()
+_TRIE = None
+
+
+def load_dictionary(path=DICTIONARY_PATH):
+    """
+    Load the unified dictionary and return its token trie.
+    Graphemes and aliases are indexed the same way as in the package.
+    """
+    if not path.exists():
+        print(f"Error: Dictionary not found at {path}")
         print("Run 'python3 build/build_dictionary.py' and 'python3 build/generate_json.py' first.")
         sys.exit(1)
 
-    with DICTIONARY_PATH.open(encoding="utf-8") as f:
-        entries = json.load(f)
+    with path.open(encoding="utf-8") as f:
+        entries = [Entry.from_dict(entry) for entry in json.load(f)]
+
+    mapping = {core._normalize_key(entry["grapheme"]): entry for entry in entries}
+    return core._build_trie(mapping, core._build_alias_index(entries))
+
 
-    # Build a set of lowercase graphemes for case-insensitive matching
-    graphemes = set()
-    for entry in entries:
-        grapheme = entry.get("grapheme", "").strip()
-        if grapheme:
-            graphemes.add(grapheme.lower())
-            # Also add aliases (semicolon-separated)
-            alias = entry.get("alias", "").strip()
-            if alias:
-                for a in alias.split(";"):
-                    a = a.strip()
-                    if a:
-                        graphemes.add(a.lower())
+def init_worker(path):
+    global _TRIE
+    _TRIE = load_dictionary(path)
 
-    return graphemes
 
+def is_candidate_word(token):
+    """Starts uppercase, contains lowercase, at least 2 characters, not common."""
+    return (
+        len(token) >= 2
+        and token[0].isupper()
+        and not token.isupper()
+        and token.lower() not in COMMON_WORDS
+    )
 
-def extract_candidates(text):
+
+def analyse_chunk(text):
     """
-    Extract candidate proper nouns from text using a simple heuristic.
-    
-    Criteria:
-    - Starts with uppercase letter
-    - Contains at least one lowercase letter (filters out all-caps acronyms like "THE")
-    - At least 2 characters
-    
-    Returns a list of unique candidates (preserving original case for display).
+    Analyse one chunk of text against the worker's trie.
+    Returns a dict of counts and Counters, merged by merge_results().
     """
-    # Tokenize: split on whitespace and punctuation, keeping words
-    tokens = re.findall(r"[A-Za-zÀ-ÿ'']+", text)
-    
-    candidates = []
-    seen = set()
-    
-    for token in tokens:
-        # Must start with uppercase
-        if not token[0].isupper():
-            continue
-        
-        # Must contain at least one lowercase letter
-        if not any(c.islower() for c in token):
-            continue
-        
-        # Must be at least 2 characters
-        if len(token) < 2:
-            continue
-        
-        # Skip common English words that often appear capitalized
-        common_words = {
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-            "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
-            "have", "has", "had", "do", "does", "did", "will", "would", "could",
-            "should", "may", "might", "must", "shall", "can", "this", "that",
-            "these", "those", "it", "its", "he", "she", "they", "we", "you", "i",
-            "his", "her", "their", "our", "your", "my", "who", "which", "what",
-            "when", "where", "why", "how", "if", "then", "so", "as", "not", "no",
-            "yes", "all", "some", "any", "each", "every", "both", "few", "many",
-            "more", "most", "other", "such", "only", "also", "just", "now", "new",
-            "first", "last", "one", "two", "three", "said", "says", "told", "according",
-            "president", "minister", "chief", "dr", "mr", "mrs", "ms", "prof",
-            "january", "february", "march", "april", "may", "june", "july",
-            "august", "september", "october", "november", "december",
-            "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"
-        }
-        
-        if token.lower() in common_words:
-            continue
-        
-        # Deduplicate (case-insensitive)
-        key = token.lower()
-        if key not in seen:
-            seen.add(key)
-            candidates.append(token)
-    
-    return candidates
+    tokens = [m.span() for m in core._TOKEN_RE.finditer(text)]
 
+    # Token positions covered by a dictionary match
+    matched = Counter()
+    covered = [False] * len(tokens)
+    i = 0
+    for match in core._iter_matches(text, _TRIE):
+        matched[match.entry["grapheme"]] += 1
+        while i < len(tokens) and tokens[i][0] < match.start:
+            i += 1
+        while i < len(tokens) and tokens[i][1] <= match.end:
+            covered[i] = True
+            i += 1
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 tools/coverage_check.py <path/to/text_file.txt>")
-        print()
-        print("Example:")
-        print("    python3 tools/coverage_check.py samples/ghanaweb_article.txt")
-        sys.exit(1)
+    candidates = 0
+    covered_candidates = 0
+    gaps = Counter()
+    i = 0
+    count = len(tokens)
 
-    text_path = Path(sys.argv[1])
-    
-    if not text_path.exists():
-        print(f"Error: File not found: {text_path}")
-        sys.exit(1)
+    while i < count:
+        start, end = tokens[i]
+        if not is_candidate_word(text[start:end]):
+            i += 1
+            continue
 
-    # Load dictionary
-    print("Loading Ninolex-GH dictionary...")
-    dictionary = load_dictionary()
-    print(f"  {len(dictionary)} unique graphemes/aliases loaded")
-    print()
+        # Extend the candidate over joined capitalised words
+        j = i + 1
+        while j < count:
+            start, end = tokens[j]
+            if not is_candidate_word(text[start:end]):
+                break
+            between = text[tokens[j - 1][1]:start]
+            if not between or not all(c in JOINERS for c in between):
+                break
+            j += 1
+
+        candidates += 1
+        if all(covered[i:j]):
+            covered_candidates += 1
+        else:
+            # Each run of uncovered words is a gap
+            k = i
+            while k < j:
+                if covered[k]:
+                    k += 1
+                    continue
+                g = k
+                while g < j and not covered[g]:
+                    g += 1
+                gap = text[tokens[k][0]:tokens[g - 1][1]]
+                gaps[" ".join(gap.split())] += 1
+                k = g
+        i = j
 
-    # Load and process text
-    print(f"Processing: {text_path}")
-    with text_path.open(encoding="utf-8") as f:
-        text = f.read()
+    return {
+        "tokens": count,
+        "candidates": candidates,
+        "covered": covered_candidates,
+        "matched": matched,
+        "gaps": gaps,
+    }
 
-    # Basic stats
-    all_tokens = re.findall(r"[A-Za-zÀ-ÿ'']+", text)
-    total_tokens = len(all_tokens)
 
-    # Extract candidates
-    candidates = extract_candidates(text)
-    total_candidates = len(candidates)
+def merge_results(total, result):
+    for key in ("tokens", "candidates", "covered"):
+        total[key] += result[key]
+    total["matched"].update(result["matched"])
+    total["gaps"].update(result["gaps"])
 
-    # Check coverage
-    matched = []
-    unmatched = []
 
-    for candidate in candidates:
-        if candidate.lower() in dictionary:
-            matched.append(candidate)
+def iter_files(paths, pattern):
+    """Yield files from the given paths, expanding directories recursively."""
+    for path in paths:
+        if path.is_dir():
+            yield from sorted(p for p in path.rglob(pattern) if p.is_file())
+        elif path.is_file():
+            yield path
         else:
-            unmatched.append(candidate)
+            print(f"Error: File not found: {path}")
+            sys.exit(1)
+
+
+def iter_chunks(files, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield text chunks of about chunk_size characters, ending on line breaks."""
+    for path in files:
+        with path.open(encoding="utf-8", errors="replace") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                if not chunk.endswith("\n"):
+                    chunk += f.readline()
+                yield chunk
 
-    matched_count = len(matched)
-    coverage = (matched_count / total_candidates * 100) if total_candidates > 0 else 0
+
+def analyse(paths, pattern="*.txt", jobs=None, chunk_size=DEFAULT_CHUNK_SIZE,
+            dictionary_path=DICTIONARY_PATH):
+    """
+    Analyse every chunk of the corpus and return the merged results.
+
+    With more than one job, chunks are fanned out to a process pool; at most
+    two chunks per worker are in flight, so the corpus is never held in
+    memory.
+    """
+    total = {"files": 0, "tokens": 0, "candidates": 0, "covered": 0,
+             "matched": Counter(), "gaps": Counter()}
+
+    def counted(files):
+        for path in files:
+            total["files"] += 1
+            yield path
+
+    chunks = iter_chunks(counted(iter_files(paths, pattern)), chunk_size)
+
+    if jobs == 1:
+        init_worker(dictionary_path)
+        for chunk in chunks:
+            merge_results(total, analyse_chunk(chunk))
+        return total
+
+    jobs = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=init_worker, initargs=(dictionary_path,)
+    ) as pool:
+        limit = 2 * jobs
+        pending = set()
+        for chunk in chunks:
+            pending.add(pool.submit(analyse_chunk, chunk))
+            if len(pending) >= limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    merge_results(total, future.result())
+        for future in pending:
+            merge_results(total, future.result())
+
+    return total
+
+
+def ranked(counter):
+    """Counter items by descending count, then alphabetically."""
+    return sorted(counter.items(), key=lambda item: (-item[1], item[0].lower(), item[0]))
+
+
+def write_report(total, path):
+    """Write a frequency-ranked gap report as CSV or JSON (by file extension)."""
+    gaps = ranked(total["gaps"])
+
+    if path.suffix.lower() == ".json":
+        report = {
+            "summary": summary(total),
+            "gaps": [{"candidate": text, "count": n} for text, n in gaps],
+            "matched": [{"grapheme": text, "count": n} for text, n in ranked(total["matched"])],
+        }
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+    else:
+        with path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["candidate", "count"])
+            writer.writerows(gaps)
+
+
+def summary(total):
+    candidates = total["candidates"]
+    return {
+        "files": total["files"],
+        "tokens": total["tokens"],
+        "candidates": candidates,
+        "matched_candidates": total["covered"],
+        "coverage_percent": round(total["covered"] / candidates * 100, 2) if candidates else 0.0,
+        "dictionary_matches": sum(total["matched"].values()),
+        "unique_gaps": len(total["gaps"]),
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Estimate dictionary coverage of a text corpus.")
+    parser.add_argument("paths", nargs="+", type=Path,
+                        help="text files or directories to analyse")
+    parser.add_argument("--report", type=Path,
+                        help="write a frequency-ranked gap report (.csv or .json)")
+    parser.add_argument("--pattern", default="*.txt",
+                        help="file pattern when scanning directories (default: *.txt)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes (default: CPU count; 1 disables the pool)")
+    parser.add_argument("--top", type=int, default=50,
+                        help="number of matched entries and gaps to print (default: 50)")
+    parser.add_argument("--dictionary", type=Path, default=DICTIONARY_PATH,
+                        help="dictionary JSON to check against")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    print(f"Processing: {', '.join(str(p) for p in args.paths)}")
+    total = analyse(args.paths, args.pattern, args.jobs, dictionary_path=args.dictionary)
+    stats = summary(total)
 
     # Report
     print()
     print("=" * 60)
     print("COVERAGE REPORT")
     print("=" * 60)
-    print(f"  Total tokens in text:      {total_tokens:,}")
-    print(f"  Candidate proper nouns:    {total_candidates:,}")
-    print(f"  Matched in Ninolex-GH:     {matched_count:,}")
-    print(f"  Coverage:                  {coverage:.2f}%")
+    print(f"  Files processed:           {stats['files']:,}")
+    print(f"  Total tokens in text:      {stats['tokens']:,}")
+    print(f"  Candidate proper nouns:    {stats['candidates']:,}")
+    print(f"  Matched in Ninolex-GH:     {stats['matched_candidates']:,}")
+    print(f"  Coverage:                  {stats['coverage_percent']:.2f}%")
     print()
 
-    if matched:
+    if total["matched"]:
         print("-" * 60)
-        print("MATCHED CANDIDATES")
+        print("MOST FREQUENT MATCHES")
         print("-" * 60)
-        for m in sorted(matched, key=str.lower):
-            print(f"  ✓ {m}")
+        for text, n in ranked(total["matched"])[:args.top]:
+            print(f"  ✓ {text} ({n})")
         print()
 
-    if unmatched:
+    if total["gaps"]:
         print("-" * 60)
-        print("UNMATCHED CANDIDATES (potential gaps)")
+        print("MOST FREQUENT UNMATCHED CANDIDATES (potential gaps)")
         print("-" * 60)
-        for u in sorted(unmatched, key=str.lower):
-            print(f"  ✗ {u}")
+        for text, n in ranked(total["gaps"])[:args.top]:
+            print(f"  ✗ {text} ({n})")
         print()
-        print(f"Total unmatched: {len(unmatched)}")
+        print(f"Total unmatched: {stats['unique_gaps']:,} distinct")
         print("Review these for potential additions to the dictionary.")
 
+    if args.report:
+        write_report(total, args.report)
+        print()
+        print(f"Gap report written to {args.report}")
+
     print()
     print("=" * 60)
 
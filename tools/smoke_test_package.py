@@ -116,6 +116,486 @@ def main():
     
     print()
     
+    # Test 7: entries are immutable
+    try:
+        entry = ninolex_gh.lookup("Accra")
+        try:
+            entry["phoneme"] = "changed"
+            print("❌ Entry allowed item assignment")
+            errors.append("immutable")
+        except TypeError:
+            if ninolex_gh.lookup("Accra")["phoneme"] == entry.phoneme == entry.to_dict()["phoneme"]:
+                print("✅ Entries are immutable; to_dict() gives a mutable copy")
+            else:
+                print(f"❌ Entry fields disagree: {entry!r}")
+                errors.append("immutable")
+    except Exception as e:
+        print(f"❌ Entry immutability check failed: {e}")
+        errors.append("immutable")
+    
+    print()
+    
+    # Test 8: alias-aware lookup
+    try:
+        entry, matched_by = ninolex_gh.resolve("Kotoko")
+        aliased = ninolex_gh.lookup("PRESEC", include_aliases=True)
+        if (
+            entry["grapheme"] == "Asante Kotoko"
+            and matched_by == "alias"
+            and ninolex_gh.resolve("Accra").matched_by == "grapheme"
+            and aliased["grapheme"] == "Presbyterian Boys' Secondary School"
+        ):
+            print(f"✅ Alias lookups work: Kotoko → {entry['grapheme']}")
+        else:
+            print(f"❌ Alias lookup returned unexpected: {entry}, {matched_by}")
+            errors.append("aliases")
+    except Exception as e:
+        print(f"❌ Alias lookup failed: {e}")
+        errors.append("aliases")
+    
+    print()
+    
+    # Test 9: fuzzy search
+    try:
+        hits = ninolex_gh.search("Kumase", limit=3)
+        if hits and hits[0].entry["grapheme"] == "Kumasi" and hits[0].distance == 1:
+            print(f"✅ search('Kumase') → {[h.entry['grapheme'] for h in hits]}")
+        else:
+            print(f"❌ search() returned unexpected: {hits}")
+            errors.append("search")
+    except Exception as e:
+        print(f"❌ search() failed: {e}")
+        errors.append("search")
+    
+    print()
+    
+    # Test 10: prefix completion
+    try:
+        completed = [e["grapheme"] for e in ninolex_gh.complete("ablekuma")]
+        in_domain = [e["grapheme"] for e in ninolex_gh.complete("ac", domain="Places")]
+        if (
+            completed == ["Ablekuma Central", "Ablekuma North", "Ablekuma West"]
+            and in_domain == ["Accra"]
+        ):
+            print(f"✅ complete('ablekuma') → {completed}")
+        else:
+            print(f"❌ complete() returned unexpected: {completed} / {in_domain}")
+            errors.append("complete")
+    except Exception as e:
+        print(f"❌ complete() failed: {e}")
+        errors.append("complete")
+    
+    print()
+    
+    # Test 11: reverse phoneme lookup
+    try:
+        exact = [e["grapheme"] for e in ninolex_gh.lookup_by_phoneme("ˈwa.tʃe")]
+        loose = [e["grapheme"] for e in ninolex_gh.lookup_by_phoneme("watʃe", loose=True)]
+        if exact == ["waakye"] and loose == ["waakye"]:
+            print(f"✅ lookup_by_phoneme() → {exact} (exact), {loose} (loose)")
+        else:
+            print(f"❌ lookup_by_phoneme() returned unexpected: {exact}, {loose}")
+            errors.append("lookup_by_phoneme")
+    except Exception as e:
+        print(f"❌ lookup_by_phoneme() failed: {e}")
+        errors.append("lookup_by_phoneme")
+    
+    print()
+    
+    # Test 12: filtered queries
+    try:
+        clubs = [e["grapheme"] for e in ninolex_gh.query(category="football_club", city="Kumasi")]
+        constituencies = list(ninolex_gh.query(category="constituency", region="Greater Accra"))
+        if "Asante Kotoko" in clubs and all(e["region"] == "Greater Accra" for e in constituencies):
+            print(f"✅ query() found {len(clubs)} Kumasi clubs, {len(constituencies)} Greater Accra constituencies")
+        else:
+            print(f"❌ query() returned unexpected: {clubs}")
+            errors.append("query")
+    except Exception as e:
+        print(f"❌ query() failed: {e}")
+        errors.append("query")
+    
+    print()
+    
+    # Test 13: lookup_many() batch lookup
+    try:
+        results, stats = ninolex_gh.lookup_many(
+            ["Accra", "ACCRA", "__nonexistent__"], return_stats=True
+        )
+        if (
+            results[0] == results[1]
+            and results[2] is None
+            and stats == {"total": 3, "unique": 3, "hits": 2, "misses": 1}
+        ):
+            print(f"✅ lookup_many() works correctly: {stats}")
+        else:
+            print(f"❌ lookup_many() returned unexpected: {results}, {stats}")
+            errors.append("lookup_many")
+    except Exception as e:
+        print(f"❌ lookup_many() failed: {e}")
+        errors.append("lookup_many")
+    
+    print()
+    
+    # Test 14: annotate() multi-word matching
+    try:
+        matches = ninolex_gh.annotate("Kwame Nkrumah spoke in Accra.")
+        texts = [m.text for m in matches]
+        if texts == ["Kwame Nkrumah", "Accra"]:
+            print(f"✅ annotate() found {texts}")
+        else:
+            print(f"❌ annotate() returned unexpected: {texts}")
+            errors.append("annotate")
+    except Exception as e:
+        print(f"❌ annotate() failed: {e}")
+        errors.append("annotate")
+    
+    print()
+    
+    # Test 15: to_ssml() escaping and phoneme tags
+    try:
+        ssml = ninolex_gh.to_ssml("Fish & waakye", speak=False)
+        expected = 'Fish &amp; <phoneme alphabet="ipa" ph="ˈwa.tʃe">waakye</phoneme>'
+        if ssml == expected:
+            print(f"✅ to_ssml() returned: {ssml}")
+        else:
+            print(f"❌ to_ssml() returned unexpected: {ssml}")
+            errors.append("to_ssml")
+    except Exception as e:
+        print(f"❌ to_ssml() failed: {e}")
+        errors.append("to_ssml")
+    
+    print()
+    
+    # Test 16: mmap backend agrees with the JSON backend
+    try:
+        expected = {w: ninolex_gh.lookup(w) for w in ninolex_gh.list_graphemes()}
+        ninolex_gh.set_backend("mmap")
+        mismatched = [w for w, e in expected.items() if ninolex_gh.lookup(w) != e]
+        if not mismatched and ninolex_gh.get_entry_count() == len(expected):
+            print(f"✅ mmap backend matches JSON for {len(expected)} entries")
+        else:
+            print(f"❌ mmap backend differs for: {mismatched[:5]}")
+            errors.append("mmap_backend")
+    except Exception as e:
+        print(f"❌ mmap backend failed: {e}")
+        errors.append("mmap_backend")
+    finally:
+        ninolex_gh.set_backend("json")
+    
+    print()
+    
+    # Test 17: packaged phonemes pass the IPA validation engine
+    try:
+        from ninolex_gh.ipa import validate_entries, validate_phoneme
+        report = validate_entries(
+            (ninolex_gh.lookup(w) for w in ninolex_gh.list_graphemes()), jobs=1
+        )
+        if not report["errors"] and validate_phoneme("'akra") == {"'"}:
+            print(f"✅ ninolex_gh.ipa validated {report['entries']} phonemes")
+        else:
+            print(f"❌ ninolex_gh.ipa reported errors: {report['errors'][:3]}")
+            errors.append("ipa")
+    except Exception as e:
+        print(f"❌ ninolex_gh.ipa failed: {e}")
+        errors.append("ipa")
+    
+    print()
+    
+    # Test 18: opt-in metrics count hits and misses
+    try:
+        ninolex_gh.enable_metrics()
+        ninolex_gh.lookup("Accra")
+        ninolex_gh.lookup("Kotoko", include_aliases=True)
+        ninolex_gh.lookup("NotARealWord123", default=None)
+        ninolex_gh.lookup_many(["Kotoko", "Kotoko", "Accra"], include_aliases=True)
+        snapshot = ninolex_gh.stats()
+        ninolex_gh.reset_stats()
+        ninolex_gh.lookup_many(["Foo"] * 100 + ["Bar"])
+        ninolex_gh.lookup("Bar", default=None)
+        ninolex_gh.lookup("Bar", default=None)
+        repeated = ninolex_gh.stats()
+        ninolex_gh.enable_metrics(False)
+        if (
+            (snapshot["hits"], snapshot["alias_hits"], snapshot["misses"]) == (5, 3, 1)
+            and snapshot["top_misses"][0]["key"] == "notarealword123"
+            and snapshot["lookup_latency"]["count"] == 3
+            and snapshot["batch_latency"]["count"] == 1
+            and repeated["misses"] == 103
+            and [(m["key"], m["count"]) for m in repeated["top_misses"]] == [("foo", 100), ("bar", 3)]
+            and ninolex_gh.stats() == {"enabled": False}
+        ):
+            print("✅ stats() counted 5 hits (3 alias) and 1 miss, batches separately")
+        else:
+            print(f"❌ stats() returned unexpected counts: {snapshot} / {repeated}")
+            errors.append("stats")
+    except Exception as e:
+        print(f"❌ stats() failed: {e}")
+        errors.append("stats")
+    
+    print()
+    
+    # Test 19: preload() loads once, even from concurrent threads
+    try:
+        import threading
+        from ninolex_gh import core
+        core._reset_caches()
+        counts = []
+        threads = [
+            threading.Thread(target=lambda: counts.append(ninolex_gh.preload(indexes=True)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if set(counts) == {ninolex_gh.get_entry_count()} and core._TRIE is not None:
+            print(f"✅ preload() from 8 threads loaded {counts[0]} entries")
+        else:
+            print(f"❌ preload() returned {counts}")
+            errors.append("preload")
+    except Exception as e:
+        print(f"❌ preload() failed: {e}")
+        errors.append("preload")
+    
+    print()
+    
+    # Test 20: Lexicon overlays override and extend the bundled data
+    try:
+        import os
+        import tempfile
+        from pathlib import Path
+        with tempfile.TemporaryDirectory() as tmp:
+            overlay = Path(tmp) / "tenant.csv"
+            overlay.write_text("grapheme,phoneme,alias\nAccra,ˈak.ra,\nAcmefon,ˈak.mɪ.fɔn,Acme\n",
+                               encoding="utf-8")
+            tenant = ninolex_gh.Lexicon([overlay], reload_interval=None)
+            before = (
+                tenant.lookup("Accra")["phoneme"],
+                tenant.lookup("Acme", include_aliases=True)["grapheme"],
+            )
+            replacement = Path(tmp) / "tenant.tmp"
+            replacement.write_text("grapheme,phoneme\nAcmefon,ˈak.mi.fɔn\n", encoding="utf-8")
+            os.replace(replacement, overlay)
+            os.utime(overlay, ns=(1, 1))
+            reloaded = tenant.reload()
+            after = (tenant.lookup("Accra")["phoneme"], tenant.lookup("Acmefon")["phoneme"])
+            loose = (
+                tenant.lookup("Acme-fon", match="punctuation")["grapheme"],
+                tenant.lookup("JB Danquah", match="punctuation")["grapheme"],
+                tenant.lookup("Kpodo", fallback="g2p")["domain"],
+                tenant.lookup_many(["acmefon", "Kpodo"], return_stats=True)[1]["hits"],
+            )
+        expected_accra = ninolex_gh.lookup("Accra")["phoneme"]
+        if (
+            before == ("ˈak.ra", "Acmefon")
+            and reloaded
+            and after == (expected_accra, "ˈak.mi.fɔn")
+            and loose == ("Acmefon", "J. B. Danquah", "g2p", 1)
+        ):
+            print("✅ Lexicon overlay overrides, extends and reloads")
+        else:
+            print(f"❌ Lexicon overlay returned {before}, {reloaded}, {after}, {loose}")
+            errors.append("lexicon")
+    except Exception as e:
+        print(f"❌ Lexicon failed: {e}")
+        errors.append("lexicon")
+    
+    print()
+    
+    # Test 21: the on-disk index cache round-trips the loaded data
+    try:
+        import tempfile
+        from pathlib import Path
+        from ninolex_gh import core
+        with tempfile.TemporaryDirectory() as tmp:
+            ninolex_gh.set_cache_dir(tmp)
+            try:
+                expected = ninolex_gh.lookup("Accra")
+                files = list(Path(tmp).glob("index-*.pickle"))
+                core._reset_caches()
+                cached = ninolex_gh.lookup("Accra")
+                alias = ninolex_gh.lookup("Kotoko", include_aliases=True)["grapheme"]
+            finally:
+                ninolex_gh.set_cache_dir(None)
+        if len(files) == 1 and cached == expected and alias == "Asante Kotoko":
+            print(f"✅ Index cache written and reloaded ({files[0].name[:20]}...)")
+        else:
+            print(f"❌ Index cache returned {files}, {cached}, {alias}")
+            errors.append("index_cache")
+    except Exception as e:
+        print(f"❌ Index cache failed: {e}")
+        errors.append("index_cache")
+    
+    print()
+    
+    # Test 22: domain shards match the packaged dictionary and load alone
+    try:
+        full = [entry["grapheme"] for entry in ninolex_gh.core._load_data().values()]
+        sharded = []
+        for domain in ninolex_gh.list_domains():
+            ninolex_gh.load(domains=[domain])
+            sharded.extend(ninolex_gh.list_graphemes())
+        places = ninolex_gh.load(domains=["places"])
+        only_places = ninolex_gh.lookup("Kwame Nkrumah", default=None) is None
+        ninolex_gh.load()
+        if sharded == full and places and only_places:
+            print(f"✅ {len(ninolex_gh.list_domains())} domain shards match the packaged dictionary")
+        else:
+            print("❌ Domain shards are out of sync; run build/generate_domain_shards.py")
+            errors.append("domain_shards")
+    except Exception as e:
+        print(f"❌ Domain shards failed: {e}")
+        errors.append("domain_shards")
+    
+    print()
+    
+    # Test 23: looser matching levels fall back to folded-key indexes
+    try:
+        danquah = ninolex_gh.lookup("JB Danquah", match="punctuation")
+        presec = ninolex_gh.lookup("Presbyterian Boys Secondary School", match="punctuation")
+        spaced = ninolex_gh.lookup("St.  Louis Senior High School", match="whitespace")
+        exact_miss = ninolex_gh.lookup("JB Danquah", default=None) is None
+        if (
+            danquah["grapheme"] == "J. B. Danquah"
+            and presec["grapheme"] == "Presbyterian Boys' Secondary School"
+            and spaced["grapheme"] == "St. Louis Senior High School"
+            and ninolex_gh.core._fold_key("ɖɔŋɛ", "diacritics") == "donge"
+            and exact_miss
+        ):
+            print("✅ Whitespace, punctuation and diacritic matching levels work")
+        else:
+            print("❌ Looser matching levels returned unexpected entries")
+            errors.append("match_levels")
+    except Exception as e:
+        print(f"❌ Matching levels failed: {e}")
+        errors.append("match_levels")
+    
+    print()
+    
+    # Test 24: G2P fallback guesses valid IPA for names not in the dictionary
+    try:
+        from ninolex_gh.ipa import check_tiebar_labial_velars, validate_phoneme
+
+        guessed = ninolex_gh.lookup("Kpodo Dzifanu", fallback="g2p")
+        names = ninolex_gh.list_graphemes() + ["Ŋmɛnɛ Ɖɔmɛ", "Nyaho Tamakloe", "Ãgbã"]
+        invalid = [
+            name for name in names
+            if validate_phoneme(ninolex_gh.guess(name))
+            or check_tiebar_labial_velars(ninolex_gh.guess(name))
+        ]
+        if (
+            guessed["domain"] == "g2p"
+            and guessed["phoneme"] == "ˈk͡podo dʒiˈfanu"
+            and ninolex_gh.guess("Nkrumah") == "ŋˈkruma"
+            and ninolex_gh.lookup("Kpodo", default=None) is None
+            and not invalid
+        ):
+            print(f"✅ G2P fallback produced valid IPA for {len(names)} names")
+        else:
+            print(f"❌ G2P fallback produced unexpected or invalid IPA: {invalid[:5]}")
+            errors.append("g2p")
+    except Exception as e:
+        print(f"❌ G2P fallback failed: {e}")
+        errors.append("g2p")
+
+    print()
+    
+    # Test 25: annotate() does not match across sentence boundaries
+    try:
+        split = [m.text for m in ninolex_gh.annotate("He flew to Kumasi. Central bank officials met.")]
+        joined = [m.text for m in ninolex_gh.annotate("Kumasi Central and J. B. Danquah")]
+        if split == ["Kumasi"] and joined == ["Kumasi Central", "J. B. Danquah"]:
+            print(f"✅ annotate() stopped at the sentence boundary: {split}")
+        else:
+            print(f"❌ annotate() matched across punctuation: {split} / {joined}")
+            errors.append("annotate_boundaries")
+    except Exception as e:
+        print(f"❌ annotate() boundary check failed: {e}")
+        errors.append("annotate_boundaries")
+    
+    print()
+    
+    # Test 26: iter_ssml() keeps chunks bounded even without matches
+    try:
+        from ninolex_gh.ssml import iter_ssml
+        text = "no entities here " * 6000
+        chunks = list(iter_ssml(text, chunk_size=4096))
+        if max(map(len, chunks)) <= 4096 and "".join(chunks) == ninolex_gh.to_ssml(text):
+            print(f"✅ iter_ssml() streamed {len(text)} chars in {len(chunks)} bounded chunks")
+        else:
+            print(f"❌ iter_ssml() yielded a {max(map(len, chunks))}-char chunk")
+            errors.append("iter_ssml_chunks")
+    except Exception as e:
+        print(f"❌ iter_ssml() chunking failed: {e}")
+        errors.append("iter_ssml_chunks")
+    
+    print()
+    
+    # Test 27: HTTP service answers lookups and SSML over one keep-alive connection
+    try:
+        import asyncio
+        import json
+        from ninolex_gh.serve import LexiconServer
+
+        async def exchange():
+            server = LexiconServer(port=0)
+            await server.start()
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+
+            async def request(method, target, body=b"", content_type="application/json",
+                              connection="keep-alive"):
+                writer.write(
+                    f"{method} {target} HTTP/1.1\r\nHost: localhost\r\nConnection: {connection}\r\n"
+                    f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n\r\n"
+                    .encode("latin-1") + body
+                )
+                status = int((await reader.readline()).split()[1])
+                length = 0
+                while True:
+                    line = await reader.readline()
+                    if line == b"\r\n":
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value)
+                return status, await reader.readexactly(length)
+
+            try:
+                responses = [
+                    await request("GET", "/lookup?word=Kotoko&aliases=1"),
+                    await request("POST", "/lookup", json.dumps({"words": ["Accra", "Nowhere123"]}).encode()),
+                    await request("POST", "/ssml", "Flights to Accra".encode(), "text/plain"),
+                    await request("POST", "/lookup", b"not json"),
+                    await request("GET", "/nowhere", connection="close"),
+                ]
+                closed = await reader.read() == b""
+            finally:
+                writer.close()
+                server.close()
+            return responses, closed, server.requests
+
+        responses, closed, served = asyncio.run(exchange())
+        statuses = [status for status, _ in responses]
+        entry = json.loads(responses[0][1])["entry"]
+        results = json.loads(responses[1][1])["results"]
+        if (
+            statuses == [200, 200, 200, 400, 404]
+            and entry["grapheme"] == "Asante Kotoko"
+            and results[0]["grapheme"] == "Accra" and results[1] is None
+            and b"<phoneme" in responses[2][1]
+            and closed and served == 5
+        ):
+            print("✅ LexiconServer answered 5 requests on one keep-alive connection")
+        else:
+            print(f"❌ LexiconServer returned {statuses}")
+            errors.append("serve")
+    except Exception as e:
+        print(f"❌ LexiconServer failed: {e}")
+        errors.append("serve")
+    
+    print()
+    
     # Summary
     print("=" * 60)
     if errors: